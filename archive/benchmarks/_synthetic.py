@@ -0,0 +1,103 @@
+"""Synthetic vaults and timing helpers shared by the benchmark scripts."""
+
+import random
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable
+
+from pm.core.domain import Domain, DomainStatus
+from pm.core.vault import Vault
+from pm.data.domains import DOMAINS
+from pm.data.templates import DAILY_LOG_TEMPLATE
+
+
+def build_vault(root: Path, num_logs: int = 5000) -> Vault:
+    """Create an initialized vault with `num_logs` daily logs.
+
+    Logs are spread one per day backwards from today, cycling through
+    the domain taxonomy.
+
+    Args:
+        root: Directory to create the vault in.
+        num_logs: Number of daily log files to write.
+
+    Returns:
+        Vault for the synthetic tree.
+    """
+    vault = Vault(root, use_supabase=False)
+    vault.create_structure()
+    vault.create_domain_files()
+    vault.create_system_files()
+
+    today = date.today()
+    for i in range(num_logs):
+        domain = DOMAINS[i % len(DOMAINS)]
+        log_date = today - timedelta(days=i)
+        content = DAILY_LOG_TEMPLATE.format(
+            date=log_date.isoformat(),
+            domain_name=domain["domain_name"],
+            domain_id=domain["domain_id"],
+            book_title=f"Synthetic Book {i}",
+            function_slot="FND",
+            phase="hub-completion",
+            branch_folder="00-Synthetic",
+            domain_file=f"{domain['domain_id']}.md",
+        )
+        (vault.daily_logs_dir / f"{log_date.isoformat()}.md").write_text(content)
+
+    return vault
+
+
+def build_domains(num_domains: int, seed: int = 0) -> list[Domain]:
+    """Create a synthetic taxonomy of `num_domains` domains with random progress.
+
+    Domains are spread evenly over the 15 branches (IDs like "07.0123");
+    about a third have books read and a few are expert.
+
+    Args:
+        num_domains: Number of domains to create.
+        seed: Random seed, for reproducible taxonomies.
+
+    Returns:
+        Domains in shuffled order.
+    """
+    rng = random.Random(seed)
+    statuses = list(DomainStatus)
+    domains = []
+    for i in range(num_domains):
+        branch = i % 15 + 1
+        read = rng.random() < 0.3
+        domains.append(Domain(
+            domain_id=f"{branch:02d}.{i // 15:04d}",
+            domain_name=f"Synthetic Domain {i}",
+            branch_id=f"{branch:02d}",
+            branch_name=f"Branch {branch}",
+            status=rng.choice(statuses[1:]) if read else DomainStatus.UNTOUCHED,
+            is_hub=rng.random() < 0.04,
+            is_expert=rng.random() < 0.01,
+            books_read=rng.randint(1, 6) if read else 0,
+        ))
+    rng.shuffle(domains)
+    return domains
+
+
+def best_time(fn: Callable[[], object], repeat: int) -> float:
+    """Best wall time of `fn` over `repeat` runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def best_steps(fn: Callable[[], dict[str, float]], repeat: int) -> dict[str, float]:
+    """Best time of each step over `repeat` runs of `fn`.
+
+    Args:
+        fn: Runs once and returns seconds per named step.
+        repeat: Number of runs.
+    """
+    runs = [fn() for _ in range(repeat)]
+    return {step: min(run[step] for run in runs) for step in runs[0]}
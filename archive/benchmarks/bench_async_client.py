@@ -0,0 +1,57 @@
+"""Benchmark: independent Supabase reads run one after another vs gathered.
+
+Runs against the in-memory stand-in server with an artificial per-request
+delay, so the numbers reflect round trips rather than query work. Caching
+is off; every read is a request.
+
+Usage:
+    python benchmarks/bench_async_client.py [--latency 0.05] [--repeat 5]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# The stand-in server lives with the tests, which aren't an installed package
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from _synthetic import best_time  # noqa: E402
+
+from pm.core.async_client import run_concurrently  # noqa: E402
+from pm.core.supabase_client import SupabaseClient  # noqa: E402
+from tests.fake_supabase import FakeSupabase  # noqa: E402
+
+# The reads `pm status`-style dashboards need; none depends on another
+CALLS = {
+    "domains": ("get_all_domains",),
+    "stats": ("get_stats",),
+    "logs": ("get_daily_logs", 30),
+    "books": ("get_books",),
+    "config": ("get_config",),
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds per request.")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    server = FakeSupabase({"config": [{"id": 1}]})
+    server.latency = args.latency
+    client = SupabaseClient(client=server, use_cache=False)
+
+    def sequential():
+        return {key: getattr(client, method)(*a) for key, (method, *a) in CALLS.items()}
+
+    before = best_time(sequential, args.repeat)
+    after = best_time(lambda: run_concurrently(client, **CALLS), args.repeat)
+
+    print(f"reads:               {len(CALLS)} x {args.latency * 1000:.0f} ms")
+    print(f"before (sequential): {before * 1000:8.2f} ms")
+    print(f"after (gather):      {after * 1000:8.2f} ms")
+    print(f"speedup:             {before / after:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
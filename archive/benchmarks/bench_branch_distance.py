@@ -0,0 +1,69 @@
+"""Benchmark: branch distance lookups, dict probes vs the flat matrix.
+
+Times every ordered pair of the 180 domains' branches (32,400 lookups),
+the access pattern of the traversal engine's nested loops:
+
+- "before": the previous get_branch_distance (zfill both IDs, then up to
+  two probes of the upper-triangle dict)
+- "wrapper": get_branch_distance on the flat matrix
+- "index": index_distance with branch indices resolved once up front
+
+Usage:
+    python benchmarks/bench_branch_distance.py [--repeat 20]
+"""
+
+import argparse
+
+from _synthetic import best_time
+
+from pm.data.distances import (
+    _BRANCH_DISTANCES_RAW,
+    branch_index,
+    get_branch_distance,
+    index_distance,
+)
+from pm.data.domains import DOMAINS
+
+
+def _legacy_branch_distance(branch_a: str, branch_b: str) -> int:
+    """get_branch_distance as it was before the flat matrix."""
+    a = str(branch_a).zfill(2)
+    b = str(branch_b).zfill(2)
+    if (a, b) in _BRANCH_DISTANCES_RAW:
+        return _BRANCH_DISTANCES_RAW[(a, b)]
+    if (b, a) in _BRANCH_DISTANCES_RAW:
+        return _BRANCH_DISTANCES_RAW[(b, a)]
+    return 4
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    branches = [d["domain_id"].split(".")[0] for d in DOMAINS]
+    indices = [branch_index(b) for b in branches]
+
+    def legacy():
+        return [_legacy_branch_distance(a, b) for a in branches for b in branches]
+
+    def wrapper():
+        return [get_branch_distance(a, b) for a in branches for b in branches]
+
+    def by_index():
+        return [index_distance(i, j) for i in indices for j in indices]
+
+    assert legacy() == wrapper() == by_index()
+
+    before = best_time(legacy, args.repeat)
+    after_wrapper = best_time(wrapper, args.repeat)
+    after_index = best_time(by_index, args.repeat)
+
+    print(f"lookups:           {len(branches) ** 2}")
+    print(f"before (dict):     {before * 1000:8.2f} ms")
+    print(f"after (wrapper):   {after_wrapper * 1000:8.2f} ms  ({before / after_wrapper:.2f}x)")
+    print(f"after (index):     {after_index * 1000:8.2f} ms  ({before / after_index:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Benchmark: distant-domain scoring, per-pair loop vs batched columns.
+
+"Before" is the previous TraversalEngine._find_distant_domain: for every
+domain, a get_branch_distance call per strength branch and a list
+membership test for the cooldown. "After" reduces the branch matrix to
+one nearest-strength distance per branch and gathers it per domain
+(columns built per call, and reused across calls). Every run checks both
+pick the same domain.
+
+Usage:
+    python benchmarks/bench_distant_scoring.py [--sizes 180 1000 10000 50000] [--repeat 5]
+"""
+
+import argparse
+
+from _synthetic import best_time, build_domains
+
+from pm.config import TraversalConfig
+from pm.core.domain import DomainStatus
+from pm.core.traversal import DomainArrays, TraversalEngine
+from pm.data.distances import get_branch_distance
+
+
+def _legacy_find_distant(engine: TraversalEngine, domains: list, recent_domain_ids: list):
+    """TraversalEngine._find_distant_domain as it was before batching."""
+    strength_branches = set()
+    for d in domains:
+        if d.is_expert or d.books_read >= 2:
+            strength_branches.add(d.branch_id)
+    if not strength_branches:
+        strength_branches = {"07"}
+
+    candidates = []
+    for d in domains:
+        if d.domain_id in recent_domain_ids:
+            continue
+        min_distance = min(get_branch_distance(d.branch_id, sb) for sb in strength_branches)
+        if min_distance >= engine.min_distant_distance:
+            bonus = 1 if d.status == DomainStatus.UNTOUCHED else 0
+            candidates.append((d, min_distance, bonus))
+    if not candidates:
+        return None
+    candidates.sort(key=lambda x: (-x[1], -x[2], x[0].domain_id))
+    return candidates[0][0]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[180, 1000, 10000, 50000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = TraversalEngine(TraversalConfig(bisociation_min_distance=2))
+    print(f"{'domains':>8} {'before':>11} {'after':>11} {'reused':>11} {'speedup':>8}")
+    for size in args.sizes:
+        domains = build_domains(size)
+        # A two-week cooldown window, as the recommendation commands pass it
+        recent = [d.domain_id for d in domains[:14]]
+        arrays = DomainArrays.from_domains(domains)
+
+        expected = _legacy_find_distant(engine, domains, recent)
+        got = engine._find_distant_domain(domains, recent)
+        assert (got and got.domain) is expected
+
+        before = best_time(lambda: _legacy_find_distant(engine, domains, recent), args.repeat)
+        after = best_time(lambda: engine._find_distant_domain(domains, recent), args.repeat)
+        reused = best_time(
+            lambda: engine._find_distant_domain(domains, recent, arrays), args.repeat
+        )
+        print(
+            f"{size:>8} {before * 1000:9.2f}ms {after * 1000:9.2f}ms "
+            f"{reused * 1000:9.2f}ms {before / reused:7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
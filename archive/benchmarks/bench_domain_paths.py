@@ -0,0 +1,75 @@
+"""Benchmark: `load_all_domains` with per-call path lookups vs the path table.
+
+"Before" swaps in the previous `Vault.domain_filepath` (a linear scan over
+DOMAINS plus a loop over BRANCHES per call); "after" uses the precomputed
+table. Both run against a warm index, so the difference is path building.
+
+Usage:
+    python benchmarks/bench_domain_paths.py [--repeat 200]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from _synthetic import build_vault
+
+from pm.core.vault import Vault
+from pm.data.domains import BRANCHES, DOMAINS
+
+
+def _legacy_domain_filepath(self: Vault, domain_id: str) -> Path:
+    """Vault.domain_filepath as it was before the path table."""
+    branch_id = domain_id.split(".")[0].zfill(2)
+    domain_data = next((d for d in DOMAINS if d["domain_id"] == domain_id), None)
+    if domain_data:
+        name = domain_data["domain_name"].replace(" ", "-").replace("/", "-")
+        filename = f"{domain_id}-{name}.md"
+    else:
+        filename = f"{domain_id}.md"
+    for b in BRANCHES:
+        if b["branch_id"] == int(branch_id):
+            return self.domains_dir / f"{branch_id}-{b['branch_name'].replace(' ', '-')}" / filename
+    return self.domains_dir / f"{branch_id}-Unknown" / filename
+
+
+def _time_loads(vault: Vault, repeat: int) -> float:
+    """Best wall time of `load_all_domains` with the snapshot dropped each run."""
+    best = float("inf")
+    for _ in range(repeat):
+        vault.invalidate()
+        start = time.perf_counter()
+        vault.load_all_domains()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        vault = build_vault(Path(tmpdir) / "vault", num_logs=0)
+        vault.load_all_domains()  # warm the index
+
+        for d in DOMAINS:
+            legacy = _legacy_domain_filepath(vault, d["domain_id"])
+            assert legacy == vault.domain_filepath(d["domain_id"])
+
+        after = _time_loads(vault, args.repeat)
+        Vault.domain_filepath, table_lookup = _legacy_domain_filepath, Vault.domain_filepath
+        try:
+            before = _time_loads(vault, args.repeat)
+        finally:
+            Vault.domain_filepath = table_lookup
+
+    print(f"domains:        {len(DOMAINS)}")
+    print(f"before (scan):  {before * 1000:8.2f} ms")
+    print(f"after (table):  {after * 1000:8.2f} ms")
+    print(f"speedup:        {before / after:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Benchmark: full `frontmatter.load` vs the header-only reader.
+
+Builds a synthetic vault (180 domain profiles + 5k daily logs) and times
+parsing the metadata of every note with each loader.
+
+Usage:
+    python benchmarks/bench_frontmatter.py [--logs 5000] [--repeat 3]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import frontmatter
+from _synthetic import build_vault
+
+from pm.core.frontmatter_reader import read_frontmatter
+
+
+def _time(loader, paths, repeat: int) -> float:
+    """Best-of-N wall time to load every path."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for path in paths:
+            loader(path)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logs", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        vault = build_vault(Path(tmpdir) / "vault", num_logs=args.logs)
+        paths = sorted(vault.domains_dir.rglob("*.md")) + sorted(vault.daily_logs_dir.glob("*.md"))
+
+        # Both loaders must agree before timing them
+        for path in paths[:: max(1, len(paths) // 50)]:
+            assert read_frontmatter(path) == frontmatter.load(path).metadata, path
+
+        full = _time(lambda p: frontmatter.load(p).metadata, paths, args.repeat)
+        header = _time(read_frontmatter, paths, args.repeat)
+
+    print(f"files:             {len(paths)}")
+    print(f"frontmatter.load:  {full * 1000:8.1f} ms")
+    print(f"read_frontmatter:  {header * 1000:8.1f} ms")
+    print(f"speedup:           {full / header:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Benchmark: cold-index log loading, serial vs a parsing pool.
+
+Builds a synthetic vault (180 domain profiles + 50k daily logs), then for
+each worker count drops the sidecar index and times loading every log with
+`Vault.iter_logs`. Results are checked against the serial load.
+
+Usage:
+    python benchmarks/bench_parallel_load.py [--logs 50000] [--workers 1 2 4 8] [--threads]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from _synthetic import build_vault
+
+from pm.core.index import INDEX_FILENAME
+from pm.core.vault import Vault
+
+
+def _cold_load(root: Path, workers: int, use_processes: bool) -> tuple[float, list]:
+    """Load every log with an empty index and return (seconds, logs)."""
+    index_path = root / "00-System" / INDEX_FILENAME
+    if index_path.exists():
+        index_path.unlink()
+
+    vault = Vault(root, use_supabase=False, workers=workers, use_processes=use_processes)
+    start = time.perf_counter()
+    logs = list(vault.iter_logs())
+    elapsed = time.perf_counter() - start
+    vault.index.close()
+    return elapsed, logs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logs", type=int, default=50000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--threads", action="store_true", help="use a thread pool")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir) / "vault"
+        build_vault(root, num_logs=args.logs)
+
+        baseline, expected = _cold_load(root, 1, use_processes=True)
+        print(f"files:      {args.logs}  (cpus: {os.cpu_count()})")
+        print(f"workers  1: {baseline * 1000:8.1f} ms")
+
+        for workers in args.workers:
+            if workers <= 1:
+                continue
+            elapsed, logs = _cold_load(root, workers, use_processes=not args.threads)
+            assert logs == expected, f"workers={workers} changed the result"
+            print(f"workers {workers:2d}: {elapsed * 1000:8.1f} ms  ({baseline / elapsed:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
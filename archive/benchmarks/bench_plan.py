@@ -0,0 +1,78 @@
+"""Benchmark: reading plans, reloading state per day vs incremental updates.
+
+"Before" plans the way repeated pm-next runs would: each day the domain
+list is reloaded (copied from the vault snapshot with all reads so far
+applied) and the cooldown window rebuilt from the read history, then
+recommend_next is called. "After" is plan_reading, which keeps one
+in-memory copy and updates only the read domain and the window. Both
+move on to bisociation once every hub is complete, and every run checks
+they produce the same plan. "reads" is the number of days with a
+recommendation.
+
+Usage:
+    python benchmarks/bench_plan.py [--days 365] [--sizes 180 1000] [--repeat 3]
+"""
+
+import argparse
+import copy
+from dataclasses import replace
+from datetime import date, timedelta
+
+from _synthetic import best_time, build_domains
+
+from pm.config import TraversalConfig
+from pm.core.planner import plan_reading
+from pm.core.traversal import TraversalEngine, TraversalPhase
+
+
+def _reload_plan(engine: TraversalEngine, domains: list, start: date, days: int) -> list:
+    """Plan by rebuilding the domain state and cooldown window every day."""
+    engine = copy.copy(engine)
+    reads: list[tuple[date, str]] = []
+    plan = []
+    for offset in range(days):
+        today = start + timedelta(days=offset)
+        state = {d.domain_id: replace(d) for d in domains}
+        for read_on, domain_id in reads:
+            state[domain_id].record_session(read_on)
+        cutoff = today - timedelta(days=engine.cooldown_days)
+        recent = [domain_id for read_on, domain_id in reads if read_on >= cutoff]
+        if engine.check_hub_completion(state.values()):
+            engine.set_phase(TraversalPhase.BISOCIATION)
+
+        rec = engine.recommend_next(list(state.values()), recent, today.weekday())
+        if rec is not None:
+            reads.append((today, rec.domain.domain_id))
+            plan.append((today, rec.domain.domain_id))
+    return plan
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[180, 1000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    engine = TraversalEngine(TraversalConfig())
+    start = date(2026, 1, 5)
+    print(f"{'domains':>8} {'reads':>6} {'before':>11} {'after':>11} {'speedup':>8}")
+    for size in args.sizes:
+        domains = build_domains(size)
+
+        def incremental():
+            return plan_reading(engine, domains, [], start, args.days)
+
+        expected = _reload_plan(engine, domains, start, args.days)
+        assert [(p.read_on, p.domain_id) for p in incremental()] == expected
+
+        before = best_time(lambda: _reload_plan(engine, domains, start, args.days), args.repeat)
+        after = best_time(incremental, args.repeat)
+        print(
+            f"{size:>8} {len(expected):>6} {before * 1000:9.2f}ms "
+            f"{after * 1000:9.2f}ms {before / after:7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Benchmark: import time of the CLI and of data-only commands.
+
+Runs each import in a fresh interpreter under -X importtime and reports
+the cumulative time of the module itself. click and rich are imported
+first for the command modules, so their numbers are what pm adds on top.
+
+Usage:
+    python benchmarks/bench_startup.py [--repeat 5]
+"""
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+# module -> code run before importing it
+TARGETS = {
+    "pm.cli": "",
+    "pm.commands.distance": "import click, rich.console, rich.panel, rich.table; ",
+    "pm.commands.connections": "import click, rich.console, rich.panel, rich.table; ",
+}
+
+
+def _import_us(module: str, preload: str) -> int:
+    """Cumulative import time of `module` in microseconds, in a fresh process."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"{preload}import {module}"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if name.strip() == module:
+            return int(cumulative)
+    raise RuntimeError(f"{module} was not imported")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for module, preload in TARGETS.items():
+        best = min(_import_us(module, preload) for _ in range(args.repeat))
+        print(f"{module:26} {best / 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
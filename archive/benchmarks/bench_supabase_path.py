@@ -0,0 +1,110 @@
+"""Benchmark: vault writes and reads, files only vs the Supabase path.
+
+The Supabase path runs against the local SQLite backend (PM_BACKEND), so
+the numbers cover the dual-write code (outbox, replay, client, queries)
+without network latency. Outbox replays run inline so their cost is
+counted.
+
+Usage:
+    python benchmarks/bench_supabase_path.py [--logs 2000] [--repeat 3]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+from _synthetic import best_steps, build_vault
+
+from pm.core.daily_log import DailyLog
+from pm.core.domain import DomainStatus
+from pm.core.supabase_client import reset_supabase_client
+from pm.core.vault import Vault
+from pm.data.domains import DOMAINS
+
+
+def _logs(count: int) -> list[tuple[DailyLog, str]]:
+    """Build `count` daily logs on consecutive days."""
+    start = date(2020, 1, 1)
+    return [
+        (
+            DailyLog(
+                log_date=start + timedelta(days=i),
+                domain_id=DOMAINS[i % len(DOMAINS)]["domain_id"],
+                domain_name=DOMAINS[i % len(DOMAINS)]["domain_name"],
+                book_title=f"Synthetic Book {i}",
+                function_slot="FND",
+                pages_read=20,
+            ),
+            f"Notes {i}",
+        )
+        for i in range(count)
+    ]
+
+
+def _run(root: Path, num_logs: int, use_supabase: bool) -> dict[str, float]:
+    """Time a round of writes and reads, returning seconds per step."""
+    vault = Vault(root, use_supabase=use_supabase, replay_in_background=False)
+    assert vault.using_supabase == use_supabase
+    timings = {}
+
+    start = time.perf_counter()
+    domains = [vault.load_domain(d["domain_id"]) for d in DOMAINS]
+    timings["load 180 domains"] = time.perf_counter() - start
+
+    for domain in domains:
+        domain.status = DomainStatus.SURVEYING
+        domain.books_read += 1
+    start = time.perf_counter()
+    vault.save_domains(domains)
+    timings["save 180 domains"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    vault.save_daily_logs(_logs(num_logs))
+    timings[f"save {num_logs} logs"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    vault.load_all_domains()
+    timings["load_all_domains"] = time.perf_counter() - start
+    return timings
+
+
+def _files_run(tmpdir: str, num_logs: int) -> dict[str, float]:
+    """Time one round on a fresh files-only vault."""
+    root = Path(tempfile.mkdtemp(dir=tmpdir))
+    build_vault(root, num_logs=0)
+    return _run(root, num_logs, use_supabase=False)
+
+
+def _sqlite_run(tmpdir: str, num_logs: int) -> dict[str, float]:
+    """Time one round on a fresh vault backed by a fresh SQLite database."""
+    root = Path(tempfile.mkdtemp(dir=tmpdir))
+    build_vault(root, num_logs=0)
+    os.environ["PM_BACKEND"] = f"sqlite:{root.with_suffix('.db')}"
+    reset_supabase_client()
+    try:
+        return _run(root, num_logs, use_supabase=True)
+    finally:
+        del os.environ["PM_BACKEND"]
+        reset_supabase_client()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logs", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        files = best_steps(lambda: _files_run(tmpdir, args.logs), args.repeat)
+        db = best_steps(lambda: _sqlite_run(tmpdir, args.logs), args.repeat)
+
+    print(f"{'step':<20} {'files':>10} {'supabase':>10}")
+    for step in files:
+        print(f"{step:<20} {files[step] * 1000:8.1f}ms {db[step] * 1000:8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
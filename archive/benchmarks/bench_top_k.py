@@ -0,0 +1,77 @@
+"""Benchmark: ranked recommendation slates, full sorts vs heap selection.
+
+"Before" builds a slate the way recommend_next picks one: every candidate
+list (incomplete hubs, then distant domains) fully sorted, concatenated
+and cut at k. "After" is TraversalEngine.recommend_top_k, which keys each
+candidate once and keeps the k best with a heap (columns reused across
+calls). Every run checks both return the same domains.
+
+Usage:
+    python benchmarks/bench_top_k.py [--sizes 180 10000 50000] [--k 10] [--repeat 5]
+"""
+
+import argparse
+
+from _synthetic import best_time, build_domains
+
+from pm.config import TraversalConfig
+from pm.core.domain import DomainStatus
+from pm.core.traversal import DomainArrays, TraversalEngine
+from pm.data.distances import get_branch_distance
+
+
+def _sorted_slate(engine: TraversalEngine, domains: list, recent_domain_ids: list, k: int) -> list:
+    """Top k hub-completion domains by sorting every candidate list."""
+    recent = set(recent_domain_ids)
+    hubs = [
+        d for d in domains
+        if d.is_hub and d.domain_id not in recent and d.books_read < engine.books_per_hub
+    ]
+    hubs.sort(key=lambda d: (-d.books_read, d.domain_id))
+
+    strength = {d.branch_id for d in domains if d.is_expert or d.books_read >= 2} or {"07"}
+    distant = []
+    for d in domains:
+        if d.domain_id in recent:
+            continue
+        distance = min(get_branch_distance(d.branch_id, sb) for sb in strength)
+        if distance >= engine.min_distant_distance:
+            distant.append((-distance, d.status != DomainStatus.UNTOUCHED, d.domain_id, d))
+    distant.sort(key=lambda x: x[:3])
+
+    slate = []
+    seen = set()
+    for d in hubs + [x[3] for x in distant]:
+        if d.domain_id not in seen:
+            seen.add(d.domain_id)
+            slate.append(d)
+    return slate[:k]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[180, 10000, 50000])
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = TraversalEngine(TraversalConfig(bisociation_min_distance=2))
+    print(f"{'domains':>8} {'before':>11} {'after':>11} {'speedup':>8}")
+    for size in args.sizes:
+        domains = build_domains(size)
+        recent = [d.domain_id for d in domains[:14]]
+        arrays = DomainArrays.from_domains(domains)
+
+        def top_k():
+            return engine.recommend_top_k(domains, recent, k=args.k, arrays=arrays)
+
+        expected = [d.domain_id for d in _sorted_slate(engine, domains, recent, args.k)]
+        assert [r.domain.domain_id for r in top_k()] == expected
+
+        before = best_time(lambda: _sorted_slate(engine, domains, recent, args.k), args.repeat)
+        after = best_time(top_k, args.repeat)
+        print(f"{size:>8} {before * 1000:9.2f}ms {after * 1000:9.2f}ms {before / after:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
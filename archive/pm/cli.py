@@ -1,12 +1,48 @@
 """Main CLI entry point for Polymath Engine."""
 
+import importlib
+
 import click
 
 from pm import __version__
 from pm.config import Config
 
 
-@click.group()
+# Subcommand name -> "module:attribute"; imported only when invoked, so a
+# command doesn't pay for the others' dependencies at startup.
+COMMANDS = {
+    "init": "pm.commands.init:init",
+    "status": "pm.commands.status:status",
+    "next": "pm.commands.next_cmd:next_cmd",
+    "pair": "pm.commands.pair:pair",
+    "log": "pm.commands.log:log",
+    "gaps": "pm.commands.gaps:gaps",
+    "distance": "pm.commands.distance:distance",
+    "connections": "pm.commands.connections:connections",
+    "import": "pm.commands.import_cmd:import_sessions",
+    "sync": "pm.commands.sync:sync",
+    "plan": "pm.commands.plan:plan",
+}
+
+
+class LazyGroup(click.Group):
+    """Command group that imports subcommands on first use."""
+
+    def __init__(self, *args, lazy_commands: dict[str, str], **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            module, attr = self.lazy_commands[cmd_name].split(":")
+            self.add_command(getattr(importlib.import_module(module), attr), name=cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+
+@click.group(cls=LazyGroup, lazy_commands=COMMANDS)
 @click.option(
     "--config",
     "-c",
@@ -19,9 +55,14 @@ from pm.config import Config
     type=click.Path(),
     help="Path to Obsidian vault (overrides config).",
 )
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Fetch from Supabase instead of the local response cache.",
+)
 @click.version_option(version=__version__)
 @click.pass_context
-def cli(ctx: click.Context, config: str, vault: str) -> None:
+def cli(ctx: click.Context, config: str, vault: str, no_cache: bool) -> None:
     """Polymath Engine - Systematic polymathic learning CLI.
 
     A personal knowledge management system for tracking reading across
@@ -40,25 +81,12 @@ def cli(ctx: click.Context, config: str, vault: str) -> None:
     if vault:
         ctx.obj["config"].vault_path = vault
 
+    # Create the shared client up front so every command skips cached reads
+    if no_cache:
+        from pm.core.supabase_client import get_supabase_client, reset_supabase_client
 
-# Import and register commands
-from pm.commands.init import init
-from pm.commands.status import status
-from pm.commands.next_cmd import next_cmd
-from pm.commands.pair import pair
-from pm.commands.log import log
-from pm.commands.gaps import gaps
-from pm.commands.distance import distance
-from pm.commands.connections import connections
-
-cli.add_command(init)
-cli.add_command(status)
-cli.add_command(next_cmd, name="next")
-cli.add_command(pair)
-cli.add_command(log)
-cli.add_command(gaps)
-cli.add_command(distance)
-cli.add_command(connections)
+        reset_supabase_client()
+        get_supabase_client(use_cache=False)
 
 
 if __name__ == "__main__":
@@ -5,100 +5,14 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from pm.config import Config
-from pm.core.vault import Vault
-from pm.data.distances import BRANCH_NAMES, get_branch_distance
-from pm.data.domains import DOMAINS, get_domain_by_id
+from pm.data.distances import get_branch_distance
+from pm.data.domains import BRANCH_NAMES, DOMAINS, get_domain_by_id
+from pm.data.isomorphisms import KNOWN_ISOMORPHISMS
 
 
 console = Console()
 
 
-# Known isomorphisms - concepts that appear across domains
-KNOWN_ISOMORPHISMS = {
-    "entropy": {
-        "domains": ["01.02", "03.07", "05.01", "09.02"],
-        "names": {
-            "01.02": "Thermodynamic entropy",
-            "03.07": "Information entropy (Shannon)",
-            "05.01": "Social entropy (disorder)",
-            "09.02": "Market entropy (inefficiency)",
-        },
-        "description": "Measure of disorder, uncertainty, or information content",
-    },
-    "equilibrium": {
-        "domains": ["01.01", "02.02", "05.01", "03.09"],
-        "names": {
-            "01.01": "Mechanical equilibrium",
-            "02.02": "Ecological equilibrium",
-            "05.01": "Economic equilibrium",
-            "03.09": "Nash equilibrium",
-        },
-        "description": "Stable state where forces/pressures are balanced",
-    },
-    "fitness": {
-        "domains": ["02.04", "07.09", "09.02", "03.10"],
-        "names": {
-            "02.04": "Biological fitness (reproduction)",
-            "07.09": "Fitness function (ML optimization)",
-            "09.02": "Market fitness (competitive advantage)",
-            "03.10": "Decision fitness (utility)",
-        },
-        "description": "Measure of adaptation/optimization success",
-    },
-    "network_effects": {
-        "domains": ["03.06", "05.01", "09.02", "07.10"],
-        "names": {
-            "03.06": "Graph connectivity",
-            "05.01": "Social capital",
-            "09.02": "Platform economics",
-            "07.10": "Network topology",
-        },
-        "description": "Value increases with connections/participants",
-    },
-    "feedback_loops": {
-        "domains": ["07.14", "02.02", "05.01", "04.01"],
-        "names": {
-            "07.14": "Control systems feedback",
-            "02.02": "Ecological feedback",
-            "05.01": "Economic feedback (boom/bust)",
-            "04.01": "Cognitive feedback",
-        },
-        "description": "Output affects input, creating self-reinforcing or self-correcting dynamics",
-    },
-    "phase_transitions": {
-        "domains": ["01.02", "05.07", "09.02", "04.05"],
-        "names": {
-            "01.02": "Physical phase transitions",
-            "05.07": "Social tipping points",
-            "09.02": "Market regime changes",
-            "04.05": "Cognitive state changes",
-        },
-        "description": "Sudden qualitative changes at critical thresholds",
-    },
-    "selection_pressure": {
-        "domains": ["02.04", "09.02", "05.06", "06.04"],
-        "names": {
-            "02.04": "Natural selection",
-            "09.02": "Market selection",
-            "05.06": "Organizational selection",
-            "06.04": "Cultural selection",
-        },
-        "description": "Environmental forces that favor certain variants over others",
-    },
-    "signal_noise": {
-        "domains": ["03.07", "07.06", "09.02", "04.01"],
-        "names": {
-            "03.07": "Information signal/noise",
-            "07.06": "Telecommunications SNR",
-            "09.02": "Market signals",
-            "04.01": "Cognitive signal detection",
-        },
-        "description": "Distinguishing meaningful patterns from random variation",
-    },
-}
-
-
 @click.command()
 @click.argument("domain_id", required=False)
 @click.option(
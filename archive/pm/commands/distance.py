@@ -5,13 +5,14 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
+from pm.core.domain_matrix import get_domain_matrix
 from pm.data.distances import (
-    BRANCH_NAMES,
+    ISOMORPHISM_REDUCTION,
     get_branch_distance,
-    get_domain_distance,
     get_max_distant_branches,
 )
-from pm.data.domains import DOMAINS, get_domain_by_id
+from pm.data.domains import BRANCH_NAMES, DOMAINS, get_domain_by_id
+from pm.data.isomorphisms import shared_isomorphisms
 
 
 console = Console()
@@ -94,7 +95,8 @@ def _show_domain_distance(domain_a_id: str, domain_b_id: str) -> None:
         console.print(f"[red]Unknown domain: {domain_b_id}[/red]")
         return
 
-    dist = get_domain_distance(domain_a_id, domain_b_id)
+    dist = get_domain_matrix().distance(domain_a_id, domain_b_id)
+    shared = shared_isomorphisms(domain_a_id, domain_b_id)
     branch_a = domain_a_id.split(".")[0]
     branch_b = domain_b_id.split(".")[0]
 
@@ -104,7 +106,10 @@ def _show_domain_distance(domain_a_id: str, domain_b_id: str) -> None:
 [bold yellow]{domain_b_id}[/bold yellow] — {domain_b['domain_name']}
   [dim]Branch: {BRANCH_NAMES.get(branch_b, branch_b)}[/dim]
 
-[bold]Distance:[/bold] {_format_distance(int(dist))}"""
+[bold]Distance:[/bold] {_format_distance(dist)}"""
+    if shared:
+        names = ", ".join(name.replace("_", " ") for name in shared)
+        content += f"\n  [dim]Shared isomorphisms: {names} (-{ISOMORPHISM_REDUCTION:g} each)[/dim]"
 
     console.print()
     console.print(Panel(content, title="📏 Domain Distance", border_style="blue"))
@@ -250,8 +255,8 @@ def _show_matrix() -> None:
     console.print()
 
 
-def _format_distance(d: int) -> str:
-    """Format distance with color and label."""
+def _format_distance(d: float) -> str:
+    """Format distance with color and label (adjusted distances unlabeled)."""
     labels = {
         0: "[dim]0 (same)[/dim]",
         1: "[green]1 (adjacent)[/green]",
@@ -259,4 +264,6 @@ def _format_distance(d: int) -> str:
         3: "[yellow]3 (far)[/yellow]",
         4: "[red bold]4 (maximum)[/red bold]",
     }
-    return labels.get(d, str(d))
+    if d != int(d):
+        return f"{d:g}"
+    return labels.get(int(d), str(int(d)))
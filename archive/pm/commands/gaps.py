@@ -37,7 +37,7 @@ def gaps(ctx: click.Context, stale_days: int, show_all: bool) -> None:
     breadth across all 15 branches.
     """
     config: Config = ctx.obj.get("config", Config.load()) if ctx.obj else Config.load()
-    vault = Vault(config.vault_path)
+    vault = Vault.from_config(config)
 
     if not vault.exists():
         console.print("[red]Vault not found.[/red] Run [cyan]pm init[/cyan] first.")
@@ -0,0 +1,163 @@
+"""pm-import command - Bulk import reading sessions from CSV or JSONL."""
+
+import csv
+import json
+from dataclasses import replace
+from datetime import date
+from pathlib import Path
+from typing import Iterator, Optional
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+from pm.config import Config
+from pm.core.daily_log import DailyLog
+from pm.core.domain import Domain
+from pm.core.vault import Vault
+
+console = Console()
+
+SLOTS = ("FND", "ORT", "HRS", "FRN", "HST", "BRG")
+PHASES = ("hub-completion", "problem-driven", "bisociation")
+
+# Invalid rows reported individually before summarizing
+MAX_REPORTED_ERRORS = 10
+
+
+def _read_rows(path: Path, fmt: str) -> Iterator[tuple[int, dict]]:
+    """Stream (line number, row) pairs from a CSV or JSONL file."""
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        if fmt == "csv":
+            reader = csv.DictReader(f)
+            for row in reader:
+                yield reader.line_num, row
+            return
+
+        for line_no, line in enumerate(f, start=1):
+            if line.strip():
+                yield line_no, json.loads(line)
+
+
+def _parse_session(row: dict, default_phase: str) -> DailyLog:
+    """Build a daily log from an import row.
+
+    Columns mirror `pm log`: date, domain, book, and optionally slot,
+    pages, time and phase. domain_name is filled in later.
+
+    Raises:
+        ValueError: If a required column is missing or a value is invalid.
+    """
+    missing = [k for k in ("date", "domain", "book") if not row.get(k)]
+    if missing:
+        raise ValueError(f"missing {', '.join(missing)}")
+
+    slot = row.get("slot") or ""
+    if slot and slot not in SLOTS:
+        raise ValueError(f"unknown slot {slot!r}")
+    phase = row.get("phase") or default_phase
+    if phase not in PHASES:
+        raise ValueError(f"unknown phase {phase!r}")
+
+    return DailyLog(
+        log_date=date.fromisoformat(str(row["date"])),
+        domain_id=str(row["domain"]),
+        domain_name="",
+        book_title=str(row["book"]),
+        function_slot=slot,
+        pages_read=int(row.get("pages") or 0),
+        reading_time_minutes=int(row.get("time") or 0),
+        phase=phase,
+    )
+
+
+@click.command(name="import")
+@click.argument("source", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option(
+    "--format",
+    "-f",
+    "fmt",
+    type=click.Choice(["csv", "jsonl"]),
+    help="Input format (default: from the file extension).",
+)
+@click.option(
+    "--phase",
+    type=click.Choice(PHASES),
+    default="hub-completion",
+    help="Phase for rows that don't specify one.",
+)
+@click.pass_context
+def import_sessions(ctx: click.Context, source: Path, fmt: Optional[str], phase: str) -> None:
+    """Import reading sessions in bulk from a CSV or JSONL export.
+
+    Each row is one session with the same fields as `pm log`: date,
+    domain, book, and optionally slot, pages, time and phase. Sessions
+    are grouped by domain and applied in date order with the same
+    status rules as `pm log`; each touched domain is written once.
+    """
+    config: Config = ctx.obj.get("config", Config.load()) if ctx.obj else Config.load()
+    vault = Vault.from_config(config)
+
+    if not vault.exists():
+        console.print("[red]Vault not found.[/red] Run [cyan]pm init[/cyan] first.")
+        return
+
+    if fmt is None:
+        fmt = "jsonl" if source.suffix.lower() in (".jsonl", ".ndjson") else "csv"
+
+    # Fold pending `pm log` sessions into the domain files first, so the
+    # domains written below don't leave them to be replayed twice
+    vault.compact_journal()
+    by_id = vault.snapshot().by_id
+    sessions: dict[str, list[DailyLog]] = {}
+    errors = []
+
+    try:
+        for line_no, row in _read_rows(source, fmt):
+            try:
+                session = _parse_session(row, phase)
+                if session.domain_id not in by_id:
+                    raise ValueError(f"unknown domain {session.domain_id!r}")
+            except (ValueError, TypeError, AttributeError) as e:
+                errors.append((line_no, str(e)))
+                continue
+            sessions.setdefault(session.domain_id, []).append(session)
+    except (csv.Error, json.JSONDecodeError) as e:
+        console.print(f"[red]Could not read {source}: {e}[/red]")
+        return
+
+    # Apply each domain's sessions in date order on a copy of the domain
+    updated: list[Domain] = []
+    entries: list[tuple[DailyLog, str]] = []
+    for domain_id, domain_sessions in sessions.items():
+        domain_obj = replace(by_id[domain_id])
+        domain_sessions.sort(key=lambda s: s.log_date)
+        for session in domain_sessions:
+            session.domain_name = domain_obj.domain_name
+            if not session.function_slot:
+                session.function_slot = domain_obj.next_slot()
+            entries.append(
+                (session, session.render(domain_obj.branch_id, domain_obj.branch_name))
+            )
+            domain_obj.record_session(session.log_date)
+        updated.append(domain_obj)
+
+    entries.sort(key=lambda e: e[0].log_date)
+    vault.save_daily_logs(entries)
+    vault.save_domains(updated)
+
+    # Display summary
+    for line_no, message in errors[:MAX_REPORTED_ERRORS]:
+        console.print(f"[yellow]Skipped line {line_no}:[/yellow] {message}")
+    if len(errors) > MAX_REPORTED_ERRORS:
+        console.print(f"[yellow]... and {len(errors) - MAX_REPORTED_ERRORS} more[/yellow]")
+
+    console.print()
+    table = Table(title="📥 Import Complete", show_header=False, box=None)
+    table.add_column("Metric", style="bold")
+    table.add_column("Value")
+    table.add_row("Sessions imported", str(len(entries)))
+    table.add_row("Domains updated", str(len(updated)))
+    table.add_row("Rows skipped", str(len(errors)))
+    console.print(table)
+    console.print()
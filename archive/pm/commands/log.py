@@ -8,10 +8,8 @@ from rich.panel import Panel
 
 from pm.config import Config
 from pm.core.daily_log import DailyLog
-from pm.core.domain import DomainStatus
 from pm.core.vault import Vault
 from pm.data.domains import get_domain_by_id
-from pm.data.templates import DAILY_LOG_TEMPLATE
 
 
 console = Console()
@@ -71,7 +69,7 @@ def log(
     Creates a daily log file and updates the domain's book count.
     """
     config: Config = ctx.obj.get("config", Config.load()) if ctx.obj else Config.load()
-    vault = Vault(config.vault_path)
+    vault = Vault.from_config(config)
 
     if not vault.exists():
         console.print("[red]Vault not found.[/red] Run [cyan]pm init[/cyan] first.")
@@ -117,37 +115,11 @@ def log(
         phase=phase,
     )
 
-    # Generate log content from template
-    branch_folder = f"{domain_obj.branch_id}-{domain_obj.branch_name.replace(' ', '-')}"
-    domain_file = f"{domain}-{domain_obj.domain_name.replace(' ', '-').replace('/', '-')}.md"
-
-    content = DAILY_LOG_TEMPLATE.format(
-        date=today.isoformat(),
-        domain_name=domain_obj.domain_name,
-        domain_id=domain,
-        book_title=book,
-        function_slot=slot,
-        phase=phase,
-        branch_folder=branch_folder,
-        domain_file=domain_file,
-    )
-
-    # Save daily log
-    log_path = vault.save_daily_log(daily_log, content)
-
-    # Update domain
-    domain_obj.books_read += 1
-    domain_obj.last_read = today
-
-    # Update status based on books read
-    if domain_obj.status == DomainStatus.UNTOUCHED:
-        domain_obj.status = DomainStatus.SURVEYING
-    elif domain_obj.books_read >= 2 and domain_obj.status == DomainStatus.SURVEYING:
-        domain_obj.status = DomainStatus.SURVEYED
-    elif domain_obj.books_read >= 4 and domain_obj.status == DomainStatus.SURVEYED:
-        domain_obj.status = DomainStatus.DEEPENING
-
-    vault.save_domain(domain_obj)
+    # Journal the session and write its daily note; the domain profile
+    # is brought up to date when the journal is compacted
+    content = daily_log.render(domain_obj.branch_id, domain_obj.branch_name)
+    log_path = vault.log_session(daily_log, content)
+    domain_obj.record_session(today)
 
     # Display confirmation
     console.print()
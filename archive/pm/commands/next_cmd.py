@@ -33,7 +33,7 @@ def next_cmd(ctx: click.Context, phase: str, distant: bool) -> None:
     function slot to read next based on your current phase.
     """
     config: Config = ctx.obj.get("config", Config.load()) if ctx.obj else Config.load()
-    vault = Vault(config.vault_path)
+    vault = Vault.from_config(config)
 
     if not vault.exists():
         console.print("[red]Vault not found.[/red] Run [cyan]pm init[/cyan] first.")
@@ -40,7 +40,7 @@ def pair(ctx: click.Context, anchor: str, min_distance: int, questions: int) ->
     domain to force unexpected connections and insights.
     """
     config: Config = ctx.obj.get("config", Config.load()) if ctx.obj else Config.load()
-    vault = Vault(config.vault_path)
+    vault = Vault.from_config(config)
 
     if not vault.exists():
         console.print("[red]Vault not found.[/red] Run [cyan]pm init[/cyan] first.")
@@ -0,0 +1,119 @@
+"""pm-plan command - Simulate a reading plan for the coming days."""
+
+import json
+from datetime import date
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+from pm.config import Config
+from pm.core.planner import plan_reading
+from pm.core.traversal import TraversalEngine, TraversalPhase
+from pm.core.vault import Vault
+
+console = Console()
+
+
+@click.command()
+@click.option(
+    "--days",
+    "-n",
+    type=click.IntRange(min=1),
+    default=30,
+    help="Number of days to plan (default: 30).",
+)
+@click.option(
+    "--phase",
+    "-p",
+    type=click.Choice(["hub", "problem", "bisociation"]),
+    help="Override current traversal phase.",
+)
+@click.option(
+    "--format",
+    "-f",
+    "fmt",
+    type=click.Choice(["table", "json"]),
+    default="table",
+    help="Output format (default: table).",
+)
+@click.pass_context
+def plan(ctx: click.Context, days: int, phase: str, fmt: str) -> None:
+    """Plan the next N days of reading.
+
+    Follows the traversal engine's recommendation each day, as if every
+    recommended book were read, without changing the vault. Moves on to
+    bisociation once every hub is complete.
+    """
+    config: Config = ctx.obj.get("config", Config.load()) if ctx.obj else Config.load()
+    vault = Vault.from_config(config)
+
+    if not vault.exists():
+        console.print("[red]Vault not found.[/red] Run [cyan]pm init[/cyan] first.")
+        return
+
+    domains = vault.load_all_domains()
+    recent_logs = vault.load_recent_logs(days=config.traversal.max_domain_repeat_window)
+
+    engine = TraversalEngine(config.traversal)
+    if phase:
+        phase_map = {
+            "hub": TraversalPhase.HUB_COMPLETION,
+            "problem": TraversalPhase.PROBLEM_DRIVEN,
+            "bisociation": TraversalPhase.BISOCIATION,
+        }
+        engine.set_phase(phase_map[phase])
+
+    planned = plan_reading(
+        engine,
+        domains,
+        [(log.log_date, log.domain_id) for log in recent_logs],
+        start=date.today(),
+        days=days,
+    )
+
+    if fmt == "json":
+        click.echo(json.dumps([p.to_dict() for p in planned], indent=2))
+        return
+
+    if not planned:
+        console.print("[yellow]No recommendations available for this period.[/yellow]")
+        return
+
+    table = Table(title=f"📅 Reading Plan — next {days} days")
+    table.add_column("Day", justify="right", style="dim")
+    table.add_column("Date")
+    table.add_column("Domain", style="cyan")
+    table.add_column("Name")
+    table.add_column("Slot", style="green")
+    table.add_column("Books", justify="right")
+    table.add_column("Phase", style="dim")
+    table.add_column("Reason")
+
+    for p in planned:
+        name = f"🌍 {p.domain_name}" if p.is_distant_interleave else p.domain_name
+        table.add_row(
+            str(p.day),
+            p.read_on.strftime("%a %Y-%m-%d"),
+            p.domain_id,
+            name,
+            p.slot,
+            str(p.books_read),
+            p.phase,
+            p.reason,
+        )
+
+    console.print()
+    console.print(table)
+    console.print(
+        f"\n[dim]{len(planned)} reads across "
+        f"{len({p.domain_id for p in planned})} domains; "
+        f"{days - len(planned)} of {days} days have no recommendation.[/dim]"
+    )
+    last = planned[-1]
+    if last.day < days:
+        console.print(
+            f"[yellow]No recommendations after day {last.day} "
+            f"({last.read_on.isoformat()}).[/yellow]"
+        )
+    console.print()
@@ -36,14 +36,14 @@ def status(ctx: click.Context, detailed: bool) -> None:
     hub completion status, and current streak.
     """
     config: Config = ctx.obj.get("config", Config.load()) if ctx.obj else Config.load()
-    vault = Vault(config.vault_path)
+    vault = Vault.from_config(config)
 
     if not vault.exists():
         console.print("[red]Vault not found.[/red] Run [cyan]pm init[/cyan] first.")
         return
 
     # Get stats
-    stats = vault.get_stats()
+    stats = vault.get_stats(with_domains=True)
 
     # Header
     console.print()
@@ -63,6 +63,10 @@ def status(ctx: click.Context, detailed: bool) -> None:
     stats_table.add_row("Books read", str(stats.total_books_read))
     stats_table.add_row("Daily logs", str(stats.total_daily_logs))
     stats_table.add_row("Current streak", f"{stats.current_streak} days")
+    stats_table.add_row(
+        "Momentum",
+        f"{stats.weekly_average:.1f} days/week, {stats.momentum_trend.replace('_', ' ')}",
+    )
     stats_table.add_row("Branches touched", f"{stats.branches_touched}/15")
 
     console.print(stats_table)
@@ -0,0 +1,54 @@
+"""pm-sync command - Reconcile the vault with Supabase."""
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+from pm.config import Config
+from pm.core.supabase_client import get_supabase_client
+from pm.core.sync import SyncEngine
+from pm.core.vault import Vault
+
+console = Console()
+
+
+@click.command()
+@click.pass_context
+def sync(ctx: click.Context) -> None:
+    """Sync domain progress and daily logs with Supabase, both ways.
+
+    Only records changed since the last sync are transferred: edits made
+    in Obsidian go up, sessions logged in the web app come down. Progress
+    changed on both sides is merged; a daily note changed on both sides
+    wins over its row.
+    """
+    config: Config = ctx.obj.get("config", Config.load()) if ctx.obj else Config.load()
+    vault = Vault.from_config(config)
+
+    if not vault.exists():
+        console.print("[red]Vault not found.[/red] Run [cyan]pm init[/cyan] first.")
+        return
+
+    if not vault.using_supabase:
+        console.print(
+            "[red]Supabase isn't configured.[/red] Set SUPABASE_URL and SUPABASE_ANON_KEY."
+        )
+        return
+
+    try:
+        result = SyncEngine(vault, get_supabase_client()).run()
+    except ConnectionError as e:
+        console.print(
+            f"[red]Sync failed:[/red] {e}. Nothing was marked as synced; run it again later."
+        )
+        return
+
+    console.print()
+    table = Table(title="🔄 Sync Complete", show_header=False, box=None)
+    table.add_column("Metric", style="bold")
+    table.add_column("Value")
+    table.add_row("Domains pushed / pulled", f"{result.domains_pushed} / {result.domains_pulled}")
+    table.add_row("Logs pushed / pulled", f"{result.logs_pushed} / {result.logs_pulled}")
+    table.add_row("Conflicts resolved", str(result.conflicts))
+    console.print(table)
+    console.print()
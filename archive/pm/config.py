@@ -36,6 +36,7 @@ class Config:
     vault_path: Path
     user: UserConfig
     traversal: TraversalConfig
+    workers: int = 1  # parallel frontmatter parsing on cold loads
 
     @classmethod
     def load(cls, config_path: Optional[Path] = None) -> "Config":
@@ -74,7 +75,12 @@ class Config:
             bisociation_min_distance=traversal_data.get("bisociation_min_distance", 3),
         )
 
-        return cls(vault_path=vault_path, user=user, traversal=traversal)
+        return cls(
+            vault_path=vault_path,
+            user=user,
+            traversal=traversal,
+            workers=data.get("vault", {}).get("workers", 1),
+        )
 
     def save(self, config_path: Optional[Path] = None) -> None:
         """Save configuration to YAML file."""
@@ -84,7 +90,7 @@ class Config:
         config_path.parent.mkdir(parents=True, exist_ok=True)
 
         data = {
-            "vault": {"path": str(self.vault_path)},
+            "vault": {"path": str(self.vault_path), "workers": self.workers},
             "user": {
                 "name": self.user.name,
                 "expert_domains": self.user.expert_domains,
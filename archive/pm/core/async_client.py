@@ -0,0 +1,104 @@
+"""Asyncio interface to Polymath Engine's Supabase client.
+
+AsyncSupabaseClient has the same methods as SupabaseClient, as coroutines
+(generated from SupabaseClient's public methods, so new ones are covered).
+Each call runs the synchronous request on a worker thread, so independent
+reads started together with `gather` overlap their network latency instead
+of adding it up. Caching and write invalidation are SupabaseClient's.
+
+Click commands are synchronous; they use run_concurrently:
+
+    results = run_concurrently(
+        client,
+        domains=("get_all_domains",),
+        logs=("get_daily_logs", 7),
+    )
+"""
+
+import asyncio
+import functools
+import inspect
+from typing import Any, Awaitable
+
+from pm.core.supabase_client import SupabaseClient
+
+# SupabaseClient methods exposed as coroutines: every public method except
+# connect, which AsyncSupabaseClient defines itself
+ASYNC_METHODS = tuple(
+    name
+    for name, attr in vars(SupabaseClient).items()
+    if inspect.isfunction(attr) and not name.startswith("_") and name != "connect"
+)
+
+
+class AsyncSupabaseClient:
+    """Coroutine wrapper around a SupabaseClient."""
+
+    def __init__(self, client: SupabaseClient):
+        """Initialize the wrapper.
+
+        Args:
+            client: Synchronous client that does the requests.
+        """
+        self.client = client
+
+    @property
+    def is_available(self) -> bool:
+        """Check if Supabase credentials are configured (or a client was given)."""
+        return self.client.is_available
+
+    async def connect(self) -> bool:
+        """Establish connection to Supabase.
+
+        Returns:
+            True if connected successfully, False otherwise.
+        """
+        return await asyncio.to_thread(self.client.connect)
+
+    async def gather(self, **calls: Awaitable) -> dict[str, Any]:
+        """Run independent calls concurrently.
+
+        Args:
+            calls: Result name -> pending call, e.g. `stats=client.get_stats()`.
+
+        Returns:
+            Result name -> result, once every call has finished.
+        """
+        # Connect once up front rather than racing to connect on every thread
+        await self.connect()
+        results = await asyncio.gather(*calls.values())
+        return dict(zip(calls, results))
+
+
+def _async_method(name: str):
+    """Build the coroutine version of a SupabaseClient method."""
+    method = getattr(SupabaseClient, name)
+
+    @functools.wraps(method)
+    async def call(self: AsyncSupabaseClient, *args: Any, **kwargs: Any) -> Any:
+        return await asyncio.to_thread(method, self.client, *args, **kwargs)
+
+    return call
+
+
+for _name in ASYNC_METHODS:
+    setattr(AsyncSupabaseClient, _name, _async_method(_name))
+
+
+def run_concurrently(client: SupabaseClient, **calls: tuple) -> dict[str, Any]:
+    """Run independent client calls concurrently from synchronous code.
+
+    Args:
+        client: SupabaseClient to call.
+        calls: Result name -> (method name, *positional args).
+
+    Returns:
+        Result name -> the method's return value.
+    """
+    async def run() -> dict[str, Any]:
+        aclient = AsyncSupabaseClient(client)
+        return await aclient.gather(**{
+            key: getattr(aclient, method)(*args) for key, (method, *args) in calls.items()
+        })
+
+    return asyncio.run(run())
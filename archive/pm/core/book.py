@@ -5,7 +5,7 @@ from datetime import date
 from pathlib import Path
 from typing import Optional
 
-import frontmatter
+from pm.core.frontmatter_reader import read_frontmatter
 
 
 @dataclass
@@ -28,9 +28,11 @@ class Book:
     @classmethod
     def from_file(cls, filepath: Path) -> "Book":
         """Load book from Obsidian markdown file."""
-        post = frontmatter.load(filepath)
-        m = post.metadata
+        return cls.from_metadata(read_frontmatter(filepath), filepath)
 
+    @classmethod
+    def from_metadata(cls, m: dict, filepath: Optional[Path] = None) -> "Book":
+        """Build book from parsed frontmatter metadata."""
         date_started = m.get("date_started")
         if date_started and isinstance(date_started, str):
             try:
@@ -0,0 +1,121 @@
+"""Read-through response cache for Polymath Engine's Supabase client.
+
+Entries live in memory and are mirrored to a JSON file (by default
+~/.polymath/cache.json) so they survive across CLI invocations. Each entry
+expires after a TTL; writes through the client invalidate the keys they
+affect. Entries are guarded by a lock, since queued writes are sent (and
+invalidate) from a background thread.
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+DEFAULT_TTL = 300.0  # seconds
+CACHE_FILENAME = "cache.json"
+
+# Sentinel for a cache miss (None is a valid cached value)
+MISS = object()
+
+
+def default_cache_path() -> Path:
+    """Get the on-disk cache location (~/.polymath/cache.json)."""
+    return Path.home() / ".polymath" / CACHE_FILENAME
+
+
+class ResponseCache:
+    """Key/value cache with per-entry expiry and optional file persistence."""
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        ttl: float = DEFAULT_TTL,
+        namespace: str = "",
+    ):
+        """Initialize the cache.
+
+        Args:
+            path: JSON file to persist entries to (None = memory only).
+            ttl: Seconds an entry stays fresh.
+            namespace: Identifies the backend (URL + schema); a file written
+                for a different namespace is ignored.
+        """
+        self.path = path
+        self.ttl = ttl
+        self.namespace = namespace
+        self._entries: Optional[dict[str, tuple[float, Any]]] = None
+        self._lock = threading.RLock()
+
+    @property
+    def entries(self) -> dict[str, tuple[float, Any]]:
+        """Cached entries (key -> (expiry timestamp, value)), loaded on first use."""
+        with self._lock:
+            if self._entries is None:
+                self._entries = {}
+                if self.path is not None:
+                    try:
+                        with open(self.path) as f:
+                            data = json.load(f)
+                        if data.get("namespace") == self.namespace:
+                            self._entries = {
+                                k: (expires, value)
+                                for k, (expires, value) in data["entries"].items()
+                            }
+                    except (OSError, ValueError, KeyError, TypeError):
+                        pass  # missing or corrupt cache file: start empty
+            return self._entries
+
+    def get(self, key: str) -> Any:
+        """Get a fresh cached value, or MISS."""
+        with self._lock:
+            entry = self.entries.get(key)
+        if entry is None or entry[0] < time.time():
+            return MISS
+        return entry[1]
+
+    def set(self, key: str, value: Any) -> None:
+        """Cache a value for the TTL."""
+        with self._lock:
+            self.entries[key] = (time.time() + self.ttl, value)
+            self._save()
+
+    def invalidate(self, keys: Iterable[str] = (), prefixes: Iterable[str] = ()) -> None:
+        """Drop the given keys and every key starting with one of the prefixes."""
+        keys = set(keys)
+        prefixes = tuple(prefixes)
+        with self._lock:
+            stale = [
+                k for k in self.entries
+                if k in keys or (prefixes and k.startswith(prefixes))
+            ]
+            for k in stale:
+                del self.entries[k]
+            if stale:
+                self._save()
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries = {}
+            self._save()
+
+    def _save(self) -> None:
+        """Write the unexpired entries to the cache file atomically."""
+        if self.path is None:
+            return
+        now = time.time()
+        data = {
+            "namespace": self.namespace,
+            "entries": {k: e for k, e in self.entries.items() if e[0] >= now},
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            with open(tmp, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp, self.path)
+        except OSError:
+            pass  # the cache is an optimization; never fail a command over it
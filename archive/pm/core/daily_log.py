@@ -5,7 +5,8 @@ from datetime import date
 from pathlib import Path
 from typing import List, Optional
 
-import frontmatter
+from pm.core.frontmatter_reader import read_frontmatter
+from pm.data.templates import DAILY_LOG_TEMPLATE
 
 
 @dataclass
@@ -48,9 +49,11 @@ class DailyLog:
     @classmethod
     def from_file(cls, filepath: Path) -> "DailyLog":
         """Load daily log from Obsidian markdown file."""
-        post = frontmatter.load(filepath)
-        m = post.metadata
+        return cls.from_metadata(read_frontmatter(filepath), filepath)
 
+    @classmethod
+    def from_metadata(cls, m: dict, filepath: Optional[Path] = None) -> "DailyLog":
+        """Build daily log from parsed frontmatter metadata."""
         log_date_str = m.get("date")
         if log_date_str:
             if isinstance(log_date_str, str):
@@ -65,7 +68,7 @@ class DailyLog:
         else:
             # Try to parse from filename
             try:
-                log_date = date.fromisoformat(filepath.stem)
+                log_date = date.fromisoformat(filepath.stem if filepath else "")
             except ValueError:
                 log_date = date.today()
 
@@ -96,6 +99,30 @@ class DailyLog:
             "bisociation_partner": self.bisociation_partner,
         }
 
+    def render(self, branch_id: str, branch_name: str) -> str:
+        """Render the log's markdown note from the daily log template.
+
+        Args:
+            branch_id: Branch of the logged domain (for the domain link).
+            branch_name: Branch name of the logged domain.
+
+        Returns:
+            Markdown content for the note.
+        """
+        branch_folder = f"{branch_id}-{branch_name.replace(' ', '-')}"
+        domain_file = f"{self.domain_id}-{self.domain_name.replace(' ', '-').replace('/', '-')}.md"
+
+        return DAILY_LOG_TEMPLATE.format(
+            date=self.log_date.isoformat(),
+            domain_name=self.domain_name,
+            domain_id=self.domain_id,
+            book_title=self.book_title,
+            function_slot=self.function_slot,
+            phase=self.phase,
+            branch_folder=branch_folder,
+            domain_file=domain_file,
+        )
+
     @property
     def filename(self) -> str:
         """Generate filename for the log."""
@@ -6,7 +6,7 @@ from enum import Enum
 from pathlib import Path
 from typing import Dict, List, Optional
 
-import frontmatter
+from pm.core.frontmatter_reader import read_frontmatter
 
 
 class DomainStatus(Enum):
@@ -57,19 +57,23 @@ class Domain:
     function_slots: Dict[FunctionSlot, FunctionSlotStatus] = field(default_factory=dict)
     subtopics: List[Dict] = field(default_factory=list)
     filepath: Optional[Path] = None
+    journal_seq: int = 0  # Last session journal event applied to this profile
 
     @classmethod
     def from_file(cls, filepath: Path) -> "Domain":
         """Load domain from Obsidian markdown file."""
-        post = frontmatter.load(filepath)
+        return cls.from_metadata(read_frontmatter(filepath), filepath)
 
-        status_str = post.metadata.get("status", "untouched")
+    @classmethod
+    def from_metadata(cls, metadata: dict, filepath: Optional[Path] = None) -> "Domain":
+        """Build domain from parsed frontmatter metadata."""
+        status_str = metadata.get("status", "untouched")
         try:
             status = DomainStatus(status_str)
         except ValueError:
             status = DomainStatus.UNTOUCHED
 
-        last_read = post.metadata.get("last_read")
+        last_read = metadata.get("last_read")
         if last_read and isinstance(last_read, str):
             try:
                 last_read = date.fromisoformat(last_read)
@@ -77,17 +81,18 @@ class Domain:
                 last_read = None
 
         return cls(
-            domain_id=post.metadata.get("domain_id", ""),
-            domain_name=post.metadata.get("domain_name", ""),
-            branch_id=post.metadata.get("branch_id", ""),
-            branch_name=post.metadata.get("branch_name", ""),
-            description=post.metadata.get("description", ""),
+            domain_id=metadata.get("domain_id", ""),
+            domain_name=metadata.get("domain_name", ""),
+            branch_id=metadata.get("branch_id", ""),
+            branch_name=metadata.get("branch_name", ""),
+            description=metadata.get("description", ""),
             status=status,
-            is_hub=post.metadata.get("is_hub", False),
-            is_expert=post.metadata.get("is_expert", False),
-            books_read=post.metadata.get("books_read", 0),
+            is_hub=metadata.get("is_hub", False),
+            is_expert=metadata.get("is_expert", False),
+            books_read=metadata.get("books_read", 0),
             last_read=last_read,
             filepath=filepath,
+            journal_seq=metadata.get("journal_seq", 0),
         )
 
     def to_frontmatter(self) -> dict:
@@ -103,6 +108,7 @@ class Domain:
             "is_expert": self.is_expert,
             "books_read": self.books_read,
             "last_read": self.last_read.isoformat() if self.last_read else None,
+            "journal_seq": self.journal_seq,
         }
 
     @property
@@ -116,6 +122,26 @@ class Domain:
             return None
         return (date.today() - self.last_read).days
 
+    def record_session(self, read_on: date) -> None:
+        """Apply one logged reading session to the domain's progress.
+
+        Counts the book, moves last_read forward and advances the status
+        at most one step (untouched → surveying → surveyed → deepening).
+
+        Args:
+            read_on: Date of the session.
+        """
+        self.books_read += 1
+        if not self.last_read or read_on > self.last_read:
+            self.last_read = read_on
+
+        if self.status == DomainStatus.UNTOUCHED:
+            self.status = DomainStatus.SURVEYING
+        elif self.books_read >= 2 and self.status == DomainStatus.SURVEYING:
+            self.status = DomainStatus.SURVEYED
+        elif self.books_read >= 4 and self.status == DomainStatus.SURVEYED:
+            self.status = DomainStatus.DEEPENING
+
     def next_slot(self) -> str:
         """Determine next function slot to fill based on books read."""
         slots = ["FND", "HRS", "ORT", "FRN", "HST", "BRG"]
@@ -0,0 +1,204 @@
+"""Precomputed domain-to-domain distance matrix for Polymath Engine.
+
+Every pair of the 180 domains gets its branch distance minus
+ISOMORPHISM_REDUCTION per isomorphism the two share in the catalogue
+(SPEC-06 section 2.2), floored at 0. The matrix is float32, row-major,
+indexed in DOMAINS order.
+
+It is persisted in ~/.polymath/domain-distances.bin behind a small
+header holding a SHA-256 of its inputs (domain IDs, branch distances,
+isomorphism catalogue, reduction). `pm distance` memory-maps the file,
+so a lookup is one index into the mapping; when the inputs change the
+hash no longer matches and the file is rebuilt. Traversal, bisociation
+and `pm connections` still rank by branch distance and don't read it.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+from array import array
+from pathlib import Path
+from typing import Optional, Sequence
+
+from pm.data.distances import (
+    _BRANCH_DISTANCES_RAW,
+    ISOMORPHISM_REDUCTION,
+    MAX_DISTANCE,
+    branch_index,
+    get_domain_distance,
+    index_distance,
+)
+from pm.data.domains import DOMAINS
+from pm.data.isomorphisms import KNOWN_ISOMORPHISMS, shared_isomorphisms
+
+MATRIX_FILENAME = "domain-distances.bin"
+
+# magic, format version, domain count, input hash; padded so the floats
+# start 4-byte aligned
+_HEADER = struct.Struct("<4sII32s4x")
+_MAGIC = b"PMDD"
+_VERSION = 1
+
+
+def default_matrix_path() -> Path:
+    """Get the on-disk matrix location (~/.polymath/domain-distances.bin)."""
+    return Path.home() / ".polymath" / MATRIX_FILENAME
+
+
+def inputs_hash(domain_ids: Sequence[str], isomorphisms: dict) -> bytes:
+    """Hash everything a matrix is computed from."""
+    inputs = {
+        "version": _VERSION,
+        "domains": list(domain_ids),
+        "branch_distances": sorted([a, b, d] for (a, b), d in _BRANCH_DISTANCES_RAW.items()),
+        "isomorphisms": {name: sorted(data["domains"]) for name, data in isomorphisms.items()},
+        "reduction": ISOMORPHISM_REDUCTION,
+    }
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True).encode()).digest()
+
+
+class DomainDistanceMatrix:
+    """Distances between every pair of domains."""
+
+    def __init__(self, domain_ids: Sequence[str], values: Sequence[float], digest: bytes):
+        """Initialize the matrix.
+
+        Args:
+            domain_ids: Row/column order.
+            values: len(domain_ids)**2 distances, row-major (an array or a
+                memoryview over a mapped file).
+            digest: inputs_hash of what the values were computed from.
+        """
+        self.domain_ids = list(domain_ids)
+        self.index = {domain_id: i for i, domain_id in enumerate(self.domain_ids)}
+        self.size = len(self.domain_ids)
+        self.values = values
+        self.digest = digest
+        self._mmap: Optional[mmap.mmap] = None
+
+    @classmethod
+    def build(
+        cls,
+        domain_ids: Optional[Sequence[str]] = None,
+        isomorphisms: Optional[dict] = None,
+    ) -> "DomainDistanceMatrix":
+        """Compute the matrix.
+
+        Args:
+            domain_ids: Domains to include (default: the taxonomy).
+            isomorphisms: Catalogue to apply (default: KNOWN_ISOMORPHISMS).
+        """
+        if domain_ids is None:
+            domain_ids = [d["domain_id"] for d in DOMAINS]
+        if isomorphisms is None:
+            isomorphisms = KNOWN_ISOMORPHISMS
+        n = len(domain_ids)
+        index = {domain_id: i for i, domain_id in enumerate(domain_ids)}
+
+        shared = [0] * (n * n)
+        for data in isomorphisms.values():
+            members = sorted({index[d] for d in data["domains"] if d in index})
+            for i in members:
+                for j in members:
+                    if i != j:
+                        shared[i * n + j] += 1
+
+        branches = [branch_index(domain_id.split(".")[0]) for domain_id in domain_ids]
+        values = array("f", bytes(4 * n * n))
+        for i, bi in enumerate(branches):
+            for j, bj in enumerate(branches):
+                base = index_distance(bi, bj) if bi >= 0 and bj >= 0 else MAX_DISTANCE
+                values[i * n + j] = max(0.0, base - ISOMORPHISM_REDUCTION * shared[i * n + j])
+        return cls(domain_ids, values, inputs_hash(domain_ids, isomorphisms))
+
+    def save(self, path: Path) -> None:
+        """Write the matrix to a file atomically."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, self.size, self.digest))
+            f.write(array("f", self.values).tobytes())
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(
+        cls, path: Path, domain_ids: Sequence[str], digest: bytes
+    ) -> Optional["DomainDistanceMatrix"]:
+        """Map a saved matrix, if it was computed from the given inputs.
+
+        Returns:
+            The matrix, or None if the file is missing, corrupt or stale.
+        """
+        try:
+            with open(path, "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+
+        n = len(domain_ids)
+        if len(mapped) != _HEADER.size + 4 * n * n:
+            mapped.close()
+            return None
+        magic, version, size, saved = _HEADER.unpack_from(mapped)
+        if (magic, version, size, saved) != (_MAGIC, _VERSION, n, digest):
+            mapped.close()
+            return None
+
+        matrix = cls(domain_ids, memoryview(mapped)[_HEADER.size:].cast("f"), digest)
+        matrix._mmap = mapped
+        return matrix
+
+    def distance(self, domain_a_id: str, domain_b_id: str) -> float:
+        """Get the adjusted distance between two domains.
+
+        Domains outside the matrix fall back to computing the distance.
+        """
+        i = self.index.get(domain_a_id)
+        j = self.index.get(domain_b_id)
+        if i is None or j is None:
+            shared = len(shared_isomorphisms(domain_a_id, domain_b_id))
+            return get_domain_distance(domain_a_id, domain_b_id, shared)
+        return self.values[i * self.size + j]
+
+    def row(self, domain_id: str) -> Sequence[float]:
+        """Get the distances from one domain to every domain, in matrix order."""
+        i = self.index[domain_id]
+        return self.values[i * self.size:(i + 1) * self.size]
+
+
+def load_domain_matrix(path: Optional[Path] = None) -> DomainDistanceMatrix:
+    """Load the saved matrix for the current taxonomy, rebuilding it if stale.
+
+    Args:
+        path: Matrix file (default: ~/.polymath/domain-distances.bin).
+
+    Returns:
+        Memory-mapped matrix, or a freshly built one.
+    """
+    path = path or default_matrix_path()
+    domain_ids = [d["domain_id"] for d in DOMAINS]
+    digest = inputs_hash(domain_ids, KNOWN_ISOMORPHISMS)
+    matrix = DomainDistanceMatrix.load(path, domain_ids, digest)
+    if matrix is not None:
+        return matrix
+
+    matrix = DomainDistanceMatrix.build(domain_ids, KNOWN_ISOMORPHISMS)
+    try:
+        matrix.save(path)
+    except OSError:
+        pass  # unwritable: use the built matrix; the next run rebuilds it again
+    return matrix
+
+
+# Process-wide matrix
+_matrix: Optional[DomainDistanceMatrix] = None
+
+
+def get_domain_matrix() -> DomainDistanceMatrix:
+    """Get the shared domain distance matrix, loading it on first use."""
+    global _matrix
+    if _matrix is None:
+        _matrix = load_domain_matrix()
+    return _matrix
@@ -0,0 +1,214 @@
+"""Header-only frontmatter reader for Polymath Engine.
+
+`frontmatter.load` reads and keeps the whole markdown body even when only the
+metadata is needed. These helpers stop reading at the closing `---` and parse
+just the YAML header. The body is only read when explicitly asked for.
+
+Vault notes use a flat `key: scalar` header (plus simple tag lists), which is
+parsed directly; anything outside that subset goes through YAML, using
+libyaml's C loader when it is available.
+"""
+
+import re
+from datetime import date
+from pathlib import Path
+from typing import Any, Optional
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # libyaml not available
+    from yaml import SafeLoader as _SafeLoader
+
+
+# Same delimiter rule as python-frontmatter's YAML handler
+_BOUNDARY = re.compile(r"^-{3,}\s*$")
+
+# Flat header subset: `key: value` at column 0 and `  - item` list entries
+_KEY_LINE = re.compile(r"^([A-Za-z_][A-Za-z0-9_]*):(?: (.*))?$")
+_LIST_ITEM = re.compile(r"^ +- (.*)$")
+
+# Scalars whose YAML 1.1 resolution is unambiguous
+_DOUBLE_QUOTED = re.compile(r'^"([^"\\]*)"$')
+_SINGLE_QUOTED = re.compile(r"^'((?:[^']|'')*)'$")
+_INT = re.compile(r"^[-+]?(?:0|[1-9][0-9]*)$")
+_DATE = re.compile(r"^[0-9]{4}-[0-9]{2}-[0-9]{2}$")
+_PLAIN = re.compile(r"^[A-Za-z][A-Za-z0-9 _./(),'+-]*$")
+_KEYWORDS = {
+    "": None, "~": None, "null": None, "Null": None, "NULL": None,
+    "true": True, "True": True, "TRUE": True,
+    "false": False, "False": False, "FALSE": False,
+    "yes": True, "Yes": True, "YES": True, "on": True, "On": True, "ON": True,
+    "no": False, "No": False, "NO": False, "off": False, "Off": False, "OFF": False,
+}
+
+# Sentinel for values outside the flat subset
+_UNSUPPORTED = object()
+
+
+def _read_header(f) -> Optional[str]:
+    """Read the YAML header from an open file positioned at the start.
+
+    Returns:
+        Raw YAML text, or None if the file has no complete frontmatter block.
+    """
+    for line in f:
+        if line.strip():
+            break
+    else:
+        return None
+
+    if not _BOUNDARY.match(line):
+        return None
+
+    lines = []
+    for line in f:
+        if _BOUNDARY.match(line):
+            return "".join(lines)
+        lines.append(line)
+    return None
+
+
+def _parse_scalar(text: str) -> Any:
+    """Resolve a scalar the way YAML's safe loader would, or _UNSUPPORTED."""
+    text = text.strip()
+    if text in _KEYWORDS:
+        return _KEYWORDS[text]
+
+    m = _DOUBLE_QUOTED.match(text)
+    if m:
+        return m.group(1)
+    m = _SINGLE_QUOTED.match(text)
+    if m:
+        return m.group(1).replace("''", "'")
+
+    if _INT.match(text):
+        return int(text)
+    if _DATE.match(text):
+        try:
+            return date.fromisoformat(text)
+        except ValueError:
+            return _UNSUPPORTED
+    if _PLAIN.match(text):
+        return text
+    return _UNSUPPORTED
+
+
+def _parse_flat(header: str) -> Optional[dict]:
+    """Parse a flat frontmatter header without YAML.
+
+    Returns:
+        Metadata dict, or None if the header uses anything beyond the
+        flat `key: scalar` / simple list subset.
+    """
+    data: dict = {}
+    list_key: Optional[str] = None
+
+    for line in header.splitlines():
+        if not line.strip() or line.startswith("#"):
+            continue
+
+        m = _LIST_ITEM.match(line)
+        if m:
+            if list_key is None:
+                return None
+            value = _parse_scalar(m.group(1))
+            if value is _UNSUPPORTED:
+                return None
+            data[list_key].append(value)
+            continue
+
+        m = _KEY_LINE.match(line)
+        if not m or m.group(1) in _KEYWORDS:
+            return None
+        key, raw = m.group(1), m.group(2) or ""
+
+        if not raw.strip():
+            # Either an empty value or the start of a block list
+            data[key] = []
+            list_key = key
+            continue
+
+        value = _parse_scalar(raw)
+        if value is _UNSUPPORTED:
+            return None
+        data[key] = value
+        list_key = None
+
+    # Keys without list items are empty values, which YAML reads as null
+    for key, value in data.items():
+        if value == []:
+            data[key] = None
+    return data
+
+
+def parse_header(header: str) -> dict:
+    """Parse raw frontmatter YAML into a metadata dict.
+
+    Args:
+        header: YAML text between the `---` delimiters.
+
+    Returns:
+        Metadata dict (empty if the header isn't a mapping).
+    """
+    data = _parse_flat(header)
+    if data is not None:
+        return data
+
+    data = yaml.load(header, Loader=_SafeLoader)
+    return data if isinstance(data, dict) else {}
+
+
+def read_frontmatter(filepath: Path) -> dict:
+    """Read only the frontmatter metadata of a markdown file.
+
+    Args:
+        filepath: Markdown file to read.
+
+    Returns:
+        Metadata dict (empty if the file has no frontmatter).
+    """
+    with open(filepath, encoding="utf-8-sig") as f:
+        header = _read_header(f)
+
+    if header is None:
+        return {}
+    return parse_header(header)
+
+
+def read_body(filepath: Path) -> str:
+    """Read the markdown body of a file, skipping its frontmatter.
+
+    Args:
+        filepath: Markdown file to read.
+
+    Returns:
+        Body text, stripped like python-frontmatter's `content`.
+    """
+    with open(filepath, encoding="utf-8-sig") as f:
+        header = _read_header(f)
+        if header is None:
+            f.seek(0)
+        return f.read().strip()
+
+
+class LazyPost:
+    """A markdown note whose body is only loaded on first access."""
+
+    def __init__(self, filepath: Path):
+        """Read the note's metadata.
+
+        Args:
+            filepath: Markdown file to read.
+        """
+        self.filepath = Path(filepath)
+        self.metadata = read_frontmatter(self.filepath)
+        self._content: Optional[str] = None
+
+    @property
+    def content(self) -> str:
+        """Markdown body, read from disk on first access."""
+        if self._content is None:
+            self._content = read_body(self.filepath)
+        return self._content
@@ -0,0 +1,312 @@
+"""Sidecar frontmatter index for Polymath Engine.
+
+Caches parsed frontmatter for domain profiles, daily logs and book notes in a
+SQLite file inside the vault. Entries are keyed by path and validated against
+the file's mtime and size, so only files whose stat changed are re-parsed.
+
+Book notes are additionally indexed by (author, title), domain_id and
+function_slot so lookups don't have to scan the books directory.
+"""
+
+import json
+import os
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional, Union
+
+from pm.core.frontmatter_reader import read_frontmatter
+
+INDEX_FILENAME = ".pm-index.sqlite"
+
+# Bump when the table layout or the cached metadata format changes;
+# a mismatched index is dropped and rebuilt lazily from the files.
+SCHEMA_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    metadata TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_files_kind ON files(kind);
+
+CREATE TABLE IF NOT EXISTS books (
+    path TEXT PRIMARY KEY,
+    author TEXT NOT NULL,
+    title TEXT NOT NULL,
+    domain_id TEXT NOT NULL,
+    function_slot TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_books_author_title ON books(author, title);
+CREATE INDEX IF NOT EXISTS idx_books_domain ON books(domain_id);
+CREATE INDEX IF NOT EXISTS idx_books_slot ON books(function_slot);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_TABLES = ("files", "books", "meta")
+
+# Below this many files, pool startup costs more than it saves
+PARALLEL_MIN_FILES = 256
+
+
+def parse_frontmatter(filepath: Path) -> dict:
+    """Parse the frontmatter metadata of a markdown file (header only)."""
+    return read_frontmatter(filepath)
+
+
+def _parse_or_error(filepath: Path) -> Union[dict, Exception]:
+    """Parse a file, returning the exception instead of raising it."""
+    try:
+        return parse_frontmatter(filepath)
+    except Exception as e:
+        return e
+
+
+def parse_many(
+    filepaths: list[Path],
+    workers: int = 1,
+    use_processes: bool = True,
+) -> list[Union[dict, Exception]]:
+    """Parse many files, optionally spreading the work over a pool.
+
+    Results are in the same order as `filepaths`. Per-file errors are
+    returned in place of the metadata so callers can handle them in order,
+    exactly as in a serial loop.
+
+    Args:
+        filepaths: Files to parse.
+        workers: Pool size; 1 parses serially.
+        use_processes: Use a process pool (parsing is CPU-bound and holds
+            the GIL) rather than a thread pool.
+
+    Returns:
+        Metadata dict or exception for each file.
+    """
+    if workers <= 1 or len(filepaths) < PARALLEL_MIN_FILES:
+        return [_parse_or_error(p) for p in filepaths]
+
+    if use_processes:
+        chunksize = max(1, len(filepaths) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(_parse_or_error, filepaths, chunksize=chunksize))
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_parse_or_error, filepaths))
+
+
+class VaultIndex:
+    """SQLite-backed cache of parsed frontmatter, keyed by path + mtime + size."""
+
+    def __init__(self, vault_path: Path, db_path: Optional[Path] = None):
+        """Initialize the index.
+
+        Args:
+            vault_path: Vault root; cached paths are stored relative to it.
+            db_path: Index file location (default: 00-System/.pm-index.sqlite).
+        """
+        self.vault_path = Path(vault_path)
+        self.db_path = db_path or self.vault_path / "00-System" / INDEX_FILENAME
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Open (and if needed, create or rebuild) the index database."""
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, isolation_level=None)
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != SCHEMA_VERSION:
+                for table in _TABLES:
+                    conn.execute(f"DROP TABLE IF EXISTS {table}")
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Group index writes into a single transaction."""
+        conn = self.conn
+        if conn.in_transaction:
+            yield
+            return
+        conn.execute("BEGIN")
+        try:
+            yield
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def _key(self, filepath: Path) -> str:
+        """Get the index key for a file (vault-relative POSIX path)."""
+        try:
+            return Path(filepath).relative_to(self.vault_path).as_posix()
+        except ValueError:
+            return Path(filepath).as_posix()
+
+    def lookup(self, filepath: Path, stat: Optional[os.stat_result] = None) -> Optional[dict]:
+        """Get cached metadata for a file if its stat is unchanged.
+
+        Args:
+            filepath: File to look up.
+            stat: Pre-computed stat result (avoids a second stat call).
+
+        Returns:
+            Cached metadata dict, or None if missing or stale.
+        """
+        if stat is None:
+            stat = os.stat(filepath)
+        row = self.conn.execute(
+            "SELECT mtime_ns, size, metadata FROM files WHERE path = ?",
+            (self._key(filepath),),
+        ).fetchone()
+        if row is None or row[0] != stat.st_mtime_ns or row[1] != stat.st_size:
+            return None
+        return json.loads(row[2])
+
+    def store(
+        self,
+        filepath: Path,
+        kind: str,
+        metadata: dict,
+        stat: Optional[os.stat_result] = None,
+    ) -> None:
+        """Record parsed metadata for a file at its current stat.
+
+        Args:
+            filepath: File the metadata was parsed from.
+            kind: Note kind ("domain", "log" or "book").
+            metadata: Parsed frontmatter.
+            stat: Stat result the metadata corresponds to.
+        """
+        if stat is None:
+            stat = os.stat(filepath)
+        key = self._key(filepath)
+        self.conn.execute(
+            "INSERT OR REPLACE INTO files (path, kind, mtime_ns, size, metadata) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (
+                key,
+                kind,
+                stat.st_mtime_ns,
+                stat.st_size,
+                json.dumps(metadata, default=str),
+            ),
+        )
+        if kind == "book":
+            self.conn.execute(
+                "INSERT OR REPLACE INTO books (path, author, title, domain_id, function_slot) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    key,
+                    str(metadata.get("author") or ""),
+                    str(metadata.get("title") or ""),
+                    str(metadata.get("domain_id") or ""),
+                    str(metadata.get("function_slot") or ""),
+                ),
+            )
+
+    def metadata(self, filepath: Path, kind: str) -> dict:
+        """Get metadata for a file, re-parsing only if its stat changed.
+
+        Args:
+            filepath: File to read.
+            kind: Note kind ("domain", "log" or "book").
+
+        Returns:
+            Frontmatter metadata dict.
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist.
+        """
+        stat = os.stat(filepath)
+        cached = self.lookup(filepath, stat)
+        if cached is not None:
+            return cached
+
+        data = parse_frontmatter(filepath)
+        self.store(filepath, kind, data, stat)
+        return data
+
+    def file_stats(self, kind: str) -> dict[Path, tuple[int, int]]:
+        """Get the (mtime_ns, size) each indexed file of a kind was parsed at."""
+        rows = self.conn.execute(
+            "SELECT path, mtime_ns, size FROM files WHERE kind = ?", (kind,)
+        ).fetchall()
+        return {self.vault_path / p: (mtime_ns, size) for p, mtime_ns, size in rows}
+
+    def prune(self, kind: str) -> int:
+        """Drop entries of a kind whose files no longer exist.
+
+        Returns:
+            Number of entries removed.
+        """
+        rows = self.conn.execute("SELECT path FROM files WHERE kind = ?", (kind,)).fetchall()
+        stale = [(p,) for (p,) in rows if not (self.vault_path / p).exists()]
+        self.conn.executemany("DELETE FROM files WHERE path = ?", stale)
+        self.conn.executemany("DELETE FROM books WHERE path = ?", stale)
+        return len(stale)
+
+    # === Book lookups ===
+
+    def find_books(
+        self,
+        author: Optional[str] = None,
+        title: Optional[str] = None,
+        domain_id: Optional[str] = None,
+        function_slot: Optional[str] = None,
+    ) -> list[Path]:
+        """Find indexed book notes matching all given fields.
+
+        Args:
+            author: Exact author to match.
+            title: Exact title to match.
+            domain_id: Domain ID to match.
+            function_slot: Function slot to match.
+
+        Returns:
+            Absolute paths of matching book notes, sorted by path.
+        """
+        clauses = []
+        params = []
+        for column, value in (
+            ("author", author),
+            ("title", title),
+            ("domain_id", domain_id),
+            ("function_slot", function_slot),
+        ):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+
+        sql = "SELECT path FROM books"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        rows = self.conn.execute(sql + " ORDER BY path", params).fetchall()
+        return [self.vault_path / p for (p,) in rows]
+
+    def get_meta(self, key: str) -> Optional[str]:
+        """Get a value from the index's key/value metadata."""
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str) -> None:
+        """Set a value in the index's key/value metadata."""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value)
+        )
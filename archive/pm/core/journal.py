@@ -0,0 +1,220 @@
+"""Append-only session journal for Polymath Engine.
+
+Reading sessions are recorded as one JSON line each in
+00-System/.pm-journal.jsonl, numbered with an increasing sequence. Logging
+a session is a single append; domain profiles are brought up to date later
+by compaction, which records in each profile the last sequence applied to
+it and then truncates the journal to a checkpoint line. Events after the
+checkpoint are pending and are replayed on top of the compacted state when
+domains are read, skipping those a profile already includes.
+"""
+
+import json
+import os
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import IO, Optional
+
+JOURNAL_FILENAME = ".pm-journal.jsonl"
+
+# Checkpoint lines start with this prefix, so the latest one can be found
+# with a reverse byte search instead of parsing the whole journal.
+_CHECKPOINT = b'{"type":"compacted"'
+
+
+@dataclass
+class SessionEvent:
+    """One logged reading session."""
+
+    log_date: date
+    domain_id: str
+    book_title: str
+    function_slot: str
+    pages_read: int = 0
+    reading_time_minutes: int = 0
+    phase: str = ""
+    note: str = ""  # vault-relative path of the session's daily log note
+    seq: int = 0  # assigned by SessionJournal.append
+
+    def to_json(self) -> str:
+        """Serialize as a journal line (without the newline)."""
+        return json.dumps(
+            {
+                "type": "session",
+                "seq": self.seq,
+                "date": self.log_date.isoformat(),
+                "domain_id": self.domain_id,
+                "book": self.book_title,
+                "function_slot": self.function_slot,
+                "pages_read": self.pages_read,
+                "reading_time_minutes": self.reading_time_minutes,
+                "phase": self.phase,
+                "note": self.note,
+            },
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def from_json(cls, data: dict) -> "SessionEvent":
+        """Build an event from a parsed journal line."""
+        return cls(
+            log_date=date.fromisoformat(data["date"]),
+            domain_id=data["domain_id"],
+            book_title=data.get("book", ""),
+            function_slot=data.get("function_slot", ""),
+            pages_read=data.get("pages_read", 0),
+            reading_time_minutes=data.get("reading_time_minutes", 0),
+            phase=data.get("phase", ""),
+            note=data.get("note", ""),
+            seq=data.get("seq", 0),
+        )
+
+
+class SessionJournal:
+    """Append-only JSONL journal of reading sessions."""
+
+    def __init__(self, path: Path, sync_every: int = 1):
+        """Initialize the journal.
+
+        Args:
+            path: Journal file location.
+            sync_every: fsync after this many appends (1 = every append).
+                Unsynced appends are flushed to the OS but may be lost on
+                power failure; close() syncs them.
+        """
+        self.path = Path(path)
+        self.sync_every = max(1, sync_every)
+        self._file: Optional[IO[str]] = None
+        self._unsynced = 0
+        # (mtime_ns, size) of the file when last parsed, pending events, last seq
+        self._parsed: Optional[tuple[int, int]] = None
+        self._pending: list[SessionEvent] = []
+        self._last_seq = 0
+
+    def _open(self) -> IO[str]:
+        """Open the journal for appending."""
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")
+            # Start on a fresh line if the last append was interrupted
+            if self._file.tell() > 0:
+                with open(self.path, "rb") as f:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        self._file.write("\n")
+        return self._file
+
+    def _write(self, line: str) -> None:
+        """Append one line, syncing according to sync_every."""
+        f = self._open()
+        f.write(line + "\n")
+        f.flush()
+        self._unsynced += 1
+        if self._unsynced >= self.sync_every:
+            self.sync()
+
+    def append(self, event: SessionEvent) -> None:
+        """Append a session event, assigning it the next sequence number."""
+        event.seq = self.last_seq + 1
+        self._write(event.to_json())
+        self._last_seq = event.seq
+
+        # The parse was current before this append, so extend it in place
+        if self._parsed is not None:
+            stat = os.stat(self.path)
+            self._parsed = (stat.st_mtime_ns, stat.st_size)
+            self._pending.append(event)
+
+    @property
+    def last_seq(self) -> int:
+        """Get the sequence number of the newest event ever appended."""
+        self._load()
+        return self._last_seq
+
+    def checkpoint(self, seq: Optional[int] = None) -> None:
+        """Mark events up to a sequence number as compacted.
+
+        The journal is rewritten atomically to a checkpoint line plus any
+        later events, so it only ever holds uncompacted history.
+
+        Args:
+            seq: Last compacted sequence number (default: every event so far).
+        """
+        if seq is None:
+            seq = self.last_seq
+        later = [e for e in self.pending() if e.seq > seq]
+        self.close()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(_CHECKPOINT.decode() + f',"seq":{max(seq, self._last_seq)}}}\n')
+            for event in later:
+                f.write(event.to_json() + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+        self._parsed = None
+
+    def sync(self) -> None:
+        """fsync appends made since the last sync."""
+        if self._file is not None and self._unsynced:
+            os.fsync(self._file.fileno())
+        self._unsynced = 0
+
+    def close(self) -> None:
+        """Sync and close the journal file."""
+        if self._file is not None:
+            self.sync()
+            self._file.close()
+            self._file = None
+
+    def pending(self) -> list[SessionEvent]:
+        """Get session events appended since the last checkpoint.
+
+        Returns:
+            Pending events in append order.
+        """
+        self._load()
+        return list(self._pending)
+
+    def _load(self) -> None:
+        """Parse the journal, unless it is unchanged since the last parse."""
+        if self._file is not None:
+            self._file.flush()
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            self._parsed, self._pending = None, []
+            return
+        if self._parsed == (stat.st_mtime_ns, stat.st_size):
+            return
+        data = self.path.read_bytes()
+
+        start = data.rfind(_CHECKPOINT)
+        if start >= 0:
+            end = data.find(b"\n", start)
+            try:
+                checkpoint = json.loads(data[start:end if end >= 0 else len(data)])
+                self._last_seq = max(self._last_seq, checkpoint.get("seq", 0))
+            except ValueError:
+                pass
+            start = end + 1 if end >= 0 else len(data)
+        else:
+            start = 0
+
+        events = []
+        for line in data[start:].splitlines():
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # torn final line from an interrupted append
+            if record.get("type") == "session":
+                event = SessionEvent.from_json(record)
+                self._last_seq = max(self._last_seq, event.seq)
+                events.append(event)
+        self._parsed = (stat.st_mtime_ns, stat.st_size)
+        self._pending = events
@@ -0,0 +1,105 @@
+"""Reading streak and momentum metrics for Polymath Engine.
+
+Implements SPEC-06 §5.2 on top of a day bitmap built from the daily log
+filenames, so no log file has to be parsed.
+"""
+
+import statistics
+from dataclasses import dataclass
+from datetime import date
+from typing import Iterable
+
+
+@dataclass
+class MomentumMetrics:
+    """Reading momentum over a lookback window."""
+
+    current_streak: int = 0
+    rolling_average: float = 0.0  # days read per week
+    trend: str = "insufficient_data"  # accelerating | stable | declining | insufficient_data
+    trend_slope: float = 0.0  # change in days read per week, per week
+    sustainability_score: float = 0.0
+
+
+def build_day_bitmap(log_dates: Iterable[date], today: date) -> bytearray:
+    """Build a bitmap of days with at least one log.
+
+    Args:
+        log_dates: Dates that have a log (duplicates allowed).
+        today: Reference date; future dates are ignored.
+
+    Returns:
+        Bitmap where index i is 1 if there is a log i days before today.
+    """
+    offsets = [(today - d).days for d in log_dates]
+    offsets = [o for o in offsets if o >= 0]
+    bitmap = bytearray(max(offsets) + 1 if offsets else 0)
+    for o in offsets:
+        bitmap[o] = 1
+    return bitmap
+
+
+def _slope(values: list[int]) -> float:
+    """Least-squares slope of values against their index."""
+    n = len(values)
+    mean_x = (n - 1) / 2
+    mean_y = sum(values) / n
+    num = sum((x - mean_x) * (y - mean_y) for x, y in enumerate(values))
+    den = sum((x - mean_x) ** 2 for x in range(n))
+    return num / den if den else 0.0
+
+
+def calculate_momentum(bitmap: bytearray, lookback_days: int = 28) -> MomentumMetrics:
+    """Calculate streak and momentum from a day bitmap.
+
+    The streak allows a missing log for today (it may not be logged yet).
+    Weekly counts are days read per 7-day window, oldest week first, so a
+    positive slope means reading is accelerating.
+
+    Args:
+        bitmap: Day bitmap from build_day_bitmap (index 0 = today).
+        lookback_days: Window for the rolling average and trend.
+
+    Returns:
+        MomentumMetrics for the window.
+    """
+    start = 0 if bitmap[:1] == b"\x01" else 1
+    streak = 0
+    for day in range(start, len(bitmap)):
+        if not bitmap[day]:
+            break
+        streak += 1
+
+    weekly_counts = [
+        sum(bitmap[week_start:week_start + 7])
+        for week_start in range(0, lookback_days, 7)
+    ]
+    weekly_counts.reverse()
+
+    if not weekly_counts:
+        return MomentumMetrics(current_streak=streak)
+
+    rolling_average = sum(weekly_counts) / len(weekly_counts)
+
+    slope = 0.0
+    trend = "insufficient_data"
+    if len(weekly_counts) >= 2:
+        slope = _slope(weekly_counts)
+        if slope > 0.2:
+            trend = "accelerating"
+        elif slope < -0.2:
+            trend = "declining"
+        else:
+            trend = "stable"
+
+    # Lower variance = more sustainable
+    variance = statistics.variance(weekly_counts) if len(weekly_counts) >= 2 else 0
+    sustainability = rolling_average / (1 + variance)
+
+    return MomentumMetrics(
+        current_streak=streak,
+        rolling_average=rolling_average,
+        trend=trend,
+        trend_slope=slope,
+        sustainability_score=sustainability,
+    )
@@ -0,0 +1,470 @@
+"""Durable outbox for Supabase writes.
+
+Vault writes destined for Supabase are queued in a SQLite file inside the
+vault (00-System/.pm-outbox.sqlite) and return immediately. A replay step
+sends the queue in batches, retrying failed batches with exponential
+backoff. Every queued row has an idempotency key, so a batch that reached
+the server but wasn't acknowledged can be re-sent safely:
+
+- domain_progress rows are upserts keyed by domain_id; a newer write for
+  the same domain replaces the queued one.
+- daily_log and book rows carry their key in an `idempotency_key` column
+  with a unique constraint, and are sent as upserts on that key.
+
+A write the server rejects (a 4xx or a constraint/schema error), or one
+that has failed MAX_ATTEMPTS times with the server answering, is moved to
+a dead-letter table so it can't hold up the writes queued after it.
+Connection errors (including httpx's, which supabase-py raises) never
+count as an attempt or dead-letter a write: they say nothing about it.
+"""
+
+import atexit
+import json
+import random
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+OUTBOX_FILENAME = ".pm-outbox.sqlite"
+
+# Retry schedule: BACKOFF_BASE * 2^(attempts - 1) seconds, capped, with jitter
+BACKOFF_BASE = 2.0
+BACKOFF_MAX = 300.0
+
+# Failed attempts (with the server reachable) before a write is dead-lettered
+MAX_ATTEMPTS = 10
+
+# Seconds to let an in-flight background replay finish when the process
+# exits; skipped when the last pass found Supabase unreachable
+EXIT_WAIT = 2.0
+
+# HTTP statuses in the 4xx range that are worth retrying
+_RETRYABLE_STATUSES = {408, 425, 429}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    idempotency_key TEXT NOT NULL UNIQUE,
+    op TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_outbox_due ON outbox(next_attempt_at);
+CREATE TABLE IF NOT EXISTS dead_letters (
+    id INTEGER PRIMARY KEY,
+    idempotency_key TEXT NOT NULL,
+    op TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    attempts INTEGER NOT NULL,
+    last_error TEXT,
+    failed_at REAL NOT NULL
+);
+"""
+
+
+@dataclass
+class OutboxEntry:
+    """A queued write."""
+
+    id: int
+    key: str
+    op: str  # domain_progress | daily_log | book
+    payload: dict
+    attempts: int = 0
+
+
+@dataclass
+class ReplayResult:
+    """Outcome of one replay pass."""
+
+    sent: int = 0
+    failed: int = 0
+    remaining: int = 0
+    dead: int = 0  # Moved to the dead-letter table this pass
+    offline: bool = False  # The pass stopped because Supabase was unreachable
+
+
+def is_connection_error(exc: BaseException) -> bool:
+    """Check whether a send failed without the server answering.
+
+    supabase-py sends requests with httpx, whose network errors
+    (ConnectError, ReadTimeout, ...) derive from httpx.TransportError
+    rather than OSError; they're matched by name so httpx needn't be
+    imported.
+    """
+    if _status(exc) is not None:
+        return False
+    if isinstance(exc, (ConnectionError, TimeoutError, OSError)):
+        return True
+    return any(
+        cls.__name__ == "TransportError" and cls.__module__.startswith("httpx")
+        for cls in type(exc).__mro__
+    )
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Check whether a failed send may succeed if retried unchanged.
+
+    Connection errors and 5xx/408/429 responses are retryable. Other 4xx
+    responses, and PostgREST/Postgres errors for bad data or schema
+    (SQLSTATE classes 22, 23 and 42, PGRST codes), are not.
+    """
+    status = _status(exc)
+    if status is not None:
+        return not 400 <= status < 500 or status in _RETRYABLE_STATUSES
+    code = getattr(exc, "code", None)
+    if isinstance(code, str) and code.startswith(("22", "23", "42", "PGRST")):
+        return False
+    return True
+
+
+def _status(exc: BaseException) -> Optional[int]:
+    """Get the HTTP status a failed request got, if the error carries one."""
+    for obj in (exc, getattr(exc, "response", None)):
+        status = getattr(obj, "status_code", None)
+        if isinstance(status, int):
+            return status
+    return None
+
+
+def backoff_delay(attempts: int) -> float:
+    """Seconds to wait before retrying after `attempts` failures."""
+    delay = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** max(0, attempts - 1))
+    return delay * (0.5 + random.random() / 2)
+
+
+class Outbox:
+    """SQLite-backed queue of pending Supabase writes.
+
+    Instances aren't shared between threads; the background replayer
+    opens its own.
+    """
+
+    def __init__(self, db_path: Path):
+        """Initialize the outbox.
+
+        Args:
+            db_path: Outbox database file.
+        """
+        self.db_path = Path(db_path)
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Open (and if needed, create) the outbox database."""
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, isolation_level=None, timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def enqueue(self, op: str, payloads: list[dict], keys: Optional[list[str]] = None) -> list[str]:
+        """Queue writes.
+
+        Args:
+            op: Write kind (domain_progress, daily_log or book).
+            payloads: Rows to write.
+            keys: Idempotency keys, one per row (default: random). A row
+                with the key of a still-queued row replaces it.
+
+        Returns:
+            The idempotency keys used.
+        """
+        if keys is None:
+            keys = [uuid.uuid4().hex for _ in payloads]
+        now = time.time()
+        conn = self.conn
+        conn.execute("BEGIN")
+        conn.executemany(
+            "INSERT OR REPLACE INTO outbox (idempotency_key, op, payload, next_attempt_at) "
+            "VALUES (?, ?, ?, ?)",
+            [
+                (key, op, json.dumps(payload, default=str), now)
+                for key, payload in zip(keys, payloads)
+            ],
+        )
+        conn.execute("COMMIT")
+        return keys
+
+    def _entries(self, sql: str, params: tuple) -> list[OutboxEntry]:
+        rows = self.conn.execute(
+            "SELECT id, idempotency_key, op, payload, attempts FROM outbox " + sql, params
+        ).fetchall()
+        return [OutboxEntry(r[0], r[1], r[2], json.loads(r[3]), r[4]) for r in rows]
+
+    def pending(self, op: Optional[str] = None) -> list[OutboxEntry]:
+        """Get queued writes in queue order, optionally of one kind."""
+        if op is None:
+            return self._entries("ORDER BY id", ())
+        return self._entries("WHERE op = ? ORDER BY id", (op,))
+
+    def due(self, limit: int, now: Optional[float] = None) -> list[OutboxEntry]:
+        """Get up to `limit` writes whose retry time has come, in queue order."""
+        now = time.time() if now is None else now
+        return self._entries("WHERE next_attempt_at <= ? ORDER BY id LIMIT ?", (now, limit))
+
+    def complete(self, entries: list[OutboxEntry]) -> None:
+        """Drop writes the server acknowledged.
+
+        Matches on row id, so a write re-queued under the same key while
+        its older version was in flight stays queued.
+        """
+        self.conn.executemany("DELETE FROM outbox WHERE id = ?", [(e.id,) for e in entries])
+
+    def fail(
+        self,
+        entries: list[OutboxEntry],
+        error: str,
+        now: Optional[float] = None,
+        count: bool = True,
+    ) -> None:
+        """Schedule the retry of failed writes.
+
+        Args:
+            entries: Writes that failed.
+            error: Error message to record.
+            now: Current time (default: time.time()).
+            count: Count the failure as an attempt; False for connection
+                errors, which say nothing about the write.
+        """
+        now = time.time() if now is None else now
+        self.conn.executemany(
+            "UPDATE outbox SET attempts = attempts + ?, next_attempt_at = ?, last_error = ? "
+            "WHERE id = ?",
+            [(int(count), now + backoff_delay(e.attempts + 1), error, e.id) for e in entries],
+        )
+
+    def bury(self, entries: list[OutboxEntry], error: str, now: Optional[float] = None) -> None:
+        """Move writes that can't succeed to the dead-letter table."""
+        now = time.time() if now is None else now
+        conn = self.conn
+        conn.execute("BEGIN")
+        conn.executemany(
+            "INSERT INTO dead_letters "
+            "(id, idempotency_key, op, payload, attempts, last_error, failed_at) "
+            "SELECT id, idempotency_key, op, payload, attempts + 1, ?, ? FROM outbox WHERE id = ?",
+            [(error, now, e.id) for e in entries],
+        )
+        conn.executemany("DELETE FROM outbox WHERE id = ?", [(e.id,) for e in entries])
+        conn.execute("COMMIT")
+
+    def dead_letters(self) -> list[OutboxEntry]:
+        """Get dead-lettered writes, oldest first."""
+        rows = self.conn.execute(
+            "SELECT id, idempotency_key, op, payload, attempts FROM dead_letters ORDER BY id"
+        ).fetchall()
+        return [OutboxEntry(r[0], r[1], r[2], json.loads(r[3]), r[4]) for r in rows]
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM outbox").fetchone()[0]
+
+
+def _send_progress(client: Any, rows: list[dict]) -> None:
+    if not client.upsert_domain_progress(rows):
+        raise ConnectionError("Supabase unavailable")
+
+
+def _send_logs(client: Any, rows: list[dict]) -> None:
+    client.create_daily_logs(rows)
+
+
+def _send_books(client: Any, rows: list[dict]) -> None:
+    client.create_books(rows)
+
+
+_SENDERS: dict[str, Callable[[Any, list[dict]], None]] = {
+    "domain_progress": _send_progress,
+    "daily_log": _send_logs,
+    "book": _send_books,
+}
+
+
+def send_rows(client: Any, op: str, rows: list[dict]) -> None:
+    """Send rows of one write kind to Supabase, raising if it's unreachable."""
+    if not client.connect():
+        raise ConnectionError("Supabase unavailable")
+    _SENDERS[op](client, rows)
+
+
+def _rows(batch: list[OutboxEntry]) -> list[dict]:
+    """Build the rows to send for a batch of queued writes."""
+    rows = []
+    for e in batch:
+        row = dict(e.payload)
+        if e.op != "domain_progress":
+            row["idempotency_key"] = e.key
+        rows.append(row)
+    return rows
+
+
+def replay_outbox(
+    outbox: Outbox,
+    client: Any,
+    batch_size: int = 500,
+    force: bool = False,
+) -> ReplayResult:
+    """Send due writes to Supabase in batches.
+
+    Consecutive writes of the same kind are sent together. If the server
+    rejects a batch outright, its writes are retried one by one and the
+    rejected ones dead-lettered. Any other failure is rescheduled with
+    backoff (dead-lettered after MAX_ATTEMPTS, unless Supabase was simply
+    unreachable); a connection failure ends the pass.
+
+    Args:
+        outbox: Queue to drain.
+        client: SupabaseClient (or a compatible stand-in).
+        batch_size: Maximum rows per request.
+        force: Also send writes still backing off from a failure.
+
+    Returns:
+        ReplayResult with rows sent, failed, dead-lettered and still queued.
+    """
+    result = ReplayResult()
+    now = float("inf") if force else None
+    while True:
+        entries = outbox.due(batch_size, now)
+        if not entries:
+            break
+
+        end = next((i for i, e in enumerate(entries) if e.op != entries[0].op), len(entries))
+        batch = entries[:end]
+        try:
+            send_rows(client, batch[0].op, _rows(batch))
+        except Exception as exc:
+            if len(batch) > 1 and not is_retryable(exc):
+                # Find the rejected writes by sending the batch row by row
+                if not all(_send_one(outbox, client, entry, result) for entry in batch):
+                    break
+            elif _record_failure(outbox, batch, exc, result):
+                break
+            continue
+        outbox.complete(batch)
+        result.sent += len(batch)
+
+    result.remaining = len(outbox)
+    return result
+
+
+def _send_one(outbox: Outbox, client: Any, entry: OutboxEntry, result: ReplayResult) -> bool:
+    """Send a single queued write, recording the outcome.
+
+    Returns:
+        False if the write was rescheduled (the pass should stop).
+    """
+    try:
+        send_rows(client, entry.op, _rows([entry]))
+    except Exception as exc:
+        return not _record_failure(outbox, [entry], exc, result)
+    outbox.complete([entry])
+    result.sent += 1
+    return True
+
+
+def _record_failure(
+    outbox: Outbox,
+    batch: list[OutboxEntry],
+    exc: Exception,
+    result: ReplayResult,
+) -> bool:
+    """Reschedule or dead-letter a failed batch.
+
+    Returns:
+        True if any write was rescheduled, meaning the server is down or
+        struggling and the pass should stop.
+    """
+    offline = is_connection_error(exc)
+    if offline:
+        result.offline = True
+        dead = []
+    else:
+        dead = [e for e in batch if not is_retryable(exc) or e.attempts + 1 >= MAX_ATTEMPTS]
+    retry = [e for e in batch if e not in dead]
+    if dead:
+        outbox.bury(dead, str(exc))
+        result.dead += len(dead)
+    if retry:
+        outbox.fail(retry, str(exc), count=not offline)
+        result.failed += len(retry)
+    return bool(retry)
+
+
+class OutboxReplayer:
+    """Replays an outbox on a background thread."""
+
+    def __init__(self, db_path: Path, client: Any, batch_size: int = 500):
+        """Initialize the replayer.
+
+        Args:
+            db_path: Outbox database file.
+            client: SupabaseClient to send writes with.
+            batch_size: Maximum rows per request.
+        """
+        self.db_path = Path(db_path)
+        self.client = client
+        self.batch_size = batch_size
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._again = False
+        self._lock = threading.Lock()
+        self._exit_hook = False
+        self._offline = False  # The last pass found Supabase unreachable
+
+    def kick(self) -> None:
+        """Start a replay pass, or schedule another if one is running."""
+        with self._lock:
+            self._again = True
+            if self._running:
+                return
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name="pm-outbox", daemon=True)
+            self._thread.start()
+            if not self._exit_hook:
+                atexit.register(self._wait_at_exit)
+                self._exit_hook = True
+
+    def _run(self) -> None:
+        outbox = Outbox(self.db_path)
+        try:
+            while True:
+                with self._lock:
+                    if not self._again:
+                        self._running = False
+                        return
+                    self._again = False
+                self._offline = replay_outbox(outbox, self.client, self.batch_size).offline
+        except BaseException:
+            with self._lock:
+                self._running = False
+            raise
+        finally:
+            outbox.close()
+
+    def _wait_at_exit(self) -> None:
+        """Give an in-flight pass EXIT_WAIT seconds, unless Supabase is unreachable.
+
+        Anything unsent stays in the outbox for the next run.
+        """
+        thread = self._thread
+        if thread is not None and thread.is_alive() and not self._offline:
+            thread.join(EXIT_WAIT)
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """Wait for the running pass (and any scheduled follow-up) to finish."""
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
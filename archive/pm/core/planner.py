@@ -0,0 +1,132 @@
+"""Reading plan simulation for Polymath Engine.
+
+Runs the traversal engine forward one day at a time, applying each
+recommended read to an in-memory copy of the domain state, so a long
+plan never touches the vault.
+"""
+
+import copy
+from collections import Counter, deque
+from dataclasses import dataclass, replace
+from datetime import date, timedelta
+from typing import Iterable
+
+from pm.core.domain import Domain
+from pm.core.traversal import STATUS_CODES, DomainArrays, TraversalEngine, TraversalPhase
+
+
+@dataclass
+class PlannedRead:
+    """One simulated day of a reading plan."""
+
+    day: int  # 1-based offset from the plan start
+    read_on: date
+    domain_id: str
+    domain_name: str
+    slot: str
+    phase: str
+    reason: str
+    is_distant_interleave: bool = False
+    books_read: int = 0  # After this read
+
+    def to_dict(self) -> dict:
+        """Convert to a JSON-serializable dict."""
+        return {
+            "day": self.day,
+            "date": self.read_on.isoformat(),
+            "domain_id": self.domain_id,
+            "domain_name": self.domain_name,
+            "slot": self.slot,
+            "phase": self.phase,
+            "reason": self.reason,
+            "is_distant_interleave": self.is_distant_interleave,
+            "books_read": self.books_read,
+        }
+
+
+def plan_reading(
+    engine: TraversalEngine,
+    domains: list[Domain],
+    recent_reads: Iterable[tuple[date, str]],
+    start: date,
+    days: int,
+) -> list[PlannedRead]:
+    """Simulate following the engine's recommendation every day.
+
+    Each day's read updates only the state it changes (the domain's
+    progress and the cooldown window), so a step costs one
+    recommendation rather than a vault reload. Days without a
+    recommendation (e.g. the bisociation rest day) are skipped.
+
+    Once every hub is complete, hub completion (and problem-driven,
+    which falls back to it until problems can be loaded) has nothing
+    left to recommend, so the plan moves on to bisociation.
+
+    Args:
+        engine: Engine to plan with, starting in its current phase; it
+            is copied, not modified.
+        domains: All domains from the vault; they are copied, not modified.
+        recent_reads: (date, domain_id) of reads already logged, to seed
+            the cooldown window.
+        start: Date of the first planned day.
+        days: Number of days to plan.
+
+    Returns:
+        The planned reads in date order.
+    """
+    engine = copy.copy(engine)
+    domains = [replace(d) for d in domains]
+    arrays = DomainArrays.from_domains(domains)
+    position = {domain_id: k for k, domain_id in enumerate(arrays.ids)}
+    window = engine.cooldown_days
+
+    # Reads inside the cooldown window, oldest first, and per-domain counts
+    window_reads = deque(sorted(recent_reads))
+    on_cooldown = Counter(domain_id for _, domain_id in window_reads)
+
+    plan = []
+    for offset in range(days):
+        today = start + timedelta(days=offset)
+
+        # Reads from before the window's first day come off cooldown
+        cutoff = today - timedelta(days=window)
+        while window_reads and window_reads[0][0] < cutoff:
+            _, domain_id = window_reads.popleft()
+            on_cooldown[domain_id] -= 1
+            if not on_cooldown[domain_id]:
+                del on_cooldown[domain_id]
+
+        if (
+            engine.current_phase != TraversalPhase.BISOCIATION
+            and engine.check_hub_completion(domains)
+        ):
+            engine.set_phase(TraversalPhase.BISOCIATION)
+
+        top = engine.recommend_top_k(
+            domains, on_cooldown, k=1, week_day=today.weekday(), arrays=arrays
+        )
+        if not top:
+            continue
+        rec = top[0]
+        domain = rec.domain
+        slot = rec.slot
+
+        domain.record_session(today)
+        k = position[domain.domain_id]
+        arrays.books_read[k] = domain.books_read
+        arrays.status[k] = STATUS_CODES[domain.status]
+        window_reads.append((today, domain.domain_id))
+        on_cooldown[domain.domain_id] += 1
+
+        plan.append(PlannedRead(
+            day=offset + 1,
+            read_on=today,
+            domain_id=domain.domain_id,
+            domain_name=domain.domain_name,
+            slot=str(slot),
+            phase=rec.phase.value,
+            reason=rec.reason,
+            is_distant_interleave=rec.is_distant_interleave,
+            books_read=domain.books_read,
+        ))
+    return plan
@@ -0,0 +1,56 @@
+"""Immutable per-invocation view of the vault's domain state."""
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping
+
+from pm.core.domain import Domain, DomainStatus
+
+
+@dataclass(frozen=True)
+class VaultSnapshot:
+    """All domains loaded once, with pre-bucketed views.
+
+    Branch keys are normalized to 2-digit strings ("01"-"15"), since
+    branch_id may be an int or a string depending on where the domain
+    was loaded from.
+    """
+
+    domains: tuple[Domain, ...]
+    by_id: Mapping[str, Domain]
+    by_status: Mapping[DomainStatus, tuple[Domain, ...]]
+    by_branch: Mapping[str, tuple[Domain, ...]]
+    hubs: tuple[Domain, ...]
+    experts: tuple[Domain, ...]
+
+    @classmethod
+    def from_domains(cls, domains: list[Domain]) -> "VaultSnapshot":
+        """Build a snapshot, bucketing the domains in one pass.
+
+        Args:
+            domains: All domains, in load order.
+
+        Returns:
+            VaultSnapshot over the domains.
+        """
+        by_status: dict[DomainStatus, list[Domain]] = {s: [] for s in DomainStatus}
+        by_branch: dict[str, list[Domain]] = {}
+        hubs = []
+        experts = []
+
+        for d in domains:
+            by_status[d.status].append(d)
+            by_branch.setdefault(str(d.branch_id).zfill(2), []).append(d)
+            if d.is_hub:
+                hubs.append(d)
+            if d.is_expert:
+                experts.append(d)
+
+        return cls(
+            domains=tuple(domains),
+            by_id=MappingProxyType({d.domain_id: d for d in domains}),
+            by_status=MappingProxyType({s: tuple(ds) for s, ds in by_status.items()}),
+            by_branch=MappingProxyType({b: tuple(ds) for b, ds in by_branch.items()}),
+            hubs=tuple(hubs),
+            experts=tuple(experts),
+        )
@@ -0,0 +1,530 @@
+"""Storage backends for Polymath Engine's Supabase client.
+
+SupabaseClient talks to its backend through the subset of the supabase-py
+query API described by StorageBackend. Besides the real Supabase client,
+this module provides SqliteBackend: a local SQLite database with the
+polymath schema (domains, domain_progress, daily_logs, books, config,
+branch_distances) and the get_stats() function, so the Supabase code
+paths can run in CI and benchmarks without a server.
+
+Select one with PM_BACKEND (e.g. PM_BACKEND=sqlite:/tmp/polymath.db).
+"""
+
+import json
+import sqlite3
+import threading
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Optional, Protocol
+
+
+class StorageBackend(Protocol):
+    """Query API SupabaseClient needs (a subset of supabase-py's Client)."""
+
+    def schema(self, name: str) -> "StorageBackend":
+        """Select the schema that table() and rpc() refer to."""
+
+    def table(self, name: str) -> Any:
+        """Start a PostgREST-style query builder on a table."""
+
+    def rpc(self, name: str, params: Optional[dict] = None) -> Any:
+        """Start a call to a database function."""
+
+
+# table -> (primary key, {column: type}); BOOLEAN columns come back as bools
+TABLES: dict[str, tuple[tuple[str, ...], dict[str, str]]] = {
+    "domains": (("domain_id",), {
+        "domain_id": "TEXT",
+        "name": "TEXT",
+        "branch_id": "TEXT",
+        "description": "TEXT",
+        "is_hub": "BOOLEAN",
+        "is_expert": "BOOLEAN",
+    }),
+    "domain_progress": (("domain_id",), {
+        "domain_id": "TEXT",
+        "status": "TEXT",
+        "books_read": "INTEGER",
+        "last_read": "TEXT",
+        "updated_at": "TEXT",
+    }),
+    "daily_logs": (("id",), {
+        "id": "INTEGER",
+        "log_date": "TEXT",
+        "domain_id": "TEXT",
+        "function_slot": "TEXT",
+        "pages_read": "INTEGER",
+        "reading_time_minutes": "INTEGER",
+        "phase": "TEXT",
+        "raw_notes": "TEXT",
+        "idempotency_key": "TEXT",
+        "created_at": "TEXT",
+        "updated_at": "TEXT",
+    }),
+    "books": (("id",), {
+        "id": "INTEGER",
+        "title": "TEXT",
+        "author": "TEXT",
+        "year": "INTEGER",
+        "domain_id": "TEXT",
+        "function_slot": "TEXT",
+        "status": "TEXT",
+        "date_started": "TEXT",
+        "date_finished": "TEXT",
+        "rating": "INTEGER",
+        "pages": "INTEGER",
+        "idempotency_key": "TEXT",
+        "created_at": "TEXT",
+    }),
+    "config": (("id",), {
+        "id": "INTEGER",
+    }),
+    "branch_distances": (("branch_a", "branch_b"), {
+        "branch_a": "TEXT",
+        "branch_b": "TEXT",
+        "distance": "INTEGER",
+    }),
+}
+
+# Column holding fields a table has no column for, as JSON
+_EXTRA = "extra"
+
+# Stamped on every write (by triggers, in Postgres)
+_TIMESTAMPED = {"domain_progress", "daily_logs"}
+_CREATED = {"daily_logs", "books"}
+_UNIQUE = {"daily_logs": "idempotency_key", "books": "idempotency_key"}
+
+_GET_STATS = """
+SELECT
+    (SELECT count(*) FROM domains),
+    count(*) FILTER (WHERE status <> 'untouched'),
+    count(*) FILTER (WHERE status = 'surveying'),
+    count(*) FILTER (WHERE status = 'surveyed'),
+    count(*) FILTER (WHERE status = 'deepening'),
+    count(*) FILTER (WHERE status = 'expert'),
+    coalesce(sum(books_read), 0),
+    (SELECT count(*) FROM daily_logs),
+    count(DISTINCT substr(domain_id, 1, instr(domain_id, '.') - 1))
+        FILTER (WHERE status <> 'untouched')
+FROM domain_progress
+"""
+_STATS_FIELDS = (
+    "total_domains",
+    "domains_touched",
+    "domains_surveying",
+    "domains_surveyed",
+    "domains_deepening",
+    "domains_expert",
+    "total_books_read",
+    "total_daily_logs",
+    "branches_touched",
+)
+
+
+class Response:
+    """Query result with the attributes of a postgrest APIResponse."""
+
+    def __init__(self, data: Any, count: Optional[int] = None):
+        self.data = data
+        self.count = count
+
+
+def _split_columns(columns: str) -> list[str]:
+    """Split a select string on top-level commas."""
+    parts, depth, current = [], 0, ""
+    for ch in columns:
+        if ch == "," and depth == 0:
+            parts.append(current.strip())
+            current = ""
+            continue
+        depth += ch == "("
+        depth -= ch == ")"
+        current += ch
+    if current.strip():
+        parts.append(current.strip())
+    return parts
+
+
+def _to_sql(value: Any) -> Any:
+    """Convert a Python value to what SQLite stores."""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    return value
+
+
+class SqliteQuery:
+    """PostgREST-style query builder over one SQLite table."""
+
+    def __init__(self, backend: "SqliteBackend", table: str):
+        if table not in TABLES:
+            raise ValueError(f"unknown table: {table}")
+        self.backend = backend
+        self.table = table
+        self.key, self.types = TABLES[table]
+        self.op = "select"
+        self.columns = "*"
+        self.count: Optional[str] = None
+        self.where: list[tuple[str, list]] = []
+        self.payload: Any = None
+        self.on_conflict: Optional[str] = None
+        self.ignore_duplicates = False
+        self.ordering: Optional[tuple[str, bool]] = None
+        self.row_limit: Optional[int] = None
+        self.row_offset = 0
+        self.single_mode: Optional[str] = None
+
+    # === Builders ===
+
+    def select(self, columns: str = "*", count: Optional[str] = None) -> "SqliteQuery":
+        self.columns = columns
+        self.count = count
+        return self
+
+    def insert(self, rows: Any) -> "SqliteQuery":
+        self.op, self.payload = "insert", rows
+        return self
+
+    def upsert(
+        self,
+        rows: Any,
+        on_conflict: Optional[str] = None,
+        ignore_duplicates: bool = False,
+    ) -> "SqliteQuery":
+        self.op, self.payload, self.on_conflict = "upsert", rows, on_conflict
+        self.ignore_duplicates = ignore_duplicates
+        return self
+
+    def update(self, values: dict) -> "SqliteQuery":
+        self.op, self.payload = "update", values
+        return self
+
+    def delete(self) -> "SqliteQuery":
+        self.op = "delete"
+        return self
+
+    def _filter(self, column: str, sql: str, params: list) -> "SqliteQuery":
+        self._check(column)
+        self.where.append((f'"{column}" {sql}', params))
+        return self
+
+    def eq(self, column: str, value: Any) -> "SqliteQuery":
+        if value is None:
+            return self._filter(column, "IS NULL", [])
+        return self._filter(column, "= ?", [_to_sql(value)])
+
+    def neq(self, column: str, value: Any) -> "SqliteQuery":
+        return self._filter(column, "<> ?", [_to_sql(value)])
+
+    def gt(self, column: str, value: Any) -> "SqliteQuery":
+        return self._filter(column, "> ?", [_to_sql(value)])
+
+    def gte(self, column: str, value: Any) -> "SqliteQuery":
+        return self._filter(column, ">= ?", [_to_sql(value)])
+
+    def lte(self, column: str, value: Any) -> "SqliteQuery":
+        return self._filter(column, "<= ?", [_to_sql(value)])
+
+    def in_(self, column: str, values: list) -> "SqliteQuery":
+        marks = ", ".join("?" * len(values))
+        return self._filter(column, f"IN ({marks})", [_to_sql(v) for v in values])
+
+    def order(self, column: str, desc: bool = False) -> "SqliteQuery":
+        self._check(column)
+        self.ordering = (column, desc)
+        return self
+
+    def limit(self, n: int) -> "SqliteQuery":
+        self.row_limit = n
+        return self
+
+    def range(self, start: int, end: int) -> "SqliteQuery":
+        self.row_offset, self.row_limit = start, end - start + 1
+        return self
+
+    def single(self) -> "SqliteQuery":
+        self.single_mode = "single"
+        return self
+
+    def maybe_single(self) -> "SqliteQuery":
+        self.single_mode = "maybe_single"
+        return self
+
+    # === Execution ===
+
+    def _check(self, column: str) -> None:
+        if column not in self.types:
+            raise ValueError(f"unknown column {self.table}.{column}")
+
+    def _where_sql(self) -> tuple[str, list]:
+        if not self.where:
+            return "", []
+        sql = " WHERE " + " AND ".join(clause for clause, _ in self.where)
+        return sql, [p for _, params in self.where for p in params]
+
+    def execute(self) -> Optional[Response]:
+        with self.backend.lock:
+            conn = self.backend.conn
+            if self.op in ("insert", "upsert"):
+                return Response(self._write_rows(conn))
+            if self.op == "update":
+                return Response(self._update(conn))
+            if self.op == "delete":
+                where, params = self._where_sql()
+                cursor = conn.execute(f'DELETE FROM "{self.table}"{where} RETURNING *', params)
+                rows = [self.backend.decode(self.table, cursor, r) for r in cursor.fetchall()]
+                conn.commit()
+                return Response(rows)
+            return self._select(conn)
+
+    def _write_rows(self, conn: sqlite3.Connection) -> list[dict]:
+        payload = self.payload if isinstance(self.payload, list) else [self.payload]
+        target = tuple(self.on_conflict.split(",")) if self.on_conflict else self.key
+        written = []
+        try:
+            for row in payload:
+                values = self.backend.encode(self.table, row, stamp=True)
+                cols = ", ".join(f'"{c}"' for c in values)
+                marks = ", ".join("?" * len(values))
+                sql = f'INSERT INTO "{self.table}" ({cols}) VALUES ({marks})'
+                if self.op == "upsert":
+                    conflict = ", ".join(f'"{c.strip()}"' for c in target)
+                    updates = [c for c in values if c not in target and c != "created_at"]
+                    if self.ignore_duplicates or not updates:
+                        sql += f" ON CONFLICT ({conflict}) DO NOTHING"
+                    else:
+                        sets = ", ".join(f'"{c}" = excluded."{c}"' for c in updates)
+                        sql += f" ON CONFLICT ({conflict}) DO UPDATE SET {sets}"
+                cursor = conn.execute(sql + " RETURNING *", list(values.values()))
+                written += [self.backend.decode(self.table, cursor, r) for r in cursor.fetchall()]
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
+        return written
+
+    def _update(self, conn: sqlite3.Connection) -> list[dict]:
+        values = self.backend.encode(self.table, self.payload, stamp=True, create=False)
+        sets = ", ".join(f'"{c}" = ?' for c in values)
+        where, params = self._where_sql()
+        cursor = conn.execute(
+            f'UPDATE "{self.table}" SET {sets}{where} RETURNING *', list(values.values()) + params
+        )
+        rows = [self.backend.decode(self.table, cursor, r) for r in cursor.fetchall()]
+        conn.commit()
+        return rows
+
+    def _select(self, conn: sqlite3.Connection) -> Optional[Response]:
+        where, params = self._where_sql()
+        sql = f'SELECT * FROM "{self.table}"{where}'
+        if self.ordering:
+            column, desc = self.ordering
+            sql += f' ORDER BY "{column}" {"DESC" if desc else "ASC"}'
+        if self.row_limit is not None:
+            sql += f" LIMIT {int(self.row_limit)} OFFSET {int(self.row_offset)}"
+        cursor = conn.execute(sql, params)
+        rows = [self.backend.decode(self.table, cursor, r) for r in cursor.fetchall()]
+        data = self._project(conn, rows)
+
+        count = None
+        if self.count:
+            count = conn.execute(
+                f'SELECT count(*) FROM "{self.table}"{where}', params
+            ).fetchone()[0]
+
+        if self.single_mode == "maybe_single":
+            return Response(data[0]) if data else None
+        if self.single_mode == "single":
+            if len(data) != 1:
+                raise ValueError(f"expected one row from {self.table}, got {len(data)}")
+            return Response(data[0])
+        return Response(data, count)
+
+    def _project(self, conn: sqlite3.Connection, rows: list[dict]) -> list[dict]:
+        """Apply the select list, embedding related tables (one query each)."""
+        columns = _split_columns(self.columns)
+        if columns == ["*"]:
+            return rows
+
+        key = self.key[0]
+        keys = [r.get(key) for r in rows]
+        embedded = {}
+        for col in columns:
+            if "(" not in col:
+                continue
+            name = col[:col.index("(")].strip()
+            related_key, _ = TABLES[name]
+            marks = ", ".join("?" * len(keys))
+            cursor = conn.execute(f'SELECT * FROM "{name}" WHERE "{key}" IN ({marks})', keys)
+            by_key: dict = {}
+            for r in cursor.fetchall():
+                decoded = self.backend.decode(name, cursor, r)
+                by_key.setdefault(decoded[key], []).append(decoded)
+            embedded[name] = (by_key, related_key == (key,))
+
+        out = []
+        for row in rows:
+            projected: dict = {}
+            for col in columns:
+                if "(" in col:
+                    name = col[:col.index("(")].strip()
+                    by_key, one_to_one = embedded[name]
+                    related = by_key.get(row.get(key), [])
+                    projected[name] = (related[0] if related else None) if one_to_one else related
+                elif col == "*":
+                    projected.update(row)
+                else:
+                    projected[col] = row.get(col)
+            out.append(projected)
+        return out
+
+
+class SqliteRpc:
+    """Pending call to a database function."""
+
+    def __init__(self, backend: "SqliteBackend", name: str, params: dict):
+        if name != "get_stats":
+            raise ValueError(f"unknown function: {name}")
+        self.backend = backend
+        self.name = name
+        self.params = params
+
+    def execute(self) -> Response:
+        with self.backend.lock:
+            values = self.backend.conn.execute(_GET_STATS).fetchone()
+        return Response(dict(zip(_STATS_FIELDS, values)))
+
+
+class SqliteBackend:
+    """SQLite database with the polymath schema, queried like Supabase.
+
+    Safe to share between threads (the outbox replays on one).
+    """
+
+    def __init__(self, db_path: Path, seed: bool = True):
+        """Open (and if needed, create) the database.
+
+        Args:
+            db_path: Database file (":memory:" for a private in-memory one).
+            seed: Fill an empty database with the domain taxonomy and
+                branch distances, as a provisioned Supabase project has.
+        """
+        self.db_path = db_path
+        self.lock = threading.RLock()
+        self.conn = sqlite3.connect(str(db_path), check_same_thread=False, timeout=10)
+        self._last_stamp = datetime.min.replace(tzinfo=timezone.utc)
+        self._create_schema()
+        if seed and not self.conn.execute("SELECT 1 FROM domains LIMIT 1").fetchone():
+            self.seed()
+
+    def _create_schema(self) -> None:
+        with self.lock:
+            for table, (key, types) in TABLES.items():
+                cols = [
+                    f'"{c}" INTEGER PRIMARY KEY AUTOINCREMENT' if key == (c,) and t == "INTEGER"
+                    else f'"{c}" {t}'
+                    for c, t in types.items()
+                ]
+                cols.append(f'"{_EXTRA}" TEXT')
+                if not (len(key) == 1 and types[key[0]] == "INTEGER"):
+                    cols.append("PRIMARY KEY ({})".format(", ".join(f'"{c}"' for c in key)))
+                self.conn.execute(f'CREATE TABLE IF NOT EXISTS "{table}" ({", ".join(cols)})')
+            for table, column in _UNIQUE.items():
+                self.conn.execute(
+                    f'CREATE UNIQUE INDEX IF NOT EXISTS "idx_{table}_{column}" '
+                    f'ON "{table}"("{column}")'
+                )
+            for table in _TIMESTAMPED:
+                self.conn.execute(
+                    f'CREATE INDEX IF NOT EXISTS "idx_{table}_updated_at" ON "{table}"(updated_at)'
+                )
+            self.conn.commit()
+
+    def seed(self) -> None:
+        """Load the domain taxonomy and branch distances."""
+        from pm.data.distances import _BRANCH_DISTANCES_RAW
+        from pm.data.domains import DOMAINS
+
+        self.table("domains").upsert([
+            {
+                "domain_id": d["domain_id"],
+                "name": d["domain_name"],
+                "branch_id": str(d["branch_id"]).zfill(2),
+                "description": d.get("description", ""),
+                "is_hub": d.get("is_hub", False),
+                "is_expert": d.get("is_expert", False),
+            }
+            for d in DOMAINS
+        ]).execute()
+        self.table("branch_distances").upsert([
+            {"branch_a": a, "branch_b": b, "distance": distance}
+            for (a, b), distance in _BRANCH_DISTANCES_RAW.items()
+        ]).execute()
+
+    def _now(self) -> str:
+        """Current time as an updated_at value, strictly increasing."""
+        stamp = max(datetime.now(timezone.utc), self._last_stamp + timedelta(microseconds=1))
+        self._last_stamp = stamp
+        return stamp.isoformat()
+
+    def encode(self, table: str, row: dict, stamp: bool = False, create: bool = True) -> dict:
+        """Map a row to stored columns, packing unknown columns into `extra`."""
+        _, types = TABLES[table]
+        values = {c: _to_sql(v) for c, v in row.items() if c in types}
+        extra = {c: v for c, v in row.items() if c not in types}
+        if extra:
+            values[_EXTRA] = json.dumps(extra, default=str)
+        for c, t in types.items():
+            if t == "BOOLEAN" and c in values and values[c] is not None:
+                values[c] = int(bool(values[c]))
+        if stamp and table in _TIMESTAMPED:
+            values["updated_at"] = self._now()
+        if stamp and create and table in _CREATED and "created_at" not in values:
+            values["created_at"] = self._now()
+        return values
+
+    def decode(self, table: str, cursor: sqlite3.Cursor, values: tuple) -> dict:
+        """Map a stored row back to the row a client wrote."""
+        _, types = TABLES[table]
+        row = dict(zip((d[0] for d in cursor.description), values))
+        extra = row.pop(_EXTRA, None)
+        for c, t in types.items():
+            if t == "BOOLEAN" and row.get(c) is not None:
+                row[c] = bool(row[c])
+        if extra:
+            row.update(json.loads(extra))
+        return row
+
+    def schema(self, name: str) -> "SqliteBackend":
+        return self
+
+    def table(self, name: str) -> SqliteQuery:
+        return SqliteQuery(self, name)
+
+    def rpc(self, name: str, params: Optional[dict] = None) -> SqliteRpc:
+        return SqliteRpc(self, name, params or {})
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self.lock:
+            self.conn.close()
+
+
+def open_backend(url: str) -> StorageBackend:
+    """Open a backend from a PM_BACKEND value.
+
+    Args:
+        url: "sqlite:<path>" (or "sqlite::memory:").
+
+    Raises:
+        ValueError: For an unsupported scheme.
+    """
+    scheme, _, location = url.partition(":")
+    if scheme == "sqlite" and location:
+        if location != ":memory:":
+            location = location.removeprefix("//")
+            Path(location).expanduser().parent.mkdir(parents=True, exist_ok=True)
+            location = str(Path(location).expanduser())
+        return SqliteBackend(location)
+    raise ValueError(f"unsupported PM_BACKEND: {url!r} (expected sqlite:<path>)")
@@ -5,22 +5,95 @@ Falls back to file-based storage if Supabase is unavailable.
 """
 
 import os
+import time
+from array import array
 from datetime import date
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Iterator, Optional
 
-from dotenv import load_dotenv
+from pm.core.cache import DEFAULT_TTL, MISS, ResponseCache, default_cache_path
+from pm.data.distances import MAX_DISTANCE, build_distance_matrix, matrix_distance
+
+# Rows per request for bulk writes (PostgREST has request body limits)
+DEFAULT_BATCH_SIZE = 500
+
+# Domains with their progress row embedded (domain_progress.domain_id
+# references domains.domain_id), so one request returns both.
+_DOMAINS_WITH_PROGRESS = "*, domain_progress(*)"
+
+
+def _chunks(rows: list[dict], size: int) -> Iterator[list[dict]]:
+    """Split rows into lists of at most `size`."""
+    size = max(1, size)
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+def _merge_progress(row: dict) -> dict:
+    """Flatten an embedded domain_progress row into its domain row."""
+    row = dict(row)
+    progress = row.pop("domain_progress", None)
+    # One-to-one embeds come back as an object, older PostgREST returns a list
+    if isinstance(progress, list):
+        progress = progress[0] if progress else None
+    progress = progress or {}
+    return {
+        **row,
+        "status": progress.get("status", "untouched"),
+        "books_read": progress.get("books_read", 0),
+        "last_read": progress.get("last_read"),
+    }
 
 
 class SupabaseClient:
     """Wrapper for Supabase database operations."""
 
-    def __init__(self, load_env: bool = True):
+    def __init__(
+        self,
+        load_env: bool = True,
+        client: Any = None,
+        cache: Optional[ResponseCache] = None,
+        use_cache: bool = True,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
         """Initialize Supabase client from environment variables.
 
+        Reads are cached in ~/.polymath/cache.json for PM_CACHE_TTL seconds
+        (default 300); writes invalidate the keys they affect.
+
         Args:
             load_env: If True, load .env file. Set False for testing.
+            client: Pre-built client exposing the supabase-py query API
+                (see pm.core.storage.StorageBackend); skips the environment.
+                PM_BACKEND (e.g. sqlite:/tmp/polymath.db) selects a local
+                backend when none is given, even with PM_TESTING set.
+            cache: Response cache to use (default: the on-disk cache, or
+                none when `client` is given).
+            use_cache: If False (or PM_NO_CACHE is set), always fetch; fresh
+                results still refresh the cache.
+            batch_size: Default rows per request for bulk writes
+                (PM_BATCH_SIZE overrides it for the environment client).
         """
+        self.batch_size = batch_size
+        self._cache = cache
+        self._read_cache = use_cache and not os.getenv("PM_NO_CACHE")
+        self.distance_ttl = float(os.getenv("PM_CACHE_TTL", DEFAULT_TTL))
+        self._distances: Optional[array] = None
+        self._distances_expire = 0.0
+
+        if client is None and os.getenv("PM_BACKEND"):
+            from pm.core.storage import open_backend
+
+            client = open_backend(os.environ["PM_BACKEND"])
+
+        if client is not None:
+            self._url = None
+            self._key = None
+            self._schema = "polymath"
+            self._client = client
+            self._connected = True
+            return
+
         # Check for testing mode - if PM_TESTING is set, don't use Supabase
         if os.getenv("PM_TESTING"):
             self._url = None
@@ -32,6 +105,8 @@ class SupabaseClient:
 
         # Load .env if requested and not already loaded
         if load_env:
+            from dotenv import load_dotenv
+
             env_paths = [
                 Path.cwd() / ".env",
                 Path.home() / ".polymath" / "supabase.env",
@@ -46,11 +121,19 @@ class SupabaseClient:
         self._schema = os.getenv("SUPABASE_SCHEMA", "polymath")
         self._client = None
         self._connected = False
+        self.batch_size = int(os.getenv("PM_BATCH_SIZE", batch_size))
+
+        if self._cache is None and self.is_available:
+            self._cache = ResponseCache(
+                default_cache_path(),
+                ttl=float(os.getenv("PM_CACHE_TTL", DEFAULT_TTL)),
+                namespace=f"{self._url}|{self._schema}",
+            )
 
     @property
     def is_available(self) -> bool:
-        """Check if Supabase credentials are configured."""
-        return bool(self._url and self._key)
+        """Check if Supabase credentials are configured (or a client was given)."""
+        return bool(self._url and self._key) or self._client is not None
 
     def connect(self) -> bool:
         """Establish connection to Supabase.
@@ -58,12 +141,12 @@ class SupabaseClient:
         Returns:
             True if connected successfully, False otherwise.
         """
-        if not self.is_available:
-            return False
-
         if self._connected:
             return True
 
+        if not self.is_available:
+            return False
+
         try:
             from supabase import create_client
 
@@ -75,12 +158,52 @@ class SupabaseClient:
             self._connected = False
             return False
 
+    def _cache_get(self, key: str) -> Any:
+        """Get a cached response, or MISS."""
+        if self._cache is None or not self._read_cache:
+            return MISS
+        return self._cache.get(key)
+
+    def _cache_set(self, key: str, value: Any) -> Any:
+        """Cache a fetched response and return it."""
+        if self._cache is not None:
+            self._cache.set(key, value)
+        return value
+
+    def _invalidate(self, keys: Iterable[str] = (), prefixes: Iterable[str] = ()) -> None:
+        """Drop cached responses made stale by a write."""
+        if self._cache is not None:
+            self._cache.invalidate(keys, prefixes)
+
+    def _insert_chunks(self, table: str, rows: list[dict], chunk_size: Optional[int]) -> int:
+        """Insert rows in chunks, returning the number of rows written.
+
+        Rows with an `idempotency_key` (queued by the outbox, or pushed by
+        sync) are sent as upserts on that key, so a retried batch updates
+        the rows it already created instead of duplicating them.
+        """
+        inserted = 0
+        for chunk in _chunks(rows, chunk_size or self.batch_size):
+            if "idempotency_key" in chunk[0]:
+                query = self._table(table).upsert(chunk, on_conflict="idempotency_key")
+            else:
+                query = self._table(table).insert(chunk)
+            result = query.execute()
+            inserted += len(result.data) if result.data else 0
+        return inserted
+
     def _table(self, name: str):
         """Get a table reference with schema prefix."""
         if not self._connected:
             self.connect()
         return self._client.schema(self._schema).table(name)
 
+    def _rpc(self, name: str, params: Optional[dict] = None):
+        """Get a call to a database function in the schema."""
+        if not self._connected:
+            self.connect()
+        return self._client.schema(self._schema).rpc(name, params or {})
+
     # === Domain operations ===
 
     def get_all_domains(self) -> list[dict]:
@@ -88,53 +211,35 @@ class SupabaseClient:
         if not self.connect():
             return []
 
-        # Join domains with domain_progress
-        domains = self._table("domains").select("*").execute()
-        progress = self._table("domain_progress").select("*").execute()
-
-        # Merge progress into domains
-        progress_map = {p["domain_id"]: p for p in progress.data}
-        result = []
-        for d in domains.data:
-            p = progress_map.get(d["domain_id"], {})
-            result.append({
-                **d,
-                "status": p.get("status", "untouched"),
-                "books_read": p.get("books_read", 0),
-                "last_read": p.get("last_read"),
-            })
-        return result
+        cached = self._cache_get("domains")
+        if cached is not MISS:
+            return cached
+
+        domains = self._table("domains").select(_DOMAINS_WITH_PROGRESS).execute()
+        return self._cache_set("domains", [_merge_progress(d) for d in domains.data])
 
     def get_domain(self, domain_id: str) -> Optional[dict]:
         """Get a single domain with progress."""
         if not self.connect():
             return None
 
+        key = f"domain:{domain_id}"
+        cached = self._cache_get(key)
+        if cached is not MISS:
+            return cached
+
         domain = (
             self._table("domains")
-            .select("*")
-            .eq("domain_id", domain_id)
-            .single()
-            .execute()
-        )
-        progress = (
-            self._table("domain_progress")
-            .select("*")
+            .select(_DOMAINS_WITH_PROGRESS)
             .eq("domain_id", domain_id)
             .maybe_single()
             .execute()
         )
 
-        if not domain.data:
+        # supabase-py returns None instead of a response when no row matches
+        if domain is None or not domain.data:
             return None
-
-        p = progress.data or {}
-        return {
-            **domain.data,
-            "status": p.get("status", "untouched"),
-            "books_read": p.get("books_read", 0),
-            "last_read": p.get("last_read"),
-        }
+        return self._cache_set(key, _merge_progress(domain.data))
 
     def update_domain_progress(
         self,
@@ -155,8 +260,35 @@ class SupabaseClient:
         }
 
         self._table("domain_progress").upsert(data).execute()
+        self._invalidate_domains([domain_id])
         return True
 
+    def upsert_domain_progress(
+        self,
+        rows: list[dict],
+        chunk_size: Optional[int] = None,
+    ) -> bool:
+        """Upsert progress for many domains in chunked bulk requests.
+
+        Args:
+            rows: domain_progress rows (domain_id, status, books_read, last_read).
+                If a domain appears more than once, the last row wins.
+            chunk_size: Rows per request (default: batch_size).
+        """
+        if not self.connect():
+            return False
+
+        # A single upsert can't touch the same key twice
+        rows = list({r["domain_id"]: r for r in rows}.values())
+        for chunk in _chunks(rows, chunk_size or self.batch_size):
+            self._table("domain_progress").upsert(chunk).execute()
+        self._invalidate_domains(r["domain_id"] for r in rows)
+        return True
+
+    def _invalidate_domains(self, domain_ids: Iterable[str]) -> None:
+        """Invalidate cached reads affected by a progress write."""
+        self._invalidate(["domains", "stats", *(f"domain:{d}" for d in domain_ids)])
+
     # === Book operations ===
 
     def get_books(self, domain_id: Optional[str] = None) -> list[dict]:
@@ -164,12 +296,17 @@ class SupabaseClient:
         if not self.connect():
             return []
 
+        key = f"books:{domain_id or '*'}"
+        cached = self._cache_get(key)
+        if cached is not MISS:
+            return cached
+
         query = self._table("books").select("*")
         if domain_id:
             query = query.eq("domain_id", domain_id)
 
         result = query.order("created_at", desc=True).execute()
-        return result.data
+        return self._cache_set(key, result.data)
 
     def create_book(self, book_data: dict) -> Optional[dict]:
         """Create a new book record."""
@@ -177,13 +314,44 @@ class SupabaseClient:
             return None
 
         result = self._table("books").insert(book_data).execute()
+        self._invalidate_books([book_data])
         return result.data[0] if result.data else None
 
+    def create_books(self, books_data: list[dict], chunk_size: Optional[int] = None) -> int:
+        """Create many book records in chunked bulk requests.
+
+        Args:
+            books_data: Book rows to insert.
+            chunk_size: Rows per request (default: batch_size).
+
+        Returns:
+            Number of rows inserted.
+        """
+        if not self.connect() or not books_data:
+            return 0
+
+        inserted = self._insert_chunks("books", books_data, chunk_size)
+        self._invalidate_books(books_data)
+        return inserted
+
+    def _invalidate_books(self, books_data: list[dict]) -> None:
+        """Invalidate cached reads affected by new books."""
+        keys = ["books:*", "stats"]
+        for book in books_data:
+            domain_id = book.get("domain_id")
+            keys += [f"books:{domain_id}", f"book:{domain_id}:{book.get('title')}"]
+        self._invalidate(keys)
+
     def get_book_by_title(self, title: str, domain_id: str) -> Optional[dict]:
         """Find a book by title and domain."""
         if not self.connect():
             return None
 
+        key = f"book:{domain_id}:{title}"
+        cached = self._cache_get(key)
+        if cached is not MISS:
+            return cached
+
         result = (
             self._table("books")
             .select("*")
@@ -192,7 +360,7 @@ class SupabaseClient:
             .maybe_single()
             .execute()
         )
-        return result.data
+        return self._cache_set(key, result.data if result else None)
 
     # === Daily log operations ===
 
@@ -204,6 +372,10 @@ class SupabaseClient:
         from datetime import timedelta
 
         since = (date.today() - timedelta(days=days)).isoformat()
+        key = f"logs:recent:{since}"
+        cached = self._cache_get(key)
+        if cached is not MISS:
+            return cached
 
         result = (
             self._table("daily_logs")
@@ -212,13 +384,18 @@ class SupabaseClient:
             .order("log_date", desc=True)
             .execute()
         )
-        return result.data
+        return self._cache_set(key, result.data)
 
     def get_daily_log(self, log_date: date) -> Optional[dict]:
         """Get a daily log by date."""
         if not self.connect():
             return None
 
+        key = f"log:{log_date.isoformat()}"
+        cached = self._cache_get(key)
+        if cached is not MISS:
+            return cached
+
         result = (
             self._table("daily_logs")
             .select("*")
@@ -226,7 +403,7 @@ class SupabaseClient:
             .maybe_single()
             .execute()
         )
-        return result.data
+        return self._cache_set(key, result.data if result else None)
 
     def create_daily_log(self, log_data: dict) -> Optional[dict]:
         """Create a new daily log."""
@@ -234,8 +411,85 @@ class SupabaseClient:
             return None
 
         result = self._table("daily_logs").insert(log_data).execute()
+        self._invalidate_logs([log_data])
         return result.data[0] if result.data else None
 
+    def create_daily_logs(self, logs_data: list[dict], chunk_size: Optional[int] = None) -> int:
+        """Create many daily logs in chunked bulk requests.
+
+        Args:
+            logs_data: Daily log rows to insert.
+            chunk_size: Rows per request (default: batch_size).
+
+        Returns:
+            Number of rows inserted.
+        """
+        if not self.connect() or not logs_data:
+            return 0
+
+        inserted = self._insert_chunks("daily_logs", logs_data, chunk_size)
+        self._invalidate_logs(logs_data)
+        return inserted
+
+    def update_daily_logs(self, logs_data: list[dict], chunk_size: Optional[int] = None) -> int:
+        """Rewrite existing daily logs, matched on id, in chunked bulk upserts.
+
+        Args:
+            logs_data: Complete daily log rows, each with its id.
+            chunk_size: Rows per request (default: batch_size).
+
+        Returns:
+            Number of rows written.
+        """
+        if not self.connect() or not logs_data:
+            return 0
+
+        written = 0
+        for chunk in _chunks(logs_data, chunk_size or self.batch_size):
+            result = self._table("daily_logs").upsert(chunk, on_conflict="id").execute()
+            written += len(result.data) if result.data else 0
+        self._invalidate_logs(logs_data)
+        return written
+
+    def _invalidate_logs(self, logs_data: list[dict]) -> None:
+        """Invalidate cached reads affected by new daily logs."""
+        self._invalidate(
+            ["stats", *(f"log:{log['log_date']}" for log in logs_data)],
+            prefixes=["logs:recent:"],
+        )
+
+    # === Sync ===
+
+    def get_changed_rows(
+        self,
+        table: str,
+        since: Optional[str] = None,
+        page_size: int = 1000,
+    ) -> list[dict]:
+        """Get rows written after a watermark, oldest first (never cached).
+
+        Args:
+            table: domain_progress or daily_logs (tables with updated_at).
+            since: updated_at watermark (None = every row).
+            page_size: Rows per request.
+
+        Returns:
+            Rows with updated_at > since, ordered by updated_at.
+        """
+        if not self.connect():
+            return []
+
+        rows: list[dict] = []
+        while True:
+            query = self._table(table).select("*")
+            if since is not None:
+                query = query.gt("updated_at", since)
+            start = len(rows)
+            page = query.order("updated_at").range(start, start + page_size - 1).execute().data
+            rows.extend(page or [])
+            if not page or len(page) < page_size:
+                return rows
+
     # === Config operations ===
 
     def get_config(self) -> Optional[dict]:
@@ -243,6 +497,10 @@ class SupabaseClient:
         if not self.connect():
             return None
 
+        cached = self._cache_get("config")
+        if cached is not MISS:
+            return cached
+
         result = (
             self._table("config")
             .select("*")
@@ -250,7 +508,7 @@ class SupabaseClient:
             .maybe_single()
             .execute()
         )
-        return result.data
+        return self._cache_set("config", result.data if result else None)
 
     def update_config(self, config_data: dict) -> bool:
         """Update config."""
@@ -259,100 +517,84 @@ class SupabaseClient:
 
         config_data["id"] = 1
         self._table("config").upsert(config_data).execute()
+        self._invalidate(["config"])
         return True
 
     # === Branch distance operations ===
 
-    def get_branch_distance(self, branch_a: str, branch_b: str) -> int:
-        """Get distance between two branches."""
-        if not self.connect():
-            return 4  # Default to max distance
+    def get_distance_matrix(self) -> Optional[array]:
+        """Get the whole branch_distances table as a dense matrix.
 
-        # Try both orderings
-        result = (
-            self._table("branch_distances")
-            .select("distance")
-            .eq("branch_a", branch_a)
-            .eq("branch_b", branch_b)
-            .maybe_single()
-            .execute()
-        )
+        The table is fetched in one request and kept in memory (and in the
+        response cache) for distance_ttl seconds, so lookups are local.
 
-        if result.data:
-            return result.data["distance"]
+        Returns:
+            Matrix as built by build_distance_matrix, or None if unavailable.
+        """
+        now = time.monotonic()
+        if self._distances is not None and now < self._distances_expire:
+            return self._distances
 
-        # Try reverse
-        result = (
-            self._table("branch_distances")
-            .select("distance")
-            .eq("branch_a", branch_b)
-            .eq("branch_b", branch_a)
-            .maybe_single()
-            .execute()
+        if not self.connect():
+            return None
+
+        rows = self._cache_get("branch_distances")
+        if rows is MISS:
+            result = (
+                self._table("branch_distances").select("branch_a, branch_b, distance").execute()
+            )
+            rows = self._cache_set("branch_distances", result.data or [])
+
+        self._distances = build_distance_matrix(
+            (r["branch_a"], r["branch_b"], r["distance"]) for r in rows
         )
+        self._distances_expire = now + self.distance_ttl
+        return self._distances
 
-        return result.data["distance"] if result.data else 4
+    def get_branch_distance(self, branch_a: str, branch_b: str) -> int:
+        """Get distance between two branches (from the preloaded matrix)."""
+        matrix = self.get_distance_matrix()
+        if matrix is None:
+            return MAX_DISTANCE
+        return matrix_distance(matrix, branch_a, branch_b)
 
     # === Statistics ===
 
     def get_stats(self) -> dict:
-        """Get aggregate statistics."""
+        """Get aggregate statistics.
+
+        Computed by the polymath.get_stats() database function, so the
+        response is one small object however much history there is.
+        total_daily_logs is None if the database has no daily_logs table.
+        """
         if not self.connect():
             return {}
 
-        # Domain counts by status
-        progress = self._table("domain_progress").select("status").execute()
-        status_counts = {}
-        for p in progress.data:
-            s = p["status"]
-            status_counts[s] = status_counts.get(s, 0) + 1
-
-        # Total books
-        books = self._table("books").select("id", count="exact").execute()
-
-        # Total logs
-        logs = self._table("daily_logs").select("id", count="exact").execute()
+        cached = self._cache_get("stats")
+        if cached is not MISS:
+            return cached
 
-        # Branches touched
-        domains_with_progress = (
-            self._table("domain_progress")
-            .select("domain_id")
-            .neq("status", "untouched")
-            .execute()
-        )
-        branches = set()
-        for d in domains_with_progress.data:
-            branches.add(d["domain_id"].split(".")[0])
-
-        return {
-            "total_domains": 180,
-            "domains_touched": sum(status_counts.values()),
-            "domains_surveying": status_counts.get("surveying", 0),
-            "domains_surveyed": status_counts.get("surveyed", 0),
-            "domains_deepening": status_counts.get("deepening", 0),
-            "domains_expert": status_counts.get("expert", 0),
-            "total_books_read": books.count if books.count else len(books.data),
-            "total_daily_logs": logs.count if logs.count else len(logs.data),
-            "branches_touched": len(branches),
-        }
+        result = self._rpc("get_stats").execute()
+        return self._cache_set("stats", dict(result.data or {}))
 
 
 # Singleton instance
 _client: Optional[SupabaseClient] = None
 
 
-def get_supabase_client(load_env: bool = True) -> SupabaseClient:
+def get_supabase_client(load_env: bool = True, use_cache: bool = True) -> SupabaseClient:
     """Get the singleton Supabase client instance.
 
     Args:
         load_env: If True, load .env file when creating new client.
+        use_cache: If False, the new client bypasses cached reads.
 
     Returns:
         SupabaseClient instance.
     """
     global _client
     if _client is None:
-        _client = SupabaseClient(load_env=load_env)
+        _client = SupabaseClient(load_env=load_env, use_cache=use_cache)
     return _client
 
 
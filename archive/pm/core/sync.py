@@ -0,0 +1,341 @@
+"""Incremental two-way sync between the vault files and Supabase.
+
+Both sides are read as deltas since the previous sync:
+
+- Supabase: domain_progress and daily_logs rows with updated_at after the
+  last watermark seen.
+- Vault: domain profiles and daily notes modified since the previous sync
+  started (file mtimes); only those are parsed.
+
+A record changed on one side is copied to the other. The fingerprint of
+each record's last synced state is kept in the vault index, so echoes of
+the sync's own writes (and edits that don't touch synced fields) aren't
+transferred again. Records changed on both sides are resolved
+deterministically:
+
+- Domain progress only moves forward, so the two versions are merged:
+  the more advanced status, the larger books_read, the later last_read.
+- A daily note wins over its row, since notes are where logs are edited.
+
+Daily notes and rows are linked by the idempotency key
+daily_log:<note path>. Rows created elsewhere (e.g. the web app) without
+one are pulled into new notes named YYYY-MM-DD-r<id>.md and given that
+note's key. Deletions aren't synced.
+"""
+
+import hashlib
+import json
+import time
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Any, Optional
+
+from pm.core.daily_log import DailyLog
+from pm.core.domain import DomainStatus
+from pm.core.errors import VaultNotFoundError
+from pm.core.index import VaultIndex
+from pm.core.supabase_client import SupabaseClient
+from pm.core.vault import Vault
+from pm.data.domains import DOMAINS, get_domain_by_id
+
+# Index metadata keys holding sync state
+LOCAL_SINCE_KEY = "sync:local_since_ns"
+REMOTE_SINCE_KEY = "sync:remote_since:{table}"
+FINGERPRINT_KEY = "sync:fp:{key}"
+
+LOG_KEY_PREFIX = "daily_log:"
+
+# daily_logs columns the sync compares and copies (see Vault.log_row)
+LOG_FIELDS = (
+    "log_date",
+    "domain_id",
+    "function_slot",
+    "pages_read",
+    "reading_time_minutes",
+    "phase",
+    "raw_notes",
+)
+
+_STATUS_RANK = {status.value: rank for rank, status in enumerate(DomainStatus)}
+
+
+@dataclass
+class SyncResult:
+    """What one sync transferred."""
+
+    domains_pushed: int = 0
+    domains_pulled: int = 0
+    logs_pushed: int = 0
+    logs_pulled: int = 0
+    conflicts: int = 0
+
+
+def _iso(value: Any) -> Optional[str]:
+    """Normalize a date (or ISO string, or empty value) to an ISO date string."""
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)[:10] if value else None
+
+
+def _progress(row: dict) -> dict:
+    """Normalize domain progress from a row or a domain's fields."""
+    return {
+        "status": row.get("status") or "untouched",
+        "books_read": int(row.get("books_read") or 0),
+        "last_read": _iso(row.get("last_read")),
+    }
+
+
+def _log_fields(row: dict) -> dict:
+    """Normalize the synced fields of a daily_logs row."""
+    return {
+        "log_date": _iso(row.get("log_date")),
+        "domain_id": row.get("domain_id") or "",
+        "function_slot": row.get("function_slot") or "",
+        "pages_read": int(row.get("pages_read") or 0),
+        "reading_time_minutes": int(row.get("reading_time_minutes") or 0),
+        "phase": row.get("phase") or "",
+        "raw_notes": (row.get("raw_notes") or "").strip() or None,
+    }
+
+
+def fingerprint(fields: dict) -> str:
+    """Hash normalized record fields."""
+    return hashlib.sha1(json.dumps(fields, sort_keys=True).encode()).hexdigest()
+
+
+def merge_progress(a: dict, b: dict) -> dict:
+    """Merge two versions of a domain's progress, keeping the furthest state."""
+    return {
+        "status": max(a["status"], b["status"], key=lambda s: _STATUS_RANK.get(s, 0)),
+        "books_read": max(a["books_read"], b["books_read"]),
+        "last_read": max(a["last_read"] or "", b["last_read"] or "") or None,
+    }
+
+
+_UNTOUCHED = fingerprint(_progress({}))
+
+
+def _modified_since(path: Path, since_ns: int) -> bool:
+    try:
+        return path.stat().st_mtime_ns >= since_ns
+    except FileNotFoundError:
+        return False
+
+
+class SyncEngine:
+    """Reconciles a vault with Supabase."""
+
+    def __init__(self, vault: Vault, client: SupabaseClient):
+        """Initialize the engine.
+
+        Args:
+            vault: Vault to sync (must be initialized).
+            client: Connected Supabase client.
+        """
+        self.vault = vault
+        self.client = client
+        self._fingerprints: dict[str, str] = {}
+
+    @property
+    def index(self) -> VaultIndex:
+        index = self.vault.index
+        if index is None:
+            raise VaultNotFoundError(self.vault.vault_path)
+        return index
+
+    def run(self) -> SyncResult:
+        """Sync both directions once.
+
+        Pending journal sessions are compacted and the write outbox is
+        flushed first, so the vault files are current. Sync state is saved
+        only after every transfer succeeded; an interrupted sync is simply
+        repeated next time.
+
+        Returns:
+            SyncResult counting the records transferred.
+
+        Raises:
+            ConnectionError: If Supabase can't be reached.
+        """
+        if not self.client.connect():
+            raise ConnectionError("Supabase unavailable")
+        started_ns = time.time_ns()
+        self.vault.compact_journal()
+        self.vault.flush_outbox()
+
+        index = self.index
+        local_since = int(index.get_meta(LOCAL_SINCE_KEY) or 0)
+        result = SyncResult()
+        self._fingerprints = {}
+        watermarks = {
+            "domain_progress": self._sync_domains(local_since, result),
+            "daily_logs": self._sync_logs(local_since, result),
+        }
+
+        with index.batch():
+            for key, value in self._fingerprints.items():
+                index.set_meta(FINGERPRINT_KEY.format(key=key), value)
+            for table, watermark in watermarks.items():
+                if watermark is not None:
+                    index.set_meta(REMOTE_SINCE_KEY.format(table=table), watermark)
+            index.set_meta(LOCAL_SINCE_KEY, str(started_ns))
+        return result
+
+    def _remote_changes(self, table: str) -> tuple[list[dict], Optional[str]]:
+        """Get rows changed since the table's watermark, and the new watermark."""
+        since = self.index.get_meta(REMOTE_SINCE_KEY.format(table=table))
+        rows = self.client.get_changed_rows(table, since)
+        return rows, max((r["updated_at"] for r in rows), default=since)
+
+    def _synced(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        """Get the fingerprint a record had when last synced."""
+        return self.index.get_meta(FINGERPRINT_KEY.format(key=key)) or default
+
+    # === Domain progress ===
+
+    def _sync_domains(self, local_since: int, result: SyncResult) -> Optional[str]:
+        rows, watermark = self._remote_changes("domain_progress")
+        remote = {r["domain_id"]: _progress(r) for r in rows}
+        local = {}
+        for d in DOMAINS:
+            if _modified_since(self.vault.domain_filepath(d["domain_id"]), local_since):
+                domain = self.vault.load_domain_file(d["domain_id"])
+                local[d["domain_id"]] = _progress(
+                    {"status": domain.status.value, "books_read": domain.books_read,
+                     "last_read": domain.last_read}
+                )
+
+        to_files: dict[str, dict] = {}
+        to_remote: dict[str, dict] = {}
+        for domain_id in sorted(local.keys() | remote.keys()):
+            key = f"domain_progress:{domain_id}"
+            # A domain never synced matches an untouched one on either side
+            synced = self._synced(key, _UNTOUCHED)
+            mine, theirs = local.get(domain_id), remote.get(domain_id)
+            mine_fp = fingerprint(mine) if mine else synced
+            theirs_fp = fingerprint(theirs) if theirs else synced
+
+            if mine_fp != synced and theirs_fp != synced and mine_fp != theirs_fp:
+                merged = merge_progress(mine, theirs)
+                result.conflicts += 1
+            elif mine_fp != synced:
+                merged = mine
+            elif theirs_fp != synced:
+                merged = theirs
+            else:
+                continue
+
+            merged_fp = fingerprint(merged)
+            if merged_fp != mine_fp:
+                to_files[domain_id] = merged
+            if merged_fp != theirs_fp:
+                to_remote[domain_id] = merged
+            self._fingerprints[key] = merged_fp
+
+        if to_remote:
+            rows = [{"domain_id": domain_id, **p} for domain_id, p in to_remote.items()]
+            if not self.client.upsert_domain_progress(rows):
+                raise ConnectionError("Supabase unavailable")
+        if to_files:
+            domains = []
+            for domain_id, p in to_files.items():
+                domain = self.vault.load_domain_file(domain_id)
+                domain.status = DomainStatus(p["status"])
+                domain.books_read = p["books_read"]
+                domain.last_read = date.fromisoformat(p["last_read"]) if p["last_read"] else None
+                domains.append(domain)
+            self.vault.write_domain_files(domains)
+
+        result.domains_pushed += len(to_remote)
+        result.domains_pulled += len(to_files)
+        return watermark
+
+    # === Daily logs ===
+
+    def _note_path(self, key: str) -> Optional[Path]:
+        """Get the daily note a key links to, if it's a note in this vault's log folder."""
+        if not key.startswith(LOG_KEY_PREFIX):
+            return None
+        path = self.vault.vault_path / key[len(LOG_KEY_PREFIX):]
+        if path.parent != self.vault.daily_logs_dir or path.suffix != ".md":
+            return None
+        return path
+
+    def _sync_logs(self, local_since: int, result: SyncResult) -> Optional[str]:
+        rows, watermark = self._remote_changes("daily_logs")
+        remote: dict[str, dict] = {}
+        adopted: list[dict] = []
+        for row in rows:
+            key = row.get("idempotency_key") or ""
+            if self._note_path(key) is None:
+                # Created elsewhere: give it a note of its own
+                path = self.vault.daily_logs_dir / f"{_iso(row['log_date'])}-r{row['id']}.md"
+                key = self.vault.log_key(path)
+                adopted.append({
+                    **{k: v for k, v in row.items() if k != "updated_at"},
+                    "idempotency_key": key,
+                })
+            remote[key] = row
+
+        local: dict[str, tuple[Path, DailyLog, str, dict]] = {}
+        for name in self.vault.list_log_filenames():
+            path = self.vault.daily_logs_dir / name
+            if _modified_since(path, local_since):
+                log, content = self.vault.read_log_note(path)
+                local[self.vault.log_key(path)] = (path, log, content, Vault.log_row(log, content))
+
+        to_notes: list[tuple[Path, DailyLog, str]] = []
+        to_remote: list[dict] = []
+        for key in sorted(local.keys() | remote.keys()):
+            synced = self._synced(key)
+            mine = local.get(key)
+            theirs = remote.get(key)
+            mine_fp = fingerprint(_log_fields(mine[3])) if mine else synced
+            theirs_fp = fingerprint(_log_fields(theirs)) if theirs else synced
+
+            if mine_fp != synced:
+                # The note wins, including over a row changed at the same time
+                if theirs is not None and theirs_fp not in (synced, mine_fp):
+                    result.conflicts += 1
+                if mine_fp != theirs_fp:
+                    to_remote.append({**mine[3], "idempotency_key": key})
+                self._fingerprints[key] = mine_fp
+            elif theirs_fp != synced:
+                if theirs_fp != mine_fp:
+                    to_notes.append(self._note_from_row(self._note_path(key), theirs))
+                self._fingerprints[key] = theirs_fp
+
+        if adopted:
+            self.client.update_daily_logs(adopted)
+        if to_remote:
+            self.client.create_daily_logs(to_remote)
+        if to_notes:
+            self.vault.write_log_notes(to_notes)
+
+        result.logs_pushed += len(to_remote)
+        result.logs_pulled += len(to_notes)
+        return watermark
+
+    def _note_from_row(self, path: Path, row: dict) -> tuple[Path, DailyLog, str]:
+        """Build a note for a daily_logs row, keeping the fields rows don't have."""
+        fields = _log_fields(row)
+        if path.exists():
+            log, _ = self.vault.read_log_note(path)
+        else:
+            domain_data = get_domain_by_id(fields["domain_id"]) or {}
+            log = DailyLog(
+                log_date=date.fromisoformat(fields["log_date"]),
+                domain_id=fields["domain_id"],
+                domain_name=domain_data.get("domain_name", ""),
+                book_title="",
+                function_slot="",
+            )
+        log.log_date = date.fromisoformat(fields["log_date"])
+        log.domain_id = fields["domain_id"]
+        log.function_slot = fields["function_slot"]
+        log.pages_read = fields["pages_read"]
+        log.reading_time_minutes = fields["reading_time_minutes"]
+        log.phase = fields["phase"]
+        return path, log, fields["raw_notes"] or ""
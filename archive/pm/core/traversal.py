@@ -3,14 +3,37 @@
 Implements the recommendation logic for what to read next.
 """
 
+import heapq
+from array import array
 from dataclasses import dataclass
 from datetime import date, timedelta
 from enum import Enum
-from typing import Optional
+from itertools import compress
+from typing import Iterable, Iterator, Optional
 
 from pm.config import TraversalConfig
 from pm.core.domain import Domain, DomainStatus, FunctionSlot
-from pm.data.distances import get_branch_distance
+from pm.data.distances import MAX_DISTANCE, NUM_BRANCHES, branch_index, index_distance
+
+# DomainStatus -> small int, in progression order
+STATUS_CODES = {status: code for code, status in enumerate(DomainStatus)}
+_UNTOUCHED = STATUS_CODES[DomainStatus.UNTOUCHED]
+
+# Branch column for branch IDs outside the taxonomy (at MAX_DISTANCE from all)
+UNKNOWN_BRANCH = NUM_BRANCHES
+
+# Strength branch assumed before any domain qualifies (Engineering)
+DEFAULT_STRENGTH_BRANCH = "07"
+
+# Score bonus a distant candidate gets for being untouched (less than one
+# distance step, so it only breaks ties)
+UNTOUCHED_BONUS = 0.5
+
+# Candidate pools (see TraversalEngine.recommend_top_k)
+HUB_POOL = "hub"
+HUB_FALLBACK_POOL = "hub-fallback"
+STRENGTH_POOL = "strength"
+DISTANT_POOL = "distant"
 
 
 class TraversalPhase(Enum):
@@ -32,6 +55,66 @@ class TraversalRecommendation:
     is_distant_interleave: bool = False
     distance_from_strength: int = 0
     priority: int = 0  # Lower is higher priority
+    score: float = 0.0  # Rank within its candidate pool; higher is better
+
+
+@dataclass
+class DomainArrays:
+    """Column view of a domain list, for scoring every domain in one pass.
+
+    Entry k of each column describes domains[k]. Build once with
+    from_domains and reuse while the list is unchanged; books_read and
+    status can be updated in place.
+    """
+
+    domains: list[Domain]
+    ids: list[str]
+    branch: array  # branch_index, or UNKNOWN_BRANCH
+    books_read: array
+    status: array  # STATUS_CODES
+    hub: bytearray
+    expert: bytearray
+    order: array  # rank of the domain_id among all of them
+
+    @classmethod
+    def from_domains(cls, domains: list[Domain]) -> "DomainArrays":
+        """Build the columns for a domain list."""
+        ids = [d.domain_id for d in domains]
+        order = array("i", bytes(4 * len(domains)))
+        for rank, k in enumerate(sorted(range(len(ids)), key=ids.__getitem__)):
+            order[k] = rank
+        return cls(
+            domains=domains,
+            ids=ids,
+            branch=array("b", [
+                UNKNOWN_BRANCH if (i := branch_index(d.branch_id)) < 0 else i for d in domains
+            ]),
+            books_read=array("i", [d.books_read for d in domains]),
+            status=array("b", [STATUS_CODES[d.status] for d in domains]),
+            hub=bytearray(d.is_hub for d in domains),
+            expert=bytearray(d.is_expert for d in domains),
+            order=order,
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+def nearest_distances(branches: Iterable[int]) -> array:
+    """Get each branch's distance to the nearest of some branches.
+
+    Args:
+        branches: Branch indices (UNKNOWN_BRANCH allowed).
+
+    Returns:
+        Array indexed by branch index (plus UNKNOWN_BRANCH): the minimum
+        distance to any of `branches`, MAX_DISTANCE if there are none.
+    """
+    targets = [b for b in set(branches) if b != UNKNOWN_BRANCH]
+    nearest = array("b", [MAX_DISTANCE]) * (NUM_BRANCHES + 1)
+    for b in range(NUM_BRANCHES):
+        nearest[b] = min((index_distance(b, t) for t in targets), default=MAX_DISTANCE)
+    return nearest
 
 
 class TraversalEngine:
@@ -166,53 +249,211 @@ class TraversalEngine:
         self,
         domains: list[Domain],
         recent_domain_ids: list[str],
+        arrays: Optional[DomainArrays] = None,
     ) -> Optional[TraversalRecommendation]:
-        """Find a domain at maximum distance from user's strength areas."""
-        # Get expert/strength branches
-        strength_branches = set()
-        for d in domains:
-            if d.is_expert or d.books_read >= 2:
-                strength_branches.add(d.branch_id)
+        """Find a domain at maximum distance from user's strength areas.
 
-        if not strength_branches:
-            # No strength areas yet, use Engineering (07) as default
-            strength_branches = {"07"}
+        Args:
+            domains: All domains.
+            recent_domain_ids: Domain IDs on cooldown.
+            arrays: Columns for `domains`, if the caller keeps them.
+        """
+        if arrays is None:
+            arrays = DomainArrays.from_domains(domains)
 
-        # Find domains at max distance from all strength branches
-        candidates = []
-        for d in domains:
-            if d.domain_id in recent_domain_ids:
-                continue
+        best = self._best_distant(arrays, recent_domain_ids)
+        if best is None:
+            return None
 
-            # Calculate minimum distance from any strength branch
-            min_distance = min(
-                get_branch_distance(d.branch_id, sb)
-                for sb in strength_branches
-            )
+        k, distance = best
+        domain = arrays.domains[k]
+        return TraversalRecommendation(
+            domain=domain,
+            slot=domain.next_slot(),
+            reason=f"Distant exploration (distance {distance} from your strengths)",
+            phase=self.current_phase,
+            is_distant_interleave=True,
+            distance_from_strength=distance,
+            priority=10,
+        )
 
-            if min_distance >= self.min_distant_distance:
-                # Bonus for untouched domains
-                bonus = 1 if d.status == DomainStatus.UNTOUCHED else 0
-                candidates.append((d, min_distance, bonus))
+    def _distant_distances(
+        self,
+        arrays: DomainArrays,
+        recent: set[str],
+    ) -> tuple[list[int], list[bool]]:
+        """Get every domain's distance from the strength branches, and which qualify.
+
+        Strength branches are those of expert domains or domains with 2+
+        books read. A domain qualifies if it is at least
+        min_distant_distance away and off cooldown.
+        """
+        strength = {
+            b for b, expert, books in zip(arrays.branch, arrays.expert, arrays.books_read)
+            if expert or books >= 2
+        }
+        if not strength:
+            # No strength areas yet, use Engineering as default
+            strength = {branch_index(DEFAULT_STRENGTH_BRANCH)}
+
+        # Distance to the nearest strength branch, per branch then per domain
+        nearest = nearest_distances(strength)
+        distance = [nearest[b] for b in arrays.branch]
+
+        threshold = self.min_distant_distance
+        eligible = [d >= threshold and i not in recent for d, i in zip(distance, arrays.ids)]
+        return distance, eligible
+
+    def _best_distant(
+        self,
+        arrays: DomainArrays,
+        recent_domain_ids: Iterable[str],
+    ) -> Optional[tuple[int, int]]:
+        """Pick the best distant candidate as (position, distance).
 
-        if not candidates:
-            return None
+        The farthest qualifying domain wins, then untouched domains, then
+        the lowest domain_id.
+        """
+        distance, eligible = self._distant_distances(arrays, set(recent_domain_ids))
+        status, order = arrays.status, arrays.order
+        best = max(
+            compress(range(len(arrays)), eligible),
+            key=lambda k: (distance[k], status[k] == _UNTOUCHED, -order[k]),
+            default=None,
+        )
+        return None if best is None else (best, distance[best])
 
-        # Sort by distance desc, then bonus, then domain_id
-        candidates.sort(key=lambda x: (-x[1], -x[2], x[0].domain_id))
+    # === Ranked recommendations ===
 
-        # Pick from top candidates (add some variety)
-        best = candidates[0]
-        domain = best[0]
+    def recommend_top_k(
+        self,
+        domains: list[Domain],
+        recent_domain_ids: list[str],
+        k: int = 5,
+        week_day: int = 0,
+        diverse: bool = False,
+        arrays: Optional[DomainArrays] = None,
+    ) -> list[TraversalRecommendation]:
+        """Get the k best reading recommendations, best first.
+
+        Candidates come from the pools recommend_next draws on for the
+        phase and day (incomplete hubs, strength domains, distant
+        domains), in the order it tries them, so the first result is
+        recommend_next's. A domain in several pools is ranked by the first.
+        Selection is a heap-based partial sort, O(n log k) for n candidates.
+
+        Args:
+            domains: All domains from the vault.
+            recent_domain_ids: Domain IDs read in last N days.
+            k: Number of recommendations.
+            week_day: Day of the week (0=Monday, 6=Sunday).
+            diverse: At most one recommendation per branch, picked greedily
+                (each branch contributes its best candidate).
+            arrays: Columns for `domains`, if the caller keeps them.
+
+        Returns:
+            Up to k recommendations, each with its score and reason.
+        """
+        if k <= 0:
+            return []
+        if arrays is None:
+            arrays = DomainArrays.from_domains(domains)
+        recent = set(recent_domain_ids)
+
+        # position -> (rank key, pool, score); earlier pools win
+        ranked: dict[int, tuple[tuple, str, float]] = {}
+        for rank, pool in enumerate(self._pools(week_day)):
+            for position, score in self._pool_candidates(pool, arrays, recent):
+                if position not in ranked:
+                    ranked[position] = ((rank, -score, arrays.order[position]), pool, score)
+
+        entries = ranked.items()
+        if diverse:
+            per_branch: dict[int, tuple[int, tuple]] = {}
+            for position, entry in entries:
+                branch = arrays.branch[position]
+                if branch not in per_branch or entry[0] < per_branch[branch][1][0]:
+                    per_branch[branch] = (position, entry)
+            entries = per_branch.values()
+
+        top = heapq.nsmallest(k, entries, key=lambda item: item[1][0])
+        return [
+            self._explain(arrays.domains[position], pool, score)
+            for position, (_, pool, score) in top
+        ]
 
+    def _pools(self, week_day: int) -> list[str]:
+        """Candidate pools for a day, in the order recommend_next tries them."""
+        if self.current_phase == TraversalPhase.BISOCIATION:
+            if week_day == 6:
+                return []
+            if week_day < 3:
+                return [STRENGTH_POOL, HUB_FALLBACK_POOL]
+            return [DISTANT_POOL]
+
+        # Problem-driven falls back to hub completion on day 0
+        if self.current_phase == TraversalPhase.PROBLEM_DRIVEN:
+            week_day = 0
+        if week_day == self.distant_interleave_day:
+            return [DISTANT_POOL, HUB_POOL]
+        return [HUB_POOL, DISTANT_POOL]
+
+    def _pool_candidates(
+        self,
+        pool: str,
+        arrays: DomainArrays,
+        recent: set[str],
+    ) -> Iterator[tuple[int, float]]:
+        """Yield (position, score) for every candidate in a pool."""
+        ids, books = arrays.ids, arrays.books_read
+        if pool == DISTANT_POOL:
+            distance, eligible = self._distant_distances(arrays, recent)
+            status = arrays.status
+            for position in compress(range(len(arrays)), eligible):
+                untouched = status[position] == _UNTOUCHED
+                yield position, distance[position] + UNTOUCHED_BONUS * untouched
+            return
+
+        if pool == STRENGTH_POOL:
+            mask = [e or b >= 2 for e, b in zip(arrays.expert, books)]
+        elif pool == HUB_POOL:
+            mask = [h and b < self.books_per_hub for h, b in zip(arrays.hub, books)]
+        else:
+            mask = list(arrays.hub)
+        for position in compress(range(len(arrays)), mask):
+            if ids[position] not in recent:
+                yield position, books[position]
+
+    def _explain(self, domain: Domain, pool: str, score: float) -> TraversalRecommendation:
+        """Build the recommendation for a candidate picked from a pool."""
+        if pool == HUB_POOL:
+            return TraversalRecommendation(
+                domain=domain,
+                slot=domain.next_slot(),
+                reason=self._hub_reason(domain),
+                phase=TraversalPhase.HUB_COMPLETION,
+                priority=0,
+                score=score,
+            )
+        if pool == DISTANT_POOL:
+            distance = int(score)
+            return TraversalRecommendation(
+                domain=domain,
+                slot=domain.next_slot(),
+                reason=f"Distant exploration (distance {distance} from your strengths)",
+                phase=self.current_phase,
+                is_distant_interleave=True,
+                distance_from_strength=distance,
+                priority=10,
+                score=score,
+            )
         return TraversalRecommendation(
             domain=domain,
             slot=domain.next_slot(),
-            reason=f"Distant exploration (distance {best[1]} from your strengths)",
+            reason="Deepening strength area" if domain.is_expert else "Continuing hub completion",
             phase=self.current_phase,
-            is_distant_interleave=True,
-            distance_from_strength=best[1],
-            priority=10,
+            priority=5,
+            score=score,
         )
 
     def _find_strength_domain(
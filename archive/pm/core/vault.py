@@ -4,10 +4,14 @@ Handles all interactions with the Obsidian vault filesystem.
 Optionally uses Supabase as the primary data store.
 """
 
+import os
+import re
+from bisect import bisect_left
+from contextlib import nullcontext
 from dataclasses import dataclass
 from datetime import date, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import ContextManager, Iterator, Optional
 
 import frontmatter
 
@@ -20,8 +24,28 @@ from pm.core.errors import (
     InvalidFrontmatterError,
     VaultNotFoundError,
 )
+from pm.core.frontmatter_reader import read_body
+from pm.core.index import VaultIndex, parse_frontmatter, parse_many
+from pm.core.journal import JOURNAL_FILENAME, SessionEvent, SessionJournal
+from pm.core.momentum import MomentumMetrics, build_day_bitmap, calculate_momentum
+from pm.core.outbox import (
+    OUTBOX_FILENAME,
+    Outbox,
+    OutboxReplayer,
+    ReplayResult,
+    replay_outbox,
+    send_rows,
+)
+from pm.core.snapshot import VaultSnapshot
 from pm.core.supabase_client import get_supabase_client, SupabaseClient
-from pm.data.domains import BRANCHES, DOMAINS, get_domain_by_id
+from pm.data.domains import (
+    BRANCH_NAMES,
+    BRANCHES,
+    DOMAIN_PATHS,
+    DOMAINS,
+    branch_folder,
+    get_domain_by_id,
+)
 from pm.data.templates import (
     BOOK_NOTE_TEMPLATE,
     BRANCH_OVERVIEW_TEMPLATE,
@@ -31,6 +55,17 @@ from pm.data.templates import (
 )
 
 
+# Daily log filenames start with the ISO log date (see DailyLog.filename)
+_LOG_FILENAME = re.compile(r"^\d{4}-\d{2}-\d{2}.*\.md$")
+
+# Files parsed per index transaction when streaming logs
+_LOG_CHUNK_SIZE = 64
+_PARALLEL_LOG_CHUNK_SIZE = 4096
+
+# Pending journal events that trigger compaction into the domain files
+JOURNAL_COMPACT_EVERY = 50
+
+
 @dataclass
 class VaultStats:
     """Statistics about the vault state."""
@@ -45,6 +80,22 @@ class VaultStats:
     total_daily_logs: int = 0
     current_streak: int = 0
     branches_touched: int = 0
+    weekly_average: float = 0.0
+    momentum_trend: str = "insufficient_data"
+    sustainability_score: float = 0.0
+
+
+# VaultStats fields taken as-is from the get_stats() database function
+_SERVER_STAT_FIELDS = (
+    "total_domains",
+    "domains_touched",
+    "domains_surveying",
+    "domains_surveyed",
+    "domains_deepening",
+    "domains_expert",
+    "total_books_read",
+    "branches_touched",
+)
 
 
 class Vault:
@@ -55,40 +106,73 @@ class Vault:
     - Supabase: Uses Supabase database (when configured)
     """
 
-    def __init__(self, vault_path: Path, use_supabase: bool = True):
+    def __init__(
+        self,
+        vault_path: Path,
+        use_supabase: bool = True,
+        workers: int = 1,
+        use_processes: bool = True,
+        journal_sync_every: int = 1,
+        replay_in_background: bool = True,
+    ):
         """Initialize vault manager.
 
         Args:
             vault_path: Path to the Obsidian vault root.
             use_supabase: If True, try to use Supabase; falls back to files if unavailable.
+            workers: Pool size for parsing notes missing from the index; 1 is serial.
+            use_processes: Parse in a process pool rather than a thread pool.
+            journal_sync_every: fsync the session journal every N appends.
+            replay_in_background: Send queued Supabase writes on a background
+                thread; if False, each write waits for its replay.
         """
         self.vault_path = Path(vault_path).expanduser()
+        self.workers = workers
+        self.use_processes = use_processes
+        self.journal_sync_every = journal_sync_every
+        self.replay_in_background = replay_in_background
         self._use_supabase = use_supabase
         self._supabase: Optional[SupabaseClient] = None
+        self._index: Optional[VaultIndex] = None
+        self._journal: Optional[SessionJournal] = None
+        self._outbox: Optional[Outbox] = None
+        self._replayer: Optional[OutboxReplayer] = None
+        self._domain_paths: Optional[dict[str, Path]] = None
+        self._snapshot: Optional[VaultSnapshot] = None
+        self._books_synced_at: Optional[int] = None  # books_dir mtime_ns at the last full check
 
-        if use_supabase:
-            self._supabase = get_supabase_client()
-            if not self._supabase.is_available:
+    @property
+    def supabase(self) -> Optional[SupabaseClient]:
+        """Get the Supabase client, or None if it isn't configured.
+
+        Resolved on first use, so commands that never read or write domain
+        data don't load the environment or the storage backend.
+        """
+        if self._use_supabase and self._supabase is None:
+            client = get_supabase_client()
+            if client.is_available:
+                self._supabase = client
+            else:
                 self._use_supabase = False
-                self._supabase = None
+        return self._supabase if self._use_supabase else None
 
     @property
     def using_supabase(self) -> bool:
         """Check if Supabase is being used."""
-        return self._use_supabase and self._supabase is not None
+        return self.supabase is not None
 
     @classmethod
     def from_config(cls, config: Config, use_supabase: bool = True) -> "Vault":
         """Create Vault from config.
 
         Args:
-            config: Configuration with vault_path.
+            config: Configuration with vault_path and workers.
             use_supabase: If True, try to use Supabase backend.
 
         Returns:
             Vault instance.
         """
-        return cls(config.vault_path, use_supabase=use_supabase)
+        return cls(config.vault_path, use_supabase=use_supabase, workers=config.workers)
 
     def exists(self) -> bool:
         """Check if vault exists."""
@@ -103,6 +187,284 @@ class Vault:
         if not self.exists():
             raise VaultNotFoundError(str(self.vault_path))
 
+    # === Frontmatter index ===
+
+    @property
+    def index(self) -> Optional[VaultIndex]:
+        """Get the sidecar frontmatter index, or None if the vault isn't initialized."""
+        if self._index is None and self.system_dir.exists():
+            self._index = VaultIndex(self.vault_path)
+        return self._index
+
+    def _index_batch(self) -> ContextManager:
+        """Group index writes for a bulk load into one transaction."""
+        index = self.index
+        return index.batch() if index is not None else nullcontext()
+
+    def _read_metadata(self, filepath: Path, kind: str) -> dict:
+        """Read a note's frontmatter, answering from the index when fresh.
+
+        Args:
+            filepath: Markdown file to read.
+            kind: Note kind ("domain", "log" or "book").
+
+        Returns:
+            Frontmatter metadata dict.
+        """
+        index = self.index
+        if index is None:
+            return parse_frontmatter(filepath)
+        return index.metadata(filepath, kind)
+
+    def _read_many(
+        self,
+        filepaths: list[Path],
+        kind: str,
+        skip_errors: tuple[type[Exception], ...] = (),
+    ) -> list[Optional[dict]]:
+        """Read many notes' frontmatter, parsing index misses in parallel.
+
+        Fresh index entries are answered directly; the rest are parsed with
+        parse_many (serially unless `workers` > 1) and stored back.
+
+        Args:
+            filepaths: Markdown files to read.
+            kind: Note kind ("domain", "log" or "book").
+            skip_errors: Parse errors to report as None instead of raising.
+
+        Returns:
+            Metadata dict for each file in order, or None if the file is
+            missing or failed with a skipped error.
+        """
+        index = self.index
+        results: list[Optional[dict]] = [None] * len(filepaths)
+        stats = {}
+        misses = []
+
+        with self._index_batch():
+            for i, filepath in enumerate(filepaths):
+                try:
+                    stat = os.stat(filepath)
+                except FileNotFoundError:
+                    continue
+                cached = index.lookup(filepath, stat) if index is not None else None
+                if cached is not None:
+                    results[i] = cached
+                else:
+                    stats[i] = stat
+                    misses.append(i)
+
+            parsed = parse_many(
+                [filepaths[i] for i in misses],
+                workers=self.workers,
+                use_processes=self.use_processes,
+            )
+            for i, data in zip(misses, parsed):
+                if isinstance(data, Exception):
+                    if isinstance(data, (FileNotFoundError, *skip_errors)):
+                        continue
+                    raise data
+                results[i] = data
+                if index is not None:
+                    index.store(filepaths[i], kind, data, stats[i])
+
+        return results
+
+    def _record_metadata(self, filepath: Path, kind: str, metadata: dict) -> None:
+        """Record metadata for a file just written, so it isn't re-parsed."""
+        index = self.index
+        if index is not None:
+            index.store(filepath, kind, metadata)
+
+    # === Session journal ===
+
+    @property
+    def journal(self) -> Optional[SessionJournal]:
+        """Get the session journal, or None if the vault isn't initialized."""
+        if self._journal is None and self.system_dir.exists():
+            self._journal = SessionJournal(
+                self.system_dir / JOURNAL_FILENAME, sync_every=self.journal_sync_every
+            )
+        return self._journal
+
+    def _pending_sessions(self) -> list[SessionEvent]:
+        """Get journaled sessions not yet compacted into the domain files."""
+        journal = self.journal
+        return journal.pending() if journal is not None else []
+
+    def _journal_head(self) -> int:
+        """Get the sequence number of the newest journaled session."""
+        journal = self.journal
+        return journal.last_seq if journal is not None else 0
+
+    def _replay(self, domains: list[Domain], events: list[SessionEvent]) -> list[Domain]:
+        """Apply journaled sessions on top of compacted domain state.
+
+        Sessions a domain already includes (seq <= its journal_seq) are
+        skipped, so replaying after an interrupted compaction is safe.
+        """
+        by_id = {d.domain_id: d for d in domains}
+        for event in events:
+            domain = by_id.get(event.domain_id)
+            if domain is not None and not 0 < event.seq <= domain.journal_seq:
+                domain.record_session(event.log_date)
+                domain.journal_seq = max(domain.journal_seq, event.seq)
+        return domains
+
+    def log_session(self, log: DailyLog, content: str = "") -> Path:
+        """Log a reading session as a journal append plus a new daily note.
+
+        The note never overwrites an earlier session's note (see
+        save_daily_logs). The domain profile is updated by compact_journal,
+        which runs once JOURNAL_COMPACT_EVERY sessions are pending; until
+        then, domain reads replay the pending sessions. Supabase gets the
+        session's domain_progress and daily_logs rows through the outbox
+        right away.
+
+        Args:
+            log: Session to record.
+            content: Markdown content for the daily note.
+
+        Returns:
+            Path to the daily note.
+        """
+        journal = self.journal
+        if journal is None:
+            # No system directory to journal into; write through
+            filepath = self.save_daily_log(log, content)
+            domain = self.load_domain(log.domain_id)
+            domain.record_session(log.log_date)
+            self.save_domain(domain)
+            return filepath
+
+        domain = self.load_domain(log.domain_id) if self.using_supabase else None
+        filepath = self.daily_logs_dir / self._free_log_filename(
+            log, set(self.list_log_filenames())
+        )
+        self._write_log_file(filepath, log, content)
+        journal.append(
+            SessionEvent(
+                log_date=log.log_date,
+                domain_id=log.domain_id,
+                book_title=log.book_title,
+                function_slot=log.function_slot,
+                pages_read=log.pages_read,
+                reading_time_minutes=log.reading_time_minutes,
+                phase=log.phase,
+                note=filepath.relative_to(self.vault_path).as_posix(),
+            )
+        )
+        self.invalidate()
+
+        if domain is not None:
+            domain.record_session(log.log_date)
+            self._queue_supabase(
+                "domain_progress",
+                [self._progress_row(domain)],
+                [f"domain_progress:{domain.domain_id}"],
+            )
+            self._queue_supabase(
+                "daily_log", [self.log_row(log, content)], [self.log_key(filepath)]
+            )
+
+        if len(journal.pending()) >= JOURNAL_COMPACT_EVERY:
+            self.compact_journal()
+        return filepath
+
+    def compact_journal(self) -> int:
+        """Write pending journaled sessions into the domain files.
+
+        Each touched domain is written once, recording the last session
+        applied to it, then the journal is truncated to a checkpoint. If
+        this is interrupted in between, the next compaction skips the
+        sessions the profiles already include. (Supabase already has the
+        sessions; log_session queues them.)
+
+        Returns:
+            Number of sessions compacted.
+        """
+        events = self._pending_sessions()
+        if not events:
+            return 0
+
+        domains: dict[str, Domain] = {}
+        for event in events:
+            if event.domain_id not in domains:
+                try:
+                    domains[event.domain_id] = self.load_domain_file(event.domain_id)
+                except DomainNotFoundError:
+                    continue
+        self._replay(list(domains.values()), events)
+        self.write_domain_files(list(domains.values()))
+
+        self.journal.checkpoint(max(e.seq for e in events))
+        return len(events)
+
+    # === Supabase outbox ===
+
+    @property
+    def outbox(self) -> Optional[Outbox]:
+        """Get the Supabase write outbox, or None if the vault isn't initialized."""
+        if self._outbox is None and self.system_dir.exists():
+            self._outbox = Outbox(self.system_dir / OUTBOX_FILENAME)
+        return self._outbox
+
+    def _queue_supabase(self, op: str, rows: list[dict], keys: Optional[list[str]] = None) -> None:
+        """Queue writes for Supabase and start sending them.
+
+        The writes land in the outbox and this returns at once; the replay
+        runs in the background (or inline, see replay_in_background). Without
+        an outbox, the rows are sent directly.
+        """
+        if not rows:
+            return
+        outbox = self.outbox
+        if outbox is None:
+            send_rows(self.supabase, op, rows)
+            return
+
+        outbox.enqueue(op, rows, keys)
+        if not self.replay_in_background:
+            replay_outbox(outbox, self.supabase, self.supabase.batch_size)
+            return
+        if self._replayer is None:
+            self._replayer = OutboxReplayer(
+                outbox.db_path, self.supabase, self.supabase.batch_size
+            )
+        self._replayer.kick()
+
+    def flush_outbox(self) -> ReplayResult:
+        """Send every queued Supabase write now, ignoring retry backoff.
+
+        Returns:
+            ReplayResult of the pass (remaining > 0 if Supabase is unreachable).
+        """
+        if self._replayer is not None:
+            self._replayer.wait()
+        outbox = self.outbox
+        if outbox is None:
+            return ReplayResult()
+        if not self.using_supabase:
+            return ReplayResult(remaining=len(outbox))
+        return replay_outbox(outbox, self.supabase, self.supabase.batch_size, force=True)
+
+    def _pending_progress(self) -> dict[str, dict]:
+        """Get queued domain_progress rows not yet sent, by domain ID."""
+        outbox = self.outbox
+        if outbox is None:
+            return {}
+        return {e.payload["domain_id"]: e.payload for e in outbox.pending("domain_progress")}
+
+    @staticmethod
+    def _progress_row(domain: Domain) -> dict:
+        """Build the Supabase domain_progress row for a domain."""
+        return {
+            "domain_id": domain.domain_id,
+            "status": domain.status.value,
+            "books_read": domain.books_read,
+            "last_read": domain.last_read.isoformat() if domain.last_read else None,
+        }
+
     # === Path helpers ===
 
     @property
@@ -155,23 +517,19 @@ class Vault:
 
     def branch_dir(self, branch_id: str) -> Path:
         """Get directory for a branch."""
-        branch_id_str = str(branch_id).zfill(2)
-        branch_id_int = int(branch_id)
-        for b in BRANCHES:
-            if b["branch_id"] == branch_id_int:
-                folder_name = f"{branch_id_str}-{b['branch_name'].replace(' ', '-')}"
-                return self.domains_dir / folder_name
-        return self.domains_dir / f"{branch_id_str}-Unknown"
+        return self.domains_dir / branch_folder(branch_id)
 
     def domain_filepath(self, domain_id: str) -> Path:
         """Get filepath for a domain profile."""
-        branch_id = domain_id.split(".")[0].zfill(2)
-        domain_data = get_domain_by_id(domain_id)
-        if domain_data:
-            filename = f"{domain_id}-{domain_data['domain_name'].replace(' ', '-').replace('/', '-')}.md"
-        else:
-            filename = f"{domain_id}.md"
-        return self.branch_dir(branch_id) / filename
+        if self._domain_paths is None:
+            domains_dir = self.domains_dir
+            self._domain_paths = {
+                domain_id: domains_dir / path for domain_id, path in DOMAIN_PATHS.items()
+            }
+        filepath = self._domain_paths.get(domain_id)
+        if filepath is None:
+            filepath = self.branch_dir(domain_id.split(".")[0]) / f"{domain_id}.md"
+        return filepath
 
     # === Directory creation ===
 
@@ -200,15 +558,15 @@ class Vault:
 
         # Create branch directories
         for branch in BRANCHES:
-            branch_id_str = str(branch["branch_id"]).zfill(2)
-            folder_name = f"{branch_id_str}-{branch['branch_name'].replace(' ', '-')}"
-            (self.domains_dir / folder_name).mkdir(parents=True, exist_ok=True)
+            self.branch_dir(branch["branch_id"]).mkdir(parents=True, exist_ok=True)
 
     # === Domain operations ===
 
     def load_domain(self, domain_id: str) -> Domain:
         """Load a domain from its profile file or Supabase.
 
+        Sessions still pending in the journal are applied on top.
+
         Args:
             domain_id: Domain ID (e.g., "02.04")
 
@@ -218,10 +576,19 @@ class Vault:
         Raises:
             DomainNotFoundError: If domain doesn't exist.
         """
+        domain = self._load_compacted_domain(domain_id)
+        events = [e for e in self._pending_sessions() if e.domain_id == domain_id]
+        self._replay([domain], events)
+        return domain
+
+    def _load_compacted_domain(self, domain_id: str) -> Domain:
+        """Load a domain as last written, without journal replay."""
         # Try Supabase first
         if self.using_supabase:
-            data = self._supabase.get_domain(domain_id)
+            data = self.supabase.get_domain(domain_id)
             if data:
+                # Progress still in the outbox is newer than the server's
+                data = {**data, **self._pending_progress().get(domain_id, {})}
                 return Domain(
                     domain_id=data["domain_id"],
                     domain_name=data["name"],
@@ -233,21 +600,22 @@ class Vault:
                     status=DomainStatus(data.get("status", "untouched")),
                     books_read=data.get("books_read", 0),
                     last_read=date.fromisoformat(data["last_read"]) if data.get("last_read") else None,
+                    # Sessions reach Supabase when logged, so none need replaying
+                    journal_seq=self._journal_head(),
                 )
 
         # Fall back to file
         filepath = self.domain_filepath(domain_id)
-        if not filepath.exists():
+        try:
+            metadata = self._read_metadata(filepath, "domain")
+        except FileNotFoundError:
             raise DomainNotFoundError(domain_id)
 
-        return Domain.from_file(filepath)
+        return Domain.from_metadata(metadata, filepath)
 
     def _get_branch_name(self, branch_id: str) -> str:
         """Get branch name from branch ID."""
-        for b in BRANCHES:
-            if str(b["branch_id"]).zfill(2) == branch_id.zfill(2):
-                return b["branch_name"]
-        return "Unknown"
+        return BRANCH_NAMES.get(str(branch_id).zfill(2), "Unknown")
 
     def save_domain(self, domain: Domain) -> None:
         """Save a domain to Supabase and/or profile file.
@@ -255,16 +623,59 @@ class Vault:
         Args:
             domain: Domain object to save.
         """
-        # Save to Supabase if available
+        # Queue for Supabase if available
         if self.using_supabase:
-            self._supabase.update_domain_progress(
-                domain_id=domain.domain_id,
-                status=domain.status.value,
-                books_read=domain.books_read,
-                last_read=domain.last_read,
+            self._queue_supabase(
+                "domain_progress",
+                [self._progress_row(domain)],
+                [f"domain_progress:{domain.domain_id}"],
             )
 
         # Also save to file for Obsidian compatibility
+        self._write_domain_file(domain)
+        self.invalidate()
+
+    def save_domains(self, domains: list[Domain]) -> None:
+        """Save many domains with one Supabase upsert and one index transaction.
+
+        Args:
+            domains: Domain objects to save (each written once).
+        """
+        if self.using_supabase:
+            self._queue_supabase(
+                "domain_progress",
+                [self._progress_row(d) for d in domains],
+                [f"domain_progress:{d.domain_id}" for d in domains],
+            )
+
+        with self._index_batch():
+            for domain in domains:
+                self._write_domain_file(domain)
+        self.invalidate()
+
+    def load_domain_file(self, domain_id: str) -> Domain:
+        """Load a domain from its profile alone (no Supabase, no journal replay).
+
+        A domain without a profile yet is returned untouched.
+        """
+        filepath = self.domain_filepath(domain_id)
+        try:
+            return Domain.from_metadata(self._read_metadata(filepath, "domain"), filepath)
+        except FileNotFoundError:
+            domain_data = get_domain_by_id(domain_id)
+            if domain_data is None:
+                raise DomainNotFoundError(domain_id)
+            return self._default_domain(domain_data)
+
+    def write_domain_files(self, domains: list[Domain]) -> None:
+        """Write domain profiles in one index transaction, without touching Supabase."""
+        with self._index_batch():
+            for domain in domains:
+                self._write_domain_file(domain)
+        self.invalidate()
+
+    def _write_domain_file(self, domain: Domain) -> None:
+        """Write a domain's frontmatter to its profile, preserving the body."""
         filepath = self.domain_filepath(domain.domain_id)
 
         # Load existing file to preserve content
@@ -277,10 +688,32 @@ class Vault:
         post.metadata.update(domain.to_frontmatter())
         post.metadata["date_modified"] = date.today().isoformat()
 
-        # Write back
+        # Write back atomically, so journal_seq never disagrees with the progress
         filepath.parent.mkdir(parents=True, exist_ok=True)
-        with open(filepath, "w") as f:
+        tmp = filepath.with_suffix(".tmp")
+        with open(tmp, "w") as f:
             f.write(frontmatter.dumps(post))
+        os.replace(tmp, filepath)
+        self._record_metadata(filepath, "domain", post.metadata)
+
+    # === Snapshot ===
+
+    def snapshot(self) -> VaultSnapshot:
+        """Get the domain snapshot, loading it on first use.
+
+        The snapshot is shared by every read in this Vault's lifetime
+        (one command run) until a write invalidates it.
+
+        Returns:
+            VaultSnapshot of all domains.
+        """
+        if self._snapshot is None:
+            self._snapshot = VaultSnapshot.from_domains(self._load_domains())
+        return self._snapshot
+
+    def invalidate(self) -> None:
+        """Drop the cached snapshot so the next read reloads domains."""
+        self._snapshot = None
 
     def load_all_domains(self) -> list[Domain]:
         """Load all domains from Supabase or the vault.
@@ -288,48 +721,69 @@ class Vault:
         Returns:
             List of Domain objects.
         """
+        return list(self.snapshot().domains)
+
+    def _load_domains(self) -> list[Domain]:
+        """Load all domains, bypassing the snapshot, with journal replay."""
+        return self._replay(self._load_compacted_domains(), self._pending_sessions())
+
+    @staticmethod
+    def _default_domain(domain_data: dict) -> Domain:
+        """Build an untouched domain from the taxonomy data."""
+        return Domain(
+            domain_id=domain_data["domain_id"],
+            domain_name=domain_data["domain_name"],
+            branch_id=domain_data["branch_id"],
+            branch_name=domain_data["branch_name"],
+            description=domain_data.get("description", ""),
+            is_hub=domain_data.get("is_hub", False),
+            is_expert=domain_data.get("is_expert", False),
+        )
+
+    def _load_compacted_domains(self) -> list[Domain]:
+        """Load all domains from Supabase or the vault, without journal replay."""
         # Try Supabase first
         if self.using_supabase:
-            data_list = self._supabase.get_all_domains()
+            data_list = self.supabase.get_all_domains()
             if data_list:
-                domains = []
-                for data in data_list:
-                    domains.append(
-                        Domain(
-                            domain_id=data["domain_id"],
-                            domain_name=data["name"],
-                            branch_id=int(data["branch_id"]),
-                            branch_name=self._get_branch_name(data["branch_id"]),
-                            description=data.get("description", ""),
-                            is_hub=data.get("is_hub", False),
-                            is_expert=data.get("is_expert", False),
-                            status=DomainStatus(data.get("status", "untouched")),
-                            books_read=data.get("books_read", 0),
-                            last_read=date.fromisoformat(data["last_read"]) if data.get("last_read") else None,
-                        )
-                    )
-                return domains
+                return self._domains_from_rows(data_list)
 
         # Fall back to file-based loading
+        filepaths = [self.domain_filepath(d["domain_id"]) for d in DOMAINS]
         domains = []
-        for domain_data in DOMAINS:
-            domain_id = domain_data["domain_id"]
-            try:
-                domain = self.load_domain(domain_id)
-                domains.append(domain)
-            except DomainNotFoundError:
+        for domain_data, filepath, metadata in zip(
+            DOMAINS, filepaths, self._read_many(filepaths, "domain")
+        ):
+            if metadata is None:
                 # Domain file doesn't exist yet, create from data
-                domains.append(
-                    Domain(
-                        domain_id=domain_id,
-                        domain_name=domain_data["domain_name"],
-                        branch_id=domain_data["branch_id"],
-                        branch_name=domain_data["branch_name"],
-                        description=domain_data.get("description", ""),
-                        is_hub=domain_data.get("is_hub", False),
-                        is_expert=domain_data.get("is_expert", False),
-                    )
+                domains.append(self._default_domain(domain_data))
+                continue
+            domains.append(Domain.from_metadata(metadata, filepath))
+        return domains
+
+    def _domains_from_rows(self, data_list: list[dict]) -> list[Domain]:
+        """Build domains from Supabase rows, overlaid with queued progress."""
+        pending = self._pending_progress()
+        # Sessions reach Supabase when logged, so none need replaying
+        journal_seq = self._journal_head()
+        domains = []
+        for data in data_list:
+            data = {**data, **pending.get(data["domain_id"], {})}
+            domains.append(
+                Domain(
+                    domain_id=data["domain_id"],
+                    domain_name=data["name"],
+                    branch_id=int(data["branch_id"]),
+                    branch_name=self._get_branch_name(data["branch_id"]),
+                    description=data.get("description", ""),
+                    is_hub=data.get("is_hub", False),
+                    is_expert=data.get("is_expert", False),
+                    status=DomainStatus(data.get("status", "untouched")),
+                    books_read=data.get("books_read", 0),
+                    last_read=date.fromisoformat(data["last_read"]) if data.get("last_read") else None,
+                    journal_seq=journal_seq,
                 )
+            )
         return domains
 
     def get_domains_by_status(self, status: DomainStatus) -> list[Domain]:
@@ -341,8 +795,7 @@ class Vault:
         Returns:
             List of matching Domain objects.
         """
-        all_domains = self.load_all_domains()
-        return [d for d in all_domains if d.status == status]
+        return list(self.snapshot().by_status[status])
 
     def get_hub_domains(self) -> list[Domain]:
         """Get all hub domains.
@@ -350,8 +803,7 @@ class Vault:
         Returns:
             List of hub Domain objects.
         """
-        all_domains = self.load_all_domains()
-        return [d for d in all_domains if d.is_hub]
+        return list(self.snapshot().hubs)
 
     def get_expert_domains(self) -> list[Domain]:
         """Get all expert domains (user's areas of expertise).
@@ -359,8 +811,7 @@ class Vault:
         Returns:
             List of expert Domain objects.
         """
-        all_domains = self.load_all_domains()
-        return [d for d in all_domains if d.is_expert]
+        return list(self.snapshot().experts)
 
     # === Daily log operations ===
 
@@ -375,9 +826,11 @@ class Vault:
         """
         filename = f"{log_date.isoformat()}.md"
         filepath = self.daily_logs_dir / filename
-        if not filepath.exists():
+        try:
+            metadata = self._read_metadata(filepath, "log")
+        except FileNotFoundError:
             return None
-        return DailyLog.from_file(filepath)
+        return DailyLog.from_metadata(metadata, filepath)
 
     def save_daily_log(self, log: DailyLog, content: str = "") -> Path:
         """Save a daily log to Supabase and/or file.
@@ -389,21 +842,93 @@ class Vault:
         Returns:
             Path to the saved file.
         """
-        # Save to Supabase if available
+        filepath = self.daily_logs_dir / log.filename
+
+        # Queue for Supabase if available
         if self.using_supabase:
-            log_data = {
-                "log_date": log.log_date.isoformat(),
-                "domain_id": log.domain_id,
-                "function_slot": log.function_slot,
-                "pages_read": log.pages_read,
-                "reading_time_minutes": log.reading_time_minutes,
-                "phase": log.phase,
-                "raw_notes": content if content else None,
-            }
-            self._supabase.create_daily_log(log_data)
+            self._queue_supabase(
+                "daily_log", [self.log_row(log, content)], [self.log_key(filepath)]
+            )
 
         # Also save to file for Obsidian compatibility
-        filepath = self.daily_logs_dir / log.filename
+        self._write_log_file(filepath, log, content)
+        return filepath
+
+    def save_daily_logs(self, entries: list[tuple[DailyLog, str]]) -> list[Path]:
+        """Save many daily logs, batching the Supabase insert and index writes.
+
+        Unlike save_daily_log, existing notes are never overwritten: extra
+        sessions on the same day are written as YYYY-MM-DD-2.md, -3.md, ...
+
+        Args:
+            entries: (log, markdown content) pairs.
+
+        Returns:
+            Paths of the saved files, in the order given.
+        """
+        taken = set(self.list_log_filenames())
+        paths = []
+        with self._index_batch():
+            for log, content in entries:
+                name = self._free_log_filename(log, taken)
+                taken.add(name)
+
+                filepath = self.daily_logs_dir / name
+                self._write_log_file(filepath, log, content)
+                paths.append(filepath)
+
+        if self.using_supabase:
+            self._queue_supabase(
+                "daily_log",
+                [self.log_row(log, content) for log, content in entries],
+                [self.log_key(path) for path in paths],
+            )
+        return paths
+
+    @staticmethod
+    def _free_log_filename(log: DailyLog, taken: set[str]) -> str:
+        """Pick YYYY-MM-DD.md, or the first free YYYY-MM-DD-N.md suffix."""
+        name = log.filename
+        n = 1
+        while name in taken:
+            n += 1
+            name = f"{log.log_date.isoformat()}-{n}.md"
+        return name
+
+    @staticmethod
+    def log_row(log: DailyLog, content: str) -> dict:
+        """Build the Supabase daily_logs row for a log."""
+        return {
+            "log_date": log.log_date.isoformat(),
+            "domain_id": log.domain_id,
+            "function_slot": log.function_slot,
+            "pages_read": log.pages_read,
+            "reading_time_minutes": log.reading_time_minutes,
+            "phase": log.phase,
+            "raw_notes": content if content else None,
+        }
+
+    def log_key(self, filepath: Path) -> str:
+        """Get the idempotency key linking a daily note to its Supabase row."""
+        return f"daily_log:{Path(filepath).relative_to(self.vault_path).as_posix()}"
+
+    def read_log_note(self, filepath: Path) -> tuple[DailyLog, str]:
+        """Read a daily note's log and markdown body."""
+        metadata = self._read_metadata(filepath, "log")
+        return DailyLog.from_metadata(metadata, filepath), read_body(filepath)
+
+    def write_log_notes(self, entries: list[tuple[Path, DailyLog, str]]) -> None:
+        """Write daily notes in one index transaction, without touching Supabase.
+
+        Args:
+            entries: (path, log, markdown content) triples.
+        """
+        with self._index_batch():
+            for filepath, log, content in entries:
+                self._write_log_file(filepath, log, content)
+
+    def _write_log_file(self, filepath: Path, log: DailyLog, content: str) -> None:
+        """Write a daily log note and record its metadata in the index."""
         self.daily_logs_dir.mkdir(parents=True, exist_ok=True)
 
         post = frontmatter.Post(content)
@@ -411,8 +936,60 @@ class Vault:
 
         with open(filepath, "w") as f:
             f.write(frontmatter.dumps(post))
+        self._record_metadata(filepath, "log", post.metadata)
 
-        return filepath
+    def list_log_filenames(self) -> list[str]:
+        """List daily log filenames in date order.
+
+        Only names starting with an ISO date are included, so the listing
+        can be range-searched by date without parsing any file.
+
+        Returns:
+            Sorted list of filenames.
+        """
+        try:
+            names = os.listdir(self.daily_logs_dir)
+        except FileNotFoundError:
+            return []
+        return sorted(n for n in names if _LOG_FILENAME.match(n))
+
+    def iter_logs(
+        self,
+        since: Optional[date] = None,
+        until: Optional[date] = None,
+    ) -> Iterator[DailyLog]:
+        """Lazily yield daily logs within a date range, oldest first.
+
+        Files are selected by filename with a binary search over the sorted
+        listing; only the files inside the range are parsed.
+
+        Args:
+            since: First date to include (default: earliest log).
+            until: Last date to include (default: latest log).
+
+        Yields:
+            DailyLog objects in ascending date order.
+        """
+        names = self.list_log_filenames()
+        lo = bisect_left(names, since.isoformat()) if since else 0
+        hi = bisect_left(names, (until + timedelta(days=1)).isoformat()) if until else len(names)
+
+        # Bigger chunks when parsing in a pool, so each one fills the workers
+        chunk_size = _LOG_CHUNK_SIZE if self.workers <= 1 else _PARALLEL_LOG_CHUNK_SIZE
+        for start in range(lo, hi, chunk_size):
+            end = min(start + chunk_size, hi)
+            filepaths = [self.daily_logs_dir / name for name in names[start:end]]
+            chunk = []
+            for filepath, metadata in zip(
+                filepaths, self._read_many(filepaths, "log", skip_errors=(ValueError,))
+            ):
+                if metadata is None:
+                    continue
+                try:
+                    chunk.append(DailyLog.from_metadata(metadata, filepath))
+                except (ValueError, KeyError):
+                    continue
+            yield from chunk
 
     def load_recent_logs(self, days: int = 30) -> list[DailyLog]:
         """Load recent daily logs.
@@ -423,17 +1000,33 @@ class Vault:
         Returns:
             List of DailyLog objects, sorted by date descending.
         """
-        logs = []
-        for filepath in self.daily_logs_dir.glob("*.md"):
+        logs = list(self.iter_logs(since=date.today() - timedelta(days=days)))
+        logs.reverse()
+        return logs
+
+    def _log_day_bitmap(self, filenames: list[str]) -> bytearray:
+        """Build a day bitmap (index 0 = today) from log filenames."""
+        log_dates = []
+        for name in filenames:
             try:
-                log = DailyLog.from_file(filepath)
-                if log.log_date >= date.today() - timedelta(days=days):
-                    logs.append(log)
-            except (ValueError, KeyError):
+                log_dates.append(date.fromisoformat(name[:10]))
+            except ValueError:
                 continue
+        return build_day_bitmap(log_dates, date.today())
 
-        logs.sort(key=lambda x: x.log_date, reverse=True)
-        return logs
+    def calculate_momentum(self, lookback_days: int = 28) -> MomentumMetrics:
+        """Calculate streak and momentum metrics (SPEC-06 §5.2).
+
+        Uses one directory listing; no log file is parsed.
+
+        Args:
+            lookback_days: Window for the rolling weekly average and trend.
+
+        Returns:
+            MomentumMetrics for the window.
+        """
+        bitmap = self._log_day_bitmap(self.list_log_filenames())
+        return calculate_momentum(bitmap, lookback_days)
 
     def calculate_streak(self) -> int:
         """Calculate current reading streak.
@@ -441,23 +1034,93 @@ class Vault:
         Returns:
             Number of consecutive days with logs.
         """
-        streak = 0
-        current = date.today()
+        return self.calculate_momentum().current_streak
 
-        while True:
-            log = self.load_daily_log(current)
-            if log is None:
-                # Allow for one gap if today has no log yet
-                if current == date.today():
-                    current = current - timedelta(days=1)
-                    continue
-                break
-            streak += 1
-            current = current - timedelta(days=1)
+    # === Book operations ===
 
-        return streak
+    def _books_dir_mtime(self) -> int:
+        """Get the books directory's mtime_ns (-1 if it doesn't exist)."""
+        try:
+            return os.stat(self.books_dir).st_mtime_ns
+        except FileNotFoundError:
+            return -1
 
-    # === Book operations ===
+    def refresh_books(self) -> None:
+        """Re-check every book note against the index on the next lookup."""
+        self._books_synced_at = None
+
+    def _sync_book_index(self) -> Optional[VaultIndex]:
+        """Bring the book index up to date with the books directory.
+
+        The first lookup in a Vault's lifetime (one command run) compares
+        every note's (mtime_ns, size) with the index in one scandir pass,
+        so notes added, removed or edited in place since the last run are
+        caught; only changed notes are parsed. Later lookups stat just the
+        directory, which catches notes added or removed meanwhile; edits
+        in place during the run need refresh_books().
+
+        Returns:
+            The index, or None if the vault has no index.
+        """
+        index = self.index
+        if index is None:
+            return None
+
+        dir_mtime = self._books_dir_mtime()
+        if dir_mtime == self._books_synced_at:
+            return index
+
+        try:
+            with os.scandir(self.books_dir) as entries:
+                current = {
+                    Path(e.path): (st.st_mtime_ns, st.st_size)
+                    for e in entries
+                    if e.name.endswith(".md") and e.is_file()
+                    for st in (e.stat(),)
+                }
+        except FileNotFoundError:
+            current = {}
+        indexed = index.file_stats("book")
+
+        changed = sorted(path for path, stat in current.items() if indexed.get(path) != stat)
+        if changed or not indexed.keys() <= current.keys():
+            with index.batch():
+                self._read_many(changed, "book", skip_errors=(ValueError,))
+                index.prune("book")
+        self._books_synced_at = dir_mtime
+        return index
+
+    def _find_books(self, **criteria: Optional[str]) -> list[Book]:
+        """Find books whose fields equal all non-None criteria.
+
+        Args:
+            **criteria: author, title, domain_id and/or function_slot.
+
+        Returns:
+            Matching Book objects, sorted by file path.
+        """
+        wanted = {k: v for k, v in criteria.items() if v is not None}
+        index = self._sync_book_index()
+
+        if index is None:
+            candidates = sorted(self.books_dir.glob("*.md"))
+        else:
+            candidates = index.find_books(**wanted)
+
+        books = []
+        for filepath, metadata in zip(
+            candidates, self._read_many(candidates, "book", skip_errors=(ValueError,))
+        ):
+            if metadata is None:
+                continue
+            try:
+                book = Book.from_metadata(metadata, filepath)
+            except (ValueError, KeyError):
+                continue
+            # Re-check: the note may have been edited since it was indexed
+            if all(getattr(book, k) == v for k, v in wanted.items()):
+                books.append(book)
+        return books
 
     def load_book(self, author: str, title: str) -> Optional[Book]:
         """Load a book by author and title.
@@ -469,15 +1132,8 @@ class Vault:
         Returns:
             Book object or None if not found.
         """
-        # Try to find matching file
-        for filepath in self.books_dir.glob("*.md"):
-            try:
-                book = Book.from_file(filepath)
-                if book.author == author and book.title == title:
-                    return book
-            except (ValueError, KeyError):
-                continue
-        return None
+        books = self._find_books(author=author, title=title)
+        return books[0] if books else None
 
     def save_book(self, book: Book, content: str = "") -> Path:
         """Save a book note.
@@ -489,82 +1145,175 @@ class Vault:
         Returns:
             Path to the saved file.
         """
-        filepath = self.books_dir / book.filename
+        return self.save_books([(book, content)])[0]
+
+    def save_books(self, entries: list[tuple[Book, str]]) -> list[Path]:
+        """Save book notes in one index transaction.
+
+        Books whose note didn't exist yet are also queued for Supabase
+        (see _queue_supabase).
+
+        Args:
+            entries: (book, markdown content) pairs.
+
+        Returns:
+            Paths to the saved files, in the order given.
+        """
         self.books_dir.mkdir(parents=True, exist_ok=True)
+        index = self._sync_book_index()
 
-        post = frontmatter.Post(content)
-        post.metadata = book.to_frontmatter()
+        paths = []
+        new_books = []
+        with self._index_batch():
+            for book, content in entries:
+                filepath = self.books_dir / book.filename
+                if not filepath.exists():
+                    new_books.append(book)
 
-        with open(filepath, "w") as f:
-            f.write(frontmatter.dumps(post))
+                post = frontmatter.Post(content)
+                post.metadata = book.to_frontmatter()
 
-        return filepath
+                with open(filepath, "w") as f:
+                    f.write(frontmatter.dumps(post))
+                paths.append(filepath)
+
+                # Update the book index incrementally instead of re-parsing on next lookup
+                if index is not None:
+                    index.store(filepath, "book", post.metadata)
+
+        # The index already has the new notes; don't rescan for them
+        if index is not None:
+            self._books_synced_at = self._books_dir_mtime()
 
-    def list_books(self, domain_id: Optional[str] = None) -> list[Book]:
-        """List all books, optionally filtered by domain.
+        if self.using_supabase:
+            self._queue_supabase("book", [self._book_row(b) for b in new_books])
+
+        return paths
+
+    @staticmethod
+    def _book_row(book: Book) -> dict:
+        """Build the Supabase books row for a book."""
+        return {
+            "title": book.title,
+            "author": book.author,
+            "year": book.year,
+            "domain_id": book.domain_id,
+            "function_slot": book.function_slot,
+            "status": book.status,
+            "date_started": book.date_started.isoformat() if book.date_started else None,
+            "date_finished": book.date_finished.isoformat() if book.date_finished else None,
+            "rating": book.rating,
+            "pages": book.pages,
+        }
+
+    def list_books(
+        self,
+        domain_id: Optional[str] = None,
+        function_slot: Optional[str] = None,
+    ) -> list[Book]:
+        """List all books, optionally filtered by domain and/or function slot.
 
         Args:
             domain_id: Optional domain ID to filter by.
+            function_slot: Optional function slot to filter by.
 
         Returns:
             List of Book objects.
         """
-        books = []
-        for filepath in self.books_dir.glob("*.md"):
-            try:
-                book = Book.from_file(filepath)
-                if domain_id is None or book.domain_id == domain_id:
-                    books.append(book)
-            except (ValueError, KeyError):
-                continue
-        return books
+        return self._find_books(domain_id=domain_id, function_slot=function_slot)
 
     # === Statistics ===
 
-    def get_stats(self) -> VaultStats:
+    def get_stats(self, with_domains: bool = False) -> VaultStats:
         """Calculate vault statistics.
 
+        With Supabase, the counts come from the get_stats() database
+        function in one request; they are computed locally instead while
+        progress is still queued in the outbox, or if the call returns
+        nothing.
+
+        Args:
+            with_domains: Also load the domains (concurrently with the
+                stats call), for callers that go on to show them.
+
         Returns:
             VaultStats object with current metrics.
         """
         stats = VaultStats()
+        server_stats = self._fetch_server_stats(with_domains) if self.using_supabase else None
 
-        # Load all domains and count statuses
-        domains = self.load_all_domains()
-        stats.total_domains = len(domains)
+        if server_stats and not self._pending_progress():
+            for name in _SERVER_STAT_FIELDS:
+                setattr(stats, name, server_stats[name])
+        else:
+            self._count_domain_stats(stats)
+
+        # Count daily logs and derive streak/momentum from the same listing;
+        # the server's count also includes sessions logged in the web app,
+        # and is NULL if the database has no daily_logs table
+        log_filenames = self.list_log_filenames()
+        stats.total_daily_logs = len(log_filenames)
+        if server_stats and server_stats.get("total_daily_logs") is not None:
+            stats.total_daily_logs = server_stats["total_daily_logs"]
+
+        momentum = calculate_momentum(self._log_day_bitmap(log_filenames))
+        stats.current_streak = momentum.current_streak
+        stats.weekly_average = momentum.rolling_average
+        stats.momentum_trend = momentum.trend
+        stats.sustainability_score = momentum.sustainability_score
 
-        branches_with_activity = set()
+        return stats
 
-        for d in domains:
-            if d.status == DomainStatus.SURVEYING:
-                stats.domains_surveying += 1
-                stats.domains_touched += 1
-                branches_with_activity.add(d.branch_id)
-            elif d.status == DomainStatus.SURVEYED:
-                stats.domains_surveyed += 1
-                stats.domains_touched += 1
-                branches_with_activity.add(d.branch_id)
-            elif d.status == DomainStatus.DEEPENING:
-                stats.domains_deepening += 1
-                stats.domains_touched += 1
-                branches_with_activity.add(d.branch_id)
-            elif d.status == DomainStatus.EXPERT:
-                stats.domains_expert += 1
-                stats.domains_touched += 1
-                branches_with_activity.add(d.branch_id)
-
-            stats.total_books_read += d.books_read
+    def _count_domain_stats(self, stats: VaultStats) -> None:
+        """Fill in the domain and book counts from the local snapshot."""
+        snapshot = self.snapshot()
+        stats.total_domains = len(snapshot.domains)
+
+        by_status = snapshot.by_status
+        stats.domains_surveying = len(by_status[DomainStatus.SURVEYING])
+        stats.domains_surveyed = len(by_status[DomainStatus.SURVEYED])
+        stats.domains_deepening = len(by_status[DomainStatus.DEEPENING])
+        stats.domains_expert = len(by_status[DomainStatus.EXPERT])
+        stats.domains_touched = (
+            stats.domains_surveying
+            + stats.domains_surveyed
+            + stats.domains_deepening
+            + stats.domains_expert
+        )
 
+        branches_with_activity = set()
+        for status in (
+            DomainStatus.SURVEYING,
+            DomainStatus.SURVEYED,
+            DomainStatus.DEEPENING,
+            DomainStatus.EXPERT,
+        ):
+            branches_with_activity.update(d.branch_id for d in by_status[status])
+
+        stats.total_books_read = sum(d.books_read for d in snapshot.domains)
         stats.branches_touched = len(branches_with_activity)
 
-        # Count daily logs
-        if self.daily_logs_dir.exists():
-            stats.total_daily_logs = len(list(self.daily_logs_dir.glob("*.md")))
+    def _fetch_server_stats(self, with_domains: bool) -> Optional[dict]:
+        """Call get_stats() on Supabase, fetching the domains alongside if asked.
 
-        # Calculate streak
-        stats.current_streak = self.calculate_streak()
+        The domains seed the snapshot, so a caller that needs both makes
+        its two independent requests in one round-trip time.
 
-        return stats
+        Returns:
+            The get_stats() result (empty if Supabase is unreachable).
+        """
+        from pm.core.async_client import run_concurrently
+
+        if not with_domains or self._snapshot is not None:
+            return self.supabase.get_stats()
+        results = run_concurrently(
+            self.supabase, domains=("get_all_domains",), stats=("get_stats",)
+        )
+        if results["domains"]:
+            self._snapshot = VaultSnapshot.from_domains(
+                self._replay(self._domains_from_rows(results["domains"]), self._pending_sessions())
+            )
+        return results["stats"]
 
     # === Initialization helpers ===
 
@@ -583,18 +1332,15 @@ class Vault:
             if filepath.exists():
                 continue
 
-            # Get branch info for folder name
             branch_id = domain_data["branch_id"]
-            branch_name = domain_data["branch_name"]
-            branch_folder = f"{branch_id}-{branch_name.replace(' ', '-')}"
 
             # Format template
             content = DOMAIN_PROFILE_TEMPLATE.format(
                 domain_id=domain_data["domain_id"],
                 domain_name=domain_data["domain_name"],
                 branch_id=branch_id,
-                branch_name=branch_name,
-                branch_folder=branch_folder,
+                branch_name=domain_data["branch_name"],
+                branch_folder=branch_folder(branch_id),
                 description=domain_data.get("description", ""),
                 is_hub=str(domain_data.get("is_hub", False)).lower(),
                 is_expert=str(domain_data.get("is_expert", False)).lower(),
@@ -621,8 +1367,8 @@ class Vault:
             branch_id = branch["branch_id"]
             branch_id_str = str(branch_id).zfill(2)
             branch_name = branch["branch_name"]
-            branch_folder = f"{branch_id_str}-{branch_name.replace(' ', '-')}"
-            branch_dir = self.domains_dir / branch_folder
+            folder = branch_folder(branch_id)
+            branch_dir = self.domains_dir / folder
             filepath = branch_dir / "_Branch-Overview.md"
 
             if filepath.exists():
@@ -636,7 +1382,7 @@ class Vault:
             content = BRANCH_OVERVIEW_TEMPLATE.format(
                 branch_id=branch_id_str,
                 branch_name=branch_name,
-                branch_folder=branch_folder,
+                branch_folder=folder,
                 domain_count=domain_count,
                 description=branch.get("description", ""),
             )
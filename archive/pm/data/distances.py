@@ -10,7 +10,14 @@ Distance scale:
 Matrix is symmetric.
 """
 
-from typing import Tuple
+from array import array
+from typing import Iterable, Tuple
+
+NUM_BRANCHES = 15
+MAX_DISTANCE = 4
+
+# Distance removed per isomorphism two domains share (SPEC-06 section 2.2)
+ISOMORPHISM_REDUCTION = 0.5
 
 # Distance matrix stored as dict with branch pairs as keys
 # Only upper triangle stored; lookup function handles symmetry
@@ -153,30 +160,100 @@ _BRANCH_DISTANCES_RAW = {
 }
 
 
-def get_branch_distance(branch_a: str, branch_b: str) -> int:
-    """Get distance between two branches.
+def _build_branch_index() -> dict:
+    """Map every accepted spelling of a branch ID to its matrix index."""
+    index: dict = {}
+    for n in range(1, NUM_BRANCHES + 1):
+        index[f"{n:02d}"] = index[str(n)] = index[n] = n - 1
+    return index
+
+
+_BRANCH_INDEX = _build_branch_index()
+
+
+def branch_index(branch_id: str | int) -> int:
+    """Get a branch's 0-based matrix index.
 
     Args:
-        branch_a: Branch ID (e.g., "01", "02", "15")
-        branch_b: Branch ID (e.g., "01", "02", "15")
+        branch_id: Branch ID ("01".."15", "1".."15" or an int).
 
     Returns:
-        Distance 0-4 between the branches.
+        Index 0..NUM_BRANCHES - 1, or -1 for an unknown branch.
+    """
+    index = _BRANCH_INDEX.get(branch_id)
+    if index is not None:
+        return index
+    try:
+        n = int(branch_id) - 1
+    except (TypeError, ValueError):
+        return -1
+    return n if 0 <= n < NUM_BRANCHES else -1
+
+
+def build_distance_matrix(pairs: Iterable[tuple]) -> array:
+    """Build a dense, symmetric branch distance matrix.
+
+    The matrix is a flat array of signed bytes: the distance between
+    branches with indices i and j (see branch_index) is at
+    i * NUM_BRANCHES + j. Pairs not given are at MAX_DISTANCE.
+
+    Args:
+        pairs: (branch_a, branch_b, distance) triples; branch IDs as
+            "01".."15" or ints, each unordered pair given once or twice.
+
+    Returns:
+        NUM_BRANCHES * NUM_BRANCHES array.
+    """
+    matrix = array("b", [MAX_DISTANCE]) * (NUM_BRANCHES * NUM_BRANCHES)
+    for branch_a, branch_b, distance in pairs:
+        i, j = branch_index(branch_a), branch_index(branch_b)
+        if i >= 0 and j >= 0:
+            matrix[i * NUM_BRANCHES + j] = matrix[j * NUM_BRANCHES + i] = distance
+    return matrix
+
+
+# Dense form of the table above, for O(1) lookups
+BRANCH_DISTANCE_MATRIX = build_distance_matrix(
+    (a, b, d) for (a, b), d in _BRANCH_DISTANCES_RAW.items()
+)
+
+
+def index_distance(i: int, j: int) -> int:
+    """Get the distance between two branches by matrix index.
+
+    The fast path for hot loops: callers convert branch IDs with
+    branch_index once, and no validation is done here.
+    """
+    return BRANCH_DISTANCE_MATRIX[i * NUM_BRANCHES + j]
+
+
+def matrix_distance(matrix: array, branch_a: str | int, branch_b: str | int) -> int:
+    """Look up two branches in a distance matrix (see build_distance_matrix).
+
+    Unknown branch IDs are at MAX_DISTANCE.
     """
-    # Normalize branch IDs to 2-digit strings (handle both int and str inputs)
-    a = str(branch_a).zfill(2)
-    b = str(branch_b).zfill(2)
+    i, j = _BRANCH_INDEX.get(branch_a), _BRANCH_INDEX.get(branch_b)
+    if i is None or j is None:
+        i, j = branch_index(branch_a), branch_index(branch_b)
+        if i < 0 or j < 0:
+            return MAX_DISTANCE
+    return matrix[i * NUM_BRANCHES + j]
 
-    # Try direct lookup
-    if (a, b) in _BRANCH_DISTANCES_RAW:
-        return _BRANCH_DISTANCES_RAW[(a, b)]
 
-    # Try reverse (matrix is symmetric)
-    if (b, a) in _BRANCH_DISTANCES_RAW:
-        return _BRANCH_DISTANCES_RAW[(b, a)]
+def get_branch_distance(branch_a: str, branch_b: str) -> int:
+    """Get distance between two branches.
 
-    # Default to maximum distance if not found
-    return 4
+    Args:
+        branch_a: Branch ID (e.g., "01", "02", "15"; ints work too)
+        branch_b: Branch ID (e.g., "01", "02", "15"; ints work too)
+
+    Returns:
+        Distance 0-4 between the branches.
+    """
+    i, j = _BRANCH_INDEX.get(branch_a), _BRANCH_INDEX.get(branch_b)
+    if i is None or j is None:
+        return matrix_distance(BRANCH_DISTANCE_MATRIX, branch_a, branch_b)
+    return BRANCH_DISTANCE_MATRIX[i * NUM_BRANCHES + j]
 
 
 def get_domain_distance(
@@ -200,7 +277,7 @@ def get_domain_distance(
     base_distance = get_branch_distance(branch_a, branch_b)
 
     # Shared isomorphisms reduce distance (each reduces by 0.5)
-    adjusted = base_distance - (0.5 * shared_isomorphisms)
+    adjusted = base_distance - (ISOMORPHISM_REDUCTION * shared_isomorphisms)
 
     return max(0.0, adjusted)
 
@@ -221,14 +298,17 @@ def find_distant_domains(
         List of (domain_id, distance) tuples for domains meeting threshold.
     """
     results = []
-    from_branch = from_domain_id.split(".")[0]
+    from_index = branch_index(from_domain_id.split(".")[0])
 
     for domain_id in all_domain_ids:
         if domain_id == from_domain_id:
             continue
 
-        to_branch = domain_id.split(".")[0]
-        distance = get_branch_distance(from_branch, to_branch)
+        to_index = branch_index(domain_id.split(".")[0])
+        if from_index < 0 or to_index < 0:
+            distance = MAX_DISTANCE
+        else:
+            distance = index_distance(from_index, to_index)
 
         if distance >= min_distance:
             results.append((domain_id, distance))
@@ -258,22 +338,3 @@ def get_max_distant_branches(from_branch: str) -> list[str]:
 
     return max_distant
 
-
-# Branch metadata for reference
-BRANCH_NAMES = {
-    "01": "Physical Sciences",
-    "02": "Life Sciences",
-    "03": "Formal Sciences",
-    "04": "Mind Sciences",
-    "05": "Social Sciences",
-    "06": "Humanities",
-    "07": "Engineering",
-    "08": "Health Medicine",
-    "09": "Business Management",
-    "10": "Education",
-    "11": "Arts Design Communication",
-    "12": "Law Public Admin",
-    "13": "Agriculture Environment",
-    "14": "Trades Applied Tech",
-    "15": "Religion Theology",
-}
@@ -280,12 +280,38 @@ DOMAINS: List[DomainData] = [
 ]
 
 
+# Lookup tables, built once at import
+
+DOMAINS_BY_ID: Dict[str, DomainData] = {d["domain_id"]: d for d in DOMAINS}
+
+# Branch ID ("01"-"15") -> branch name, and -> folder under 02-Domains
+BRANCH_NAMES: Dict[str, str] = {
+    str(b["branch_id"]).zfill(2): b["branch_name"] for b in BRANCHES
+}
+BRANCH_FOLDERS: Dict[str, str] = {
+    branch_id: f"{branch_id}-{name.replace(' ', '-')}"
+    for branch_id, name in BRANCH_NAMES.items()
+}
+
+# Domain ID -> profile path relative to 02-Domains
+DOMAIN_PATHS: Dict[str, str] = {
+    d["domain_id"]: (
+        f"{BRANCH_FOLDERS[str(d['branch_id']).zfill(2)]}/"
+        f"{d['domain_id']}-{d['domain_name'].replace(' ', '-').replace('/', '-')}.md"
+    )
+    for d in DOMAINS
+}
+
+
+def branch_folder(branch_id: int | str) -> str:
+    """Get the folder name for a branch (e.g., "01-Physical-Sciences")."""
+    branch_id = str(branch_id).zfill(2)
+    return BRANCH_FOLDERS.get(branch_id, f"{branch_id}-Unknown")
+
+
 def get_domain_by_id(domain_id: str) -> DomainData | None:
     """Get a domain by its ID."""
-    for domain in DOMAINS:
-        if domain["domain_id"] == domain_id:
-            return domain
-    return None
+    return DOMAINS_BY_ID.get(domain_id)
 
 
 def get_domains_by_branch(branch_id: int) -> List[DomainData]:
@@ -6,7 +6,11 @@ from pathlib import Path
 import pytest
 
 from pm.config import Config, TraversalConfig, UserConfig
+from pm.core import index as index_module
+from pm.core import vault as vault_module
+from pm.core.supabase_client import SupabaseClient
 from pm.core.vault import Vault
+from tests.fake_supabase import FakeSupabase
 
 
 @pytest.fixture
@@ -51,3 +55,40 @@ def initialized_vault(mock_vault_path):
 def vault(mock_vault_path):
     """Create a basic vault instance."""
     return Vault(mock_vault_path)
+
+
+@pytest.fixture
+def parse_counter(monkeypatch):
+    """Record files parsed on index misses."""
+    calls = []
+    original = index_module.parse_frontmatter
+
+    def counting_parse(filepath):
+        calls.append(filepath)
+        return original(filepath)
+
+    monkeypatch.setattr(index_module, "parse_frontmatter", counting_parse)
+    return calls
+
+
+@pytest.fixture
+def fake_supabase():
+    """In-memory Supabase backend seeded with the domain taxonomy."""
+    return FakeSupabase()
+
+
+@pytest.fixture
+def client(fake_supabase):
+    """SupabaseClient backed by the in-memory server."""
+    return SupabaseClient(client=fake_supabase, batch_size=2)
+
+
+@pytest.fixture
+def supabase_vault(initialized_vault, client, monkeypatch):
+    """Initialized vault writing to the in-memory server.
+
+    Its outbox is replayed inline, so writes have reached the server when
+    the call returns.
+    """
+    monkeypatch.setattr(vault_module, "get_supabase_client", lambda: client)
+    return Vault(initialized_vault.vault_path, replay_in_background=False)
@@ -0,0 +1,91 @@
+"""In-memory stand-in for the supabase-py client, for tests.
+
+A thin wrapper over SqliteBackend(":memory:"), so tests run the same
+query code as PM_BACKEND=sqlite. It records every executed request so
+tests can assert on round trips, and can simulate latency and outages.
+"""
+
+import time
+from typing import Any, Callable, Optional
+
+from pm.core.storage import SqliteBackend
+
+
+class RecordedRequest:
+    """Query builder or function call whose execution is recorded."""
+
+    def __init__(self, db: "FakeSupabase", request: Any, name: str):
+        self.db = db
+        self.request = request
+        self.name = name
+
+    def __getattr__(self, attr: str) -> Callable[..., "RecordedRequest"]:
+        build = getattr(self.request, attr)
+
+        def chain(*args, **kwargs) -> "RecordedRequest":
+            build(*args, **kwargs)
+            return self
+
+        return chain
+
+    def execute(self) -> Any:
+        self.db.requests.append((self.name, getattr(self.request, "op", "rpc")))
+        self.db.delay()
+        if self.db.failures:
+            self.db.failures -= 1
+            raise ConnectionError("fake Supabase is down")
+        return self.request.execute()
+
+
+class FakeSupabase:
+    """In-memory Supabase backend with a request log."""
+
+    def __init__(self, tables: Optional[dict[str, list[dict]]] = None):
+        """Initialize the backend, seeded with the domain taxonomy.
+
+        Args:
+            tables: Initial rows per table name (replacing any seeded rows).
+        """
+        self.backend = SqliteBackend(":memory:")
+        self.requests: list[tuple[str, str]] = []
+        self.failures = 0  # upcoming requests that fail with ConnectionError
+        self.latency = 0.0  # seconds each request takes
+        self.on_request: Optional[Callable[[], None]] = None  # called as a request starts
+        for name, rows in (tables or {}).items():
+            self.put(name, rows)
+
+    def rows(self, table: str) -> list[dict]:
+        """Get a table's rows, without recording a request."""
+        return self.backend.table(table).select("*").execute().data
+
+    def put(self, table: str, rows: list[dict]) -> None:
+        """Replace a table's rows, without recording a request."""
+        self.backend.table(table).delete().execute()
+        if rows:
+            self.backend.table(table).insert(rows).execute()
+
+    def delay(self) -> None:
+        """Simulate the round trip of one request."""
+        if self.on_request is not None:
+            self.on_request()
+        if self.latency:
+            time.sleep(self.latency)
+
+    def schema(self, name: str) -> "FakeSupabase":
+        return self
+
+    def table(self, name: str) -> RecordedRequest:
+        return RecordedRequest(self, self.backend.table(name), name)
+
+    def rpc(self, name: str, params: Optional[dict] = None) -> RecordedRequest:
+        return RecordedRequest(self, self.backend.rpc(name, params), name)
+
+
+def log_row(day: int = 1, **fields) -> dict:
+    """Build a daily_logs row for 2024-01-<day>."""
+    return {
+        "log_date": f"2024-01-{day:02d}",
+        "domain_id": "01.02",
+        "function_slot": "FND",
+        **fields,
+    }
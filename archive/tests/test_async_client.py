@@ -0,0 +1,68 @@
+"""Tests for the asyncio Supabase client."""
+
+import asyncio
+import inspect
+import threading
+
+import pm.core.vault as vault_module
+from pm.core.async_client import AsyncSupabaseClient, run_concurrently
+from pm.core.supabase_client import SupabaseClient
+from pm.core.vault import Vault
+
+
+class TestAsyncSupabaseClient:
+    """Tests for AsyncSupabaseClient and the sync facade."""
+
+    def test_wraps_every_public_method(self):
+        """Each public client method should have a coroutine counterpart."""
+        public = {
+            name for name, attr in vars(SupabaseClient).items()
+            if inspect.isfunction(attr) and not name.startswith("_") and name != "connect"
+        }
+
+        assert "update_daily_logs" in public
+        for name in public:
+            assert inspect.iscoroutinefunction(getattr(AsyncSupabaseClient, name)), name
+
+    def test_matches_sync_client(self, fake_supabase):
+        """Coroutine methods should return what the sync methods do."""
+        client = SupabaseClient(client=fake_supabase)
+        aclient = AsyncSupabaseClient(client)
+
+        assert asyncio.run(aclient.get_domain("01.02")) == client.get_domain("01.02")
+        assert asyncio.run(aclient.get_all_domains()) == client.get_all_domains()
+
+    def test_gather_overlaps_requests(self, fake_supabase):
+        """Independent reads should be in flight at the same time."""
+        # Every request waits until all three have started; run one after
+        # another, the first would time out and break the barrier.
+        barrier = threading.Barrier(3, timeout=5)
+        fake_supabase.on_request = barrier.wait
+        client = SupabaseClient(client=fake_supabase)
+
+        results = run_concurrently(
+            client,
+            domains=("get_all_domains",),
+            domain=("get_domain", "05.01"),
+            stats=("get_stats",),
+        )
+
+        assert len(results["domains"]) == 180
+        assert results["domain"]["domain_id"] == "05.01"
+        assert results["stats"]["total_domains"] == 180
+        assert sorted(fake_supabase.requests) == [
+            ("domains", "select"), ("domains", "select"), ("get_stats", "rpc"),
+        ]
+
+    def test_stats_fetch_concurrently(self, initialized_vault, fake_supabase, monkeypatch):
+        """pm status should have the domains and stats requests in flight together."""
+        barrier = threading.Barrier(2, timeout=5)
+        fake_supabase.on_request = barrier.wait
+        client = SupabaseClient(client=fake_supabase)
+        monkeypatch.setattr(vault_module, "get_supabase_client", lambda: client)
+        vault = Vault(initialized_vault.vault_path)
+
+        stats = vault.get_stats(with_domains=True)
+
+        assert stats.total_domains == 180
+        assert sorted(fake_supabase.requests) == [("domains", "select"), ("get_stats", "rpc")]
@@ -0,0 +1,49 @@
+"""Tests for the Supabase response cache."""
+
+from pm.core import cache as cache_module
+from pm.core.cache import MISS, ResponseCache
+
+
+class TestResponseCache:
+    """Tests for ResponseCache."""
+
+    def test_entries_expire(self, monkeypatch):
+        """Entries should be served until the TTL passes."""
+        now = [1000.0]
+        monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+        cache = ResponseCache(ttl=60)
+        cache.set("domains", [1, 2])
+
+        now[0] += 59
+        assert cache.get("domains") == [1, 2]
+        now[0] += 2
+        assert cache.get("domains") is MISS
+
+    def test_persists_to_file(self, temp_dir):
+        """A new cache on the same file should see earlier entries."""
+        path = temp_dir / "cache.json"
+        ResponseCache(path, namespace="a").set("config", {"id": 1})
+
+        assert ResponseCache(path, namespace="a").get("config") == {"id": 1}
+        assert ResponseCache(path, namespace="b").get("config") is MISS
+
+    def test_invalidate_keys_and_prefixes(self, temp_dir):
+        """Only the named keys and prefixed keys should be dropped."""
+        path = temp_dir / "cache.json"
+        cache = ResponseCache(path)
+        for key in ("domains", "domain:01.02", "logs:recent:2024-01-01", "books:*"):
+            cache.set(key, key)
+
+        cache.invalidate(["domain:01.02"], prefixes=["logs:recent:"])
+
+        reloaded = ResponseCache(path)
+        assert reloaded.get("domain:01.02") is MISS
+        assert reloaded.get("logs:recent:2024-01-01") is MISS
+        assert reloaded.get("domains") == "domains"
+        assert reloaded.get("books:*") == "books:*"
+
+    def test_corrupt_file_is_ignored(self, temp_dir):
+        """A corrupt cache file should behave like an empty cache."""
+        path = temp_dir / "cache.json"
+        path.write_text("{not json")
+        assert ResponseCache(path).get("domains") is MISS
@@ -1,5 +1,6 @@
 """Integration tests for CLI commands."""
 
+import json
 import os
 import shutil
 import tempfile
@@ -14,6 +15,9 @@ from pm.commands.next_cmd import next_cmd
 from pm.commands.pair import pair
 from pm.commands.gaps import gaps
 from pm.commands.log import log
+from pm.commands.import_cmd import import_sessions
+from pm.commands.sync import sync
+from pm.commands.plan import plan
 
 
 @pytest.fixture(autouse=True)
@@ -263,3 +267,123 @@ class TestLogCommand:
         assert result.exit_code == 0
         # Should now show 1 domain touched
         assert "1/180" in result.output or "Domains touched" in result.output
+
+
+class TestImportCommand:
+    """Tests for pm-import command."""
+
+    def _domain_frontmatter(self, vault_path, domain_id):
+        """Read a domain profile's frontmatter from disk."""
+        import frontmatter
+
+        path = next((vault_path / "02-Domains").rglob(f"{domain_id}-*.md"))
+        return frontmatter.load(path).metadata
+
+    def test_import_csv_applies_log_rules(self, initialized_vault, tmp_path):
+        """Sessions should advance status like repeated pm log calls."""
+        source = tmp_path / "sessions.csv"
+        source.write_text(
+            "date,domain,book,slot,pages,time\n"
+            "2024-01-03,01.02,Book C,,10,30\n"
+            "2024-01-01,01.02,Book A,FND,20,45\n"
+            "2024-01-02,01.02,Book B,,,\n"
+            "2024-01-02,01.02,Book D,,,\n"
+            "2024-01-02,05.01,Other Book,,,\n"
+        )
+
+        runner = CliRunner()
+        result = runner.invoke(import_sessions, [str(source)])
+
+        assert result.exit_code == 0, result.output
+        meta = self._domain_frontmatter(initialized_vault, "01.02")
+        assert meta["books_read"] == 4
+        assert meta["status"] == "deepening"
+        assert str(meta["last_read"]) == "2024-01-03"
+        assert self._domain_frontmatter(initialized_vault, "05.01")["status"] == "surveying"
+
+        # Same-day sessions get their own notes
+        log_names = sorted(p.name for p in (initialized_vault / "01-Daily-Logs").glob("*.md"))
+        assert log_names == [
+            "2024-01-01.md",
+            "2024-01-02-2.md",
+            "2024-01-02-3.md",
+            "2024-01-02.md",
+            "2024-01-03.md",
+        ]
+
+    def test_import_jsonl_skips_invalid_rows(self, initialized_vault, tmp_path):
+        """Invalid rows should be reported and skipped."""
+        source = tmp_path / "sessions.jsonl"
+        source.write_text(
+            '{"date": "2024-02-01", "domain": "01.02", "book": "Good"}\n'
+            '{"date": "2024-02-02", "domain": "99.99", "book": "Bad domain"}\n'
+            '{"date": "not-a-date", "domain": "01.02", "book": "Bad date"}\n'
+            '{"domain": "01.02"}\n'
+        )
+
+        runner = CliRunner()
+        result = runner.invoke(import_sessions, [str(source)])
+
+        assert result.exit_code == 0, result.output
+        assert "Skipped line 2" in result.output
+        assert "Skipped line 4" in result.output
+        assert self._domain_frontmatter(initialized_vault, "01.02")["books_read"] == 1
+        assert len(list((initialized_vault / "01-Daily-Logs").glob("*.md"))) == 1
+
+
+class TestSyncCommand:
+    """Tests for pm-sync command."""
+
+    def test_sync_requires_supabase(self, initialized_vault):
+        """Should explain that there is nothing to sync with."""
+        runner = CliRunner()
+        result = runner.invoke(sync, [])
+
+        assert result.exit_code == 0
+        assert "Supabase isn't configured" in result.output
+
+
+class TestPlanCommand:
+    """Tests for pm-plan command."""
+
+    def test_plan_shows_table(self, initialized_vault):
+        """Should show a table starting with the next recommendation."""
+        runner = CliRunner()
+        result = runner.invoke(plan, ["--days", "7"])
+
+        assert result.exit_code == 0
+        assert "Reading Plan" in result.output
+        assert "FND" in result.output
+
+    def test_plan_json(self, initialized_vault):
+        """Should plan each hub to completion, then keep planning in bisociation."""
+        runner = CliRunner()
+        result = runner.invoke(plan, ["--days", "365", "--format", "json"])
+
+        assert result.exit_code == 0
+        planned = json.loads(result.output)
+        hub_reads = [p for p in planned if p["phase"] == "hub-completion"]
+        books = {}
+        for p in hub_reads:
+            books[p["domain_id"]] = p["books_read"]
+        assert len(books) == 7
+        assert set(books.values()) == {4}
+        assert {p["phase"] for p in planned[len(hub_reads):]} == {"bisociation"}
+        assert planned[-1]["day"] > 300
+        assert [p["day"] for p in planned] == sorted(p["day"] for p in planned)
+
+    def test_plan_reports_idle_days(self, initialized_vault):
+        """The table should say how many days have no recommendation."""
+        runner = CliRunner()
+        result = runner.invoke(plan, ["--days", "30"])
+
+        assert result.exit_code == 0
+        assert "days have no recommendation" in result.output
+
+    def test_plan_leaves_vault_unchanged(self, initialized_vault):
+        """Planning should not record any reads."""
+        runner = CliRunner()
+        runner.invoke(plan, ["--days", "30"])
+        result = runner.invoke(plan, ["--days", "1", "--format", "json"])
+
+        assert json.loads(result.output)[0]["books_read"] == 1
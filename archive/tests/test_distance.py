@@ -3,10 +3,16 @@
 import pytest
 
 from pm.data.distances import (
+    _BRANCH_DISTANCES_RAW,
+    BRANCH_DISTANCE_MATRIX,
+    MAX_DISTANCE,
+    NUM_BRANCHES,
+    branch_index,
     get_branch_distance,
     get_domain_distance,
     find_distant_domains,
     get_max_distant_branches,
+    index_distance,
 )
 
 
@@ -49,6 +55,39 @@ class TestBranchDistance:
         assert get_branch_distance("1", "15") == get_branch_distance("01", "15")
         assert get_branch_distance("7", "9") == get_branch_distance("07", "09")
 
+    def test_int_and_unknown_ids(self):
+        """Int IDs should work; unknown IDs are at maximum distance."""
+        assert get_branch_distance(1, 15) == get_branch_distance("01", "15")
+        assert get_branch_distance("001", 2) == get_branch_distance("01", "02")
+        assert get_branch_distance("xx", "01") == MAX_DISTANCE
+        assert get_branch_distance("16", "01") == MAX_DISTANCE
+        assert get_branch_distance(None, "01") == MAX_DISTANCE
+
+
+class TestDistanceMatrix:
+    """Tests for the compiled branch distance matrix."""
+
+    def test_matches_table(self):
+        """The flat matrix should hold the table, mirrored across the diagonal."""
+        assert len(BRANCH_DISTANCE_MATRIX) == NUM_BRANCHES * NUM_BRANCHES
+        for (a, b), distance in _BRANCH_DISTANCES_RAW.items():
+            i, j = int(a) - 1, int(b) - 1
+            assert BRANCH_DISTANCE_MATRIX[i * NUM_BRANCHES + j] == distance
+            assert BRANCH_DISTANCE_MATRIX[j * NUM_BRANCHES + i] == distance
+
+    def test_branch_index(self):
+        """Every spelling of a branch should map to the same index."""
+        assert branch_index("07") == branch_index("7") == branch_index(7) == 6
+        assert branch_index("00") == branch_index("abc") == branch_index(16) == -1
+
+    def test_index_fast_path(self):
+        """index_distance should agree with get_branch_distance everywhere."""
+        for a in range(1, NUM_BRANCHES + 1):
+            for b in range(1, NUM_BRANCHES + 1):
+                assert index_distance(branch_index(a), branch_index(b)) == get_branch_distance(
+                    f"{a:02d}", f"{b:02d}"
+                )
+
 
 class TestDomainDistance:
     """Tests for domain distance calculations."""
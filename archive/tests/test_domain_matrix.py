@@ -0,0 +1,81 @@
+"""Tests for the precomputed domain distance matrix."""
+
+import pytest
+
+from pm.core.domain_matrix import DomainDistanceMatrix, inputs_hash, load_domain_matrix
+from pm.data.distances import get_domain_distance
+from pm.data.domains import DOMAINS
+from pm.data.isomorphisms import KNOWN_ISOMORPHISMS, shared_isomorphisms
+
+DOMAIN_IDS = [d["domain_id"] for d in DOMAINS]
+
+
+@pytest.fixture
+def matrix_path(temp_dir):
+    return temp_dir / "domain-distances.bin"
+
+
+class TestBuild:
+    """Tests for computing the matrix."""
+
+    def test_matches_pairwise_distance(self):
+        """Every cell should equal get_domain_distance with the real shared count."""
+        matrix = DomainDistanceMatrix.build()
+
+        for a in DOMAIN_IDS[::7]:
+            for b in DOMAIN_IDS:
+                expected = get_domain_distance(a, b, len(shared_isomorphisms(a, b)))
+                assert matrix.distance(a, b) == expected
+
+    def test_isomorphism_reduction(self):
+        """Thermodynamics and Information Theory share entropy (SPEC-06 2.2)."""
+        matrix = DomainDistanceMatrix.build()
+
+        assert shared_isomorphisms("01.02", "03.07") == ["entropy"]
+        assert matrix.distance("01.02", "03.07") == 0.5
+        assert matrix.distance("03.07", "01.02") == 0.5
+        assert matrix.distance("01.02", "01.02") == 0.0
+
+    def test_unknown_domain_falls_back(self):
+        """Domains outside the matrix should still get a distance."""
+        matrix = DomainDistanceMatrix.build(["01.01", "15.01"], {})
+
+        assert matrix.distance("01.01", "15.01") == 4.0
+        assert matrix.distance("01.02", "03.07") == 0.5
+
+
+class TestPersistence:
+    """Tests for saving and memory-mapping the matrix."""
+
+    def test_round_trip_is_mapped(self, matrix_path):
+        """A saved matrix should load memory-mapped with the same values."""
+        built = load_domain_matrix(matrix_path)
+        loaded = load_domain_matrix(matrix_path)
+
+        assert isinstance(loaded.values, memoryview)
+        assert list(loaded.values) == list(built.values)
+        assert list(loaded.row("01.02")) == [loaded.distance("01.02", b) for b in DOMAIN_IDS]
+
+    def test_stale_file_is_rebuilt(self, matrix_path):
+        """A file computed from other inputs should be ignored and replaced."""
+        DomainDistanceMatrix.build(DOMAIN_IDS, {}).save(matrix_path)
+        assert DomainDistanceMatrix.load(
+            matrix_path, DOMAIN_IDS, inputs_hash(DOMAIN_IDS, KNOWN_ISOMORPHISMS)
+        ) is None
+
+        matrix = load_domain_matrix(matrix_path)
+
+        assert matrix.distance("01.02", "03.07") == 0.5
+        assert isinstance(load_domain_matrix(matrix_path).values, memoryview)
+
+    def test_corrupt_file_is_rebuilt(self, matrix_path):
+        """A truncated file should not be mapped."""
+        matrix_path.write_bytes(b"PMDD")
+
+        assert load_domain_matrix(matrix_path).distance("01.02", "03.07") == 0.5
+
+    def test_hash_covers_catalogue(self):
+        """Changing the isomorphism catalogue should change the input hash."""
+        fewer = {k: v for k, v in KNOWN_ISOMORPHISMS.items() if k != "entropy"}
+
+        assert inputs_hash(DOMAIN_IDS, fewer) != inputs_hash(DOMAIN_IDS, KNOWN_ISOMORPHISMS)
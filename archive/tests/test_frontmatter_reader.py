@@ -0,0 +1,60 @@
+"""Tests for the header-only frontmatter reader."""
+
+import frontmatter
+import pytest
+
+from pm.core.frontmatter_reader import LazyPost, read_body, read_frontmatter
+
+HEADERS = [
+    # Flat subset written by the templates and by frontmatter.dumps
+    'domain_id: "01.02"\nis_hub: true\nbooks_read: 3\nlast_read: ""\n'
+    "date_created: 2024-01-05\ntags:\n  - domain\n  - branch/1\n",
+    "title: Godel, Escher, Bach\nauthor: Douglas Hofstadter\nyear: 1979\n"
+    "last_read: '2024-02-01'\nrating:\nnote: it''s fine\n",
+    "flag: yes\nother: Off\nnothing: ~\nneg: -4\n",
+    # Outside the flat subset: must fall back to YAML
+    "nested:\n  a: 1\n  b: [2, 3]\n",
+    "octal: 017\nfloat: 1.5\nbad_date: 2024-1-5\n",
+    'escaped: "tab\\there"\ncomment: value # trailing\n',
+    "long: >\n  folded\n  text\n",
+    "just a string\n",
+]
+
+
+@pytest.mark.parametrize("header", HEADERS)
+def test_matches_python_frontmatter(temp_dir, header):
+    """Metadata should match what python-frontmatter returns."""
+    note = temp_dir / "note.md"
+    note.write_text(f"---\n{header}---\n\n# Body\n\nText\n")
+
+    assert read_frontmatter(note) == frontmatter.load(note).metadata
+
+
+def test_no_frontmatter(temp_dir):
+    """Files without a complete header should yield empty metadata."""
+    plain = temp_dir / "plain.md"
+    plain.write_text("# Just a heading\n")
+    unclosed = temp_dir / "unclosed.md"
+    unclosed.write_text("---\ntitle: Never closed\n")
+
+    assert read_frontmatter(plain) == {}
+    assert read_frontmatter(unclosed) == {}
+
+
+def test_body_matches_python_frontmatter(temp_dir):
+    """Body should match python-frontmatter's content."""
+    note = temp_dir / "note.md"
+    note.write_text("---\ntitle: Test\n---\n\n# Heading\n\n---\n\nMore\n")
+
+    assert read_body(note) == frontmatter.load(note).content
+
+
+def test_lazy_post_defers_body(temp_dir):
+    """LazyPost should read the body only on first access."""
+    note = temp_dir / "note.md"
+    note.write_text("---\ntitle: Lazy\n---\nOriginal body\n")
+    post = LazyPost(note)
+    assert post.metadata == {"title": "Lazy"}
+
+    note.write_text("---\ntitle: Lazy\n---\nUpdated body\n")
+    assert post.content == "Updated body"
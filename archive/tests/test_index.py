@@ -0,0 +1,78 @@
+"""Tests for the sidecar frontmatter index."""
+
+import os
+
+import pytest
+
+from pm.core.domain import DomainStatus
+from pm.core.index import VaultIndex
+
+
+class TestVaultIndex:
+    """Tests for VaultIndex."""
+
+    def test_caches_until_stat_changes(self, temp_dir, parse_counter):
+        """Should parse once, then re-parse only after the file changes."""
+        note = temp_dir / "note.md"
+        note.write_text("---\ntitle: First\n---\nBody\n")
+        index = VaultIndex(temp_dir)
+
+        assert index.metadata(note, "book")["title"] == "First"
+        assert index.metadata(note, "book")["title"] == "First"
+        assert len(parse_counter) == 1
+
+        note.write_text("---\ntitle: Second version\n---\nBody\n")
+        assert index.metadata(note, "book")["title"] == "Second version"
+        assert len(parse_counter) == 2
+
+    def test_persists_across_instances(self, temp_dir, parse_counter):
+        """Cached entries should survive reopening the index."""
+        note = temp_dir / "note.md"
+        note.write_text("---\ntitle: Persisted\n---\n")
+        VaultIndex(temp_dir).metadata(note, "book")
+
+        reopened = VaultIndex(temp_dir)
+        assert reopened.metadata(note, "book")["title"] == "Persisted"
+        assert len(parse_counter) == 1
+
+    def test_missing_file_raises(self, temp_dir):
+        """Missing files should raise FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            VaultIndex(temp_dir).metadata(temp_dir / "missing.md", "log")
+
+    def test_prune_removes_deleted_files(self, temp_dir):
+        """Prune should drop entries for files that no longer exist."""
+        note = temp_dir / "note.md"
+        note.write_text("---\ntitle: Gone\n---\n")
+        index = VaultIndex(temp_dir)
+        index.metadata(note, "book")
+
+        os.remove(note)
+        assert index.prune("book") == 1
+
+
+class TestVaultUsesIndex:
+    """Tests for Vault reads going through the index."""
+
+    def test_load_all_domains_parses_once(self, initialized_vault, parse_counter):
+        """A second load should not re-parse unchanged domain files."""
+        first = initialized_vault.load_all_domains()
+        parsed = len(parse_counter)
+        assert parsed == len(first)
+
+        second = initialized_vault.load_all_domains()
+        assert len(parse_counter) == parsed
+        assert [d.domain_id for d in second] == [d.domain_id for d in first]
+
+    def test_save_domain_refreshes_entry(self, initialized_vault, parse_counter):
+        """Saved domains should be readable from the index without re-parsing."""
+        domain = initialized_vault.load_domain("01.02")
+        domain.books_read = 1
+        domain.status = DomainStatus.SURVEYING
+        initialized_vault.save_domain(domain)
+        parsed = len(parse_counter)
+
+        reloaded = initialized_vault.load_domain("01.02")
+        assert reloaded.books_read == 1
+        assert reloaded.status == DomainStatus.SURVEYING
+        assert len(parse_counter) == parsed
@@ -0,0 +1,187 @@
+"""Tests for the append-only session journal."""
+
+from datetime import date
+
+import frontmatter
+import pytest
+
+from pm.core import journal as journal_module
+from pm.core import vault as vault_module
+from pm.core.daily_log import DailyLog
+from pm.core.domain import DomainStatus
+from pm.core.journal import SessionEvent, SessionJournal
+from pm.core.vault import Vault
+
+
+def _event(domain_id="01.02", day=1):
+    """Build a session event."""
+    return SessionEvent(
+        log_date=date(2024, 1, day),
+        domain_id=domain_id,
+        book_title=f"Book {day}",
+        function_slot="FND",
+    )
+
+
+def _session(day=1):
+    """Build a daily log for 01.02."""
+    return DailyLog(
+        log_date=date(2024, 1, day),
+        domain_id="01.02",
+        domain_name="Thermodynamics",
+        book_title=f"Book {day}",
+        function_slot="FND",
+    )
+
+
+class TestSessionJournal:
+    """Tests for SessionJournal."""
+
+    def test_pending_after_checkpoint(self, temp_dir):
+        """Only events after the last checkpoint should be pending."""
+        journal = SessionJournal(temp_dir / "journal.jsonl")
+        journal.append(_event(day=1))
+        journal.append(_event(day=2))
+        journal.checkpoint()
+        journal.append(_event(day=3))
+
+        assert [e.log_date.day for e in journal.pending()] == [3]
+        journal.close()
+        assert [e.log_date.day for e in SessionJournal(journal.path).pending()] == [3]
+
+    def test_round_trips_events(self, temp_dir):
+        """Pending events should match what was appended."""
+        journal = SessionJournal(temp_dir / "journal.jsonl")
+        event = _event()
+        event.note = "01-Daily-Logs/2024-01-01.md"
+        journal.append(event)
+
+        assert journal.pending() == [event]
+
+    def test_sync_batching(self, temp_dir, monkeypatch):
+        """fsync should run once per sync_every appends, and on close."""
+        syncs = []
+        monkeypatch.setattr(journal_module.os, "fsync", syncs.append)
+        journal = SessionJournal(temp_dir / "journal.jsonl", sync_every=3)
+
+        for day in range(1, 8):
+            journal.append(_event(day=day))
+        assert len(syncs) == 2
+
+        journal.close()
+        assert len(syncs) == 3
+
+    def test_checkpoint_truncates(self, temp_dir):
+        """A checkpoint should drop compacted events but keep numbering."""
+        journal = SessionJournal(temp_dir / "journal.jsonl")
+        for day in range(1, 4):
+            journal.append(_event(day=day))
+        journal.checkpoint(2)
+
+        assert journal.path.read_text().count("\n") == 2  # Checkpoint plus event 3
+        assert [e.seq for e in journal.pending()] == [3]
+
+        reopened = SessionJournal(journal.path)
+        reopened.append(_event(day=4))
+        assert [e.seq for e in reopened.pending()] == [3, 4]
+
+    def test_pending_parses_only_on_change(self, temp_dir, monkeypatch):
+        """Repeated reads of an unchanged journal should not re-read the file."""
+        journal = SessionJournal(temp_dir / "journal.jsonl")
+        journal.append(_event(day=1))
+        journal.close()
+        reads = []
+        original = journal_module.Path.read_bytes
+        monkeypatch.setattr(
+            journal_module.Path, "read_bytes", lambda self: reads.append(self) or original(self)
+        )
+
+        reopened = SessionJournal(journal.path)
+        for _ in range(3):
+            assert len(reopened.pending()) == 1
+        reopened.append(_event(day=2))
+        assert len(reopened.pending()) == 2
+        assert len(reads) == 1
+
+    def test_skips_torn_line(self, temp_dir):
+        """An interrupted append should not hide later events."""
+        path = temp_dir / "journal.jsonl"
+        path.write_text(_event(day=1).to_json() + "\n" + '{"type":"sess')
+
+        journal = SessionJournal(path)
+        journal.append(_event(day=2))
+
+        assert [e.log_date.day for e in journal.pending()] == [1, 2]
+
+
+class TestVaultJournal:
+    """Tests for sessions logged through the vault journal."""
+
+    def test_same_day_sessions_keep_both_notes(self, initialized_vault):
+        """A second session on the same day should not replace the first."""
+        first = initialized_vault.log_session(_session())
+        second = initialized_vault.log_session(_session())
+
+        assert first.name == "2024-01-01.md"
+        assert second.name == "2024-01-01-2.md"
+        assert first.exists() and second.exists()
+
+    def test_reads_replay_pending_sessions(self, initialized_vault):
+        """Domain reads should include sessions not yet compacted."""
+        domain_file = initialized_vault.domain_filepath("01.02")
+        before = domain_file.read_text()
+
+        initialized_vault.log_session(_session(1))
+        initialized_vault.log_session(_session(2))
+
+        assert domain_file.read_text() == before
+        domain = initialized_vault.load_domain("01.02")
+        assert domain.books_read == 2
+        assert domain.status == DomainStatus.SURVEYED
+        assert domain.last_read == date(2024, 1, 2)
+        assert initialized_vault.get_stats().total_books_read == 2
+
+    def test_compaction_writes_domains_once(self, initialized_vault):
+        """Compaction should update the profile and clear pending sessions."""
+        for day in range(1, 5):
+            initialized_vault.log_session(_session(day))
+
+        assert initialized_vault.compact_journal() == 4
+        assert initialized_vault.journal.pending() == []
+
+        meta = frontmatter.load(initialized_vault.domain_filepath("01.02")).metadata
+        assert meta["books_read"] == 4
+        assert meta["status"] == "deepening"
+
+        reopened = Vault(initialized_vault.vault_path)
+        assert reopened.load_domain("01.02").books_read == 4
+
+    def test_interrupted_compaction_is_not_applied_twice(self, initialized_vault, monkeypatch):
+        """Domains written before a crash should not replay the same sessions again."""
+        for day in range(1, 4):
+            initialized_vault.log_session(_session(day))
+
+        def crash(self, seq=None):
+            raise KeyboardInterrupt
+
+        monkeypatch.setattr(SessionJournal, "checkpoint", crash)
+        with pytest.raises(KeyboardInterrupt):
+            initialized_vault.compact_journal()
+        monkeypatch.undo()
+
+        reopened = Vault(initialized_vault.vault_path)
+        assert len(reopened.journal.pending()) == 3
+        assert reopened.load_domain("01.02").books_read == 3
+
+        assert reopened.compact_journal() == 3
+        assert Vault(initialized_vault.vault_path).load_domain("01.02").books_read == 3
+
+    def test_compacts_periodically(self, initialized_vault, monkeypatch):
+        """Logging should compact once enough sessions are pending."""
+        monkeypatch.setattr(vault_module, "JOURNAL_COMPACT_EVERY", 3)
+        for day in range(1, 4):
+            initialized_vault.log_session(_session(day))
+
+        assert initialized_vault.journal.pending() == []
+        meta = frontmatter.load(initialized_vault.domain_filepath("01.02")).metadata
+        assert meta["books_read"] == 3
@@ -0,0 +1,63 @@
+"""Tests for streak and momentum metrics."""
+
+from datetime import date, timedelta
+
+from pm.core.momentum import build_day_bitmap, calculate_momentum
+
+TODAY = date(2025, 3, 31)
+
+
+def _bitmap(days_back):
+    """Build a bitmap with logs on the given days before TODAY."""
+    return build_day_bitmap([TODAY - timedelta(days=d) for d in days_back], TODAY)
+
+
+class TestStreak:
+    """Tests for the current streak."""
+
+    def test_consecutive_days(self):
+        """Should count consecutive days ending today."""
+        assert calculate_momentum(_bitmap(range(5))).current_streak == 5
+
+    def test_today_not_logged_yet(self):
+        """A missing log today should not break the streak."""
+        assert calculate_momentum(_bitmap(range(1, 4))).current_streak == 3
+
+    def test_gap_breaks_streak(self):
+        """A gap before today should end the streak."""
+        assert calculate_momentum(_bitmap([0, 1, 3, 4])).current_streak == 2
+        assert calculate_momentum(_bitmap([2, 3])).current_streak == 0
+
+    def test_duplicates_and_future_dates(self):
+        """Multiple logs per day count once; future logs are ignored."""
+        bitmap = build_day_bitmap([TODAY, TODAY, TODAY + timedelta(days=1)], TODAY)
+        assert calculate_momentum(bitmap).current_streak == 1
+
+    def test_empty(self):
+        """No logs should give an empty streak."""
+        metrics = calculate_momentum(bytearray())
+        assert metrics.current_streak == 0
+        assert metrics.rolling_average == 0
+
+
+class TestMomentum:
+    """Tests for the rolling average, trend and sustainability."""
+
+    def test_steady_reading_is_stable(self):
+        """Every-day reading is a stable 7 days/week."""
+        metrics = calculate_momentum(_bitmap(range(28)))
+        assert metrics.rolling_average == 7
+        assert metrics.trend == "stable"
+        assert metrics.sustainability_score == 7
+
+    def test_more_recent_reading_is_accelerating(self):
+        """Reading concentrated in recent weeks should be accelerating."""
+        metrics = calculate_momentum(_bitmap(range(14)))
+        assert metrics.trend == "accelerating"
+        assert metrics.trend_slope > 0
+
+    def test_tapering_off_is_declining(self):
+        """Reading concentrated in older weeks should be declining."""
+        metrics = calculate_momentum(_bitmap(range(14, 28)))
+        assert metrics.trend == "declining"
+        assert metrics.rolling_average == 3.5
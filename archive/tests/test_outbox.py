@@ -0,0 +1,281 @@
+"""Tests for the offline Supabase write outbox."""
+
+import time
+from datetime import date
+
+import pytest
+
+from pm.core import outbox as outbox_module
+from pm.core.daily_log import DailyLog
+from pm.core.domain import DomainStatus
+from pm.core.outbox import Outbox, OutboxReplayer, backoff_delay, replay_outbox
+from tests.fake_supabase import log_row
+
+
+class _RejectedError(Exception):
+    """An error response from the server."""
+
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+class TransportError(Exception):
+    """Stand-in for httpx.TransportError, which isn't an OSError."""
+
+
+TransportError.__module__ = "httpx"
+
+
+class ConnectError(TransportError):
+    """Stand-in for httpx.ConnectError."""
+
+
+class _UnreachableClient:
+    """Client whose every request fails like httpx does when offline."""
+
+    def connect(self):
+        return True
+
+    def create_daily_logs(self, rows):
+        raise ConnectError("[Errno 111] Connection refused")
+
+
+class _RejectingClient:
+    """Client that answers rows marked "bad" with an error status."""
+
+    def __init__(self, status_code=400):
+        self.status_code = status_code
+        self.sent = []
+
+    def connect(self):
+        return True
+
+    def create_daily_logs(self, rows):
+        if any(r.get("bad") for r in rows):
+            raise _RejectedError(self.status_code)
+        self.sent += rows
+
+
+@pytest.fixture
+def outbox(temp_dir):
+    """Create an empty outbox."""
+    box = Outbox(temp_dir / "outbox.sqlite")
+    yield box
+    box.close()
+
+
+class TestOutbox:
+    """Tests for the queue itself."""
+
+    def test_enqueue_persists(self, outbox):
+        """Queued writes should survive reopening the database."""
+        outbox.enqueue("daily_log", [log_row(1), log_row(2)])
+        outbox.close()
+
+        reopened = Outbox(outbox.db_path)
+        assert [e.payload["log_date"] for e in reopened.pending()] == ["2024-01-01", "2024-01-02"]
+        reopened.close()
+
+    def test_same_key_replaces(self, outbox):
+        """A newer write under a queued key should replace the queued one."""
+        outbox.enqueue("domain_progress", [{"domain_id": "01.02", "books_read": 1}], ["p:01.02"])
+        outbox.enqueue("domain_progress", [{"domain_id": "01.02", "books_read": 2}], ["p:01.02"])
+
+        assert [e.payload["books_read"] for e in outbox.pending()] == [2]
+
+    def test_backoff_grows_and_caps(self):
+        """Retry delays should double per attempt, up to the cap."""
+        assert 1.0 <= backoff_delay(1) <= 2.0
+        assert 4.0 <= backoff_delay(3) <= 8.0
+        assert backoff_delay(50) <= outbox_module.BACKOFF_MAX
+
+
+class TestReplay:
+    """Tests for replaying the outbox against a server."""
+
+    def test_sends_in_batches(self, outbox, client, fake_supabase):
+        """Due writes should go out in batch_size chunks, grouped by kind."""
+        outbox.enqueue("daily_log", [log_row(day) for day in range(1, 4)])
+        outbox.enqueue("domain_progress", [{"domain_id": "01.02", "status": "surveying",
+                                            "books_read": 1, "last_read": None}])
+
+        result = replay_outbox(outbox, client, batch_size=2)
+
+        assert (result.sent, result.failed, result.remaining) == (4, 0, 0)
+        assert fake_supabase.requests == (
+            [("daily_logs", "upsert")] * 2 + [("domain_progress", "upsert")]
+        )
+        assert len(fake_supabase.rows("daily_logs")) == 3
+
+    def test_failure_backs_off(self, outbox, client, fake_supabase):
+        """A failed batch should stay queued with a later retry time."""
+        outbox.enqueue("daily_log", [log_row(1), log_row(2)])
+        fake_supabase.failures = 1
+
+        result = replay_outbox(outbox, client)
+
+        assert (result.sent, result.failed, result.remaining) == (0, 2, 2)
+        assert [e.attempts for e in outbox.pending()] == [0, 0]
+        assert outbox.due(10) == []
+        assert len(outbox.due(10, now=time.time() + outbox_module.BACKOFF_MAX)) == 2
+
+        assert replay_outbox(outbox, client, force=True).sent == 2
+        assert len(outbox) == 0
+
+    def test_resend_is_idempotent(self, outbox, client, fake_supabase):
+        """Re-sending a batch the server already applied should not duplicate it."""
+        outbox.enqueue("daily_log", [log_row(1), log_row(2)])
+        batch = outbox.pending()
+        replay_outbox(outbox, client)
+
+        # The acknowledgement was lost: the same writes are queued again
+        outbox.enqueue("daily_log", [e.payload for e in batch], [e.key for e in batch])
+        replay_outbox(outbox, client)
+
+        assert len(fake_supabase.rows("daily_logs")) == 2
+        assert len(outbox) == 0
+
+    def test_rejected_write_is_dead_lettered(self, outbox):
+        """A write the server rejects should not block the writes behind it."""
+        outbox.enqueue("daily_log", [log_row(1), {**log_row(2), "bad": True}, log_row(3)])
+        outbox.enqueue("daily_log", [log_row(4)])
+        client = _RejectingClient(400)
+
+        result = replay_outbox(outbox, client, batch_size=10)
+
+        assert (result.sent, result.dead, result.remaining) == (3, 1, 0)
+        assert [r["log_date"] for r in client.sent] == ["2024-01-01", "2024-01-03", "2024-01-04"]
+        assert [e.payload["log_date"] for e in outbox.dead_letters()] == ["2024-01-02"]
+
+    def test_server_errors_dead_letter_after_max_attempts(self, outbox):
+        """A write the server keeps failing on should eventually be set aside."""
+        outbox.enqueue("daily_log", [{**log_row(1), "bad": True}, log_row(2)])
+        client = _RejectingClient(503)
+
+        for _ in range(1, outbox_module.MAX_ATTEMPTS):
+            result = replay_outbox(outbox, client, force=True)
+            assert (result.failed, result.dead) == (2, 0)
+
+        result = replay_outbox(outbox, client, force=True)
+        assert result.dead == 2
+        assert len(outbox) == 0
+
+    def test_offline_never_dead_letters(self, outbox, client, fake_supabase):
+        """Connection failures should keep writes queued however often they happen."""
+        outbox.enqueue("daily_log", [log_row(1)])
+        fake_supabase.failures = 100
+
+        for _ in range(outbox_module.MAX_ATTEMPTS + 2):
+            result = replay_outbox(outbox, client, force=True)
+            assert result.offline and result.dead == 0
+
+        assert outbox.pending()[0].attempts == 0
+        assert outbox.dead_letters() == []
+
+    def test_httpx_transport_errors_are_offline(self, outbox):
+        """httpx network errors should not count against a write."""
+        outbox.enqueue("daily_log", [log_row(1)])
+
+        for _ in range(outbox_module.MAX_ATTEMPTS + 2):
+            result = replay_outbox(outbox, _UnreachableClient(), force=True)
+            assert result.offline and result.dead == 0
+
+        assert outbox.pending()[0].attempts == 0
+        assert outbox.dead_letters() == []
+
+    def test_no_exit_wait_when_offline(self, outbox, client, fake_supabase, monkeypatch):
+        """Exiting should not wait on a replay that can't reach Supabase."""
+        outbox.enqueue("daily_log", [log_row(1)])
+        fake_supabase.failures = 100
+        replayer = OutboxReplayer(outbox.db_path, client)
+        replayer.kick()
+        replayer.wait(5)
+        joins = []
+        monkeypatch.setattr(replayer._thread, "is_alive", lambda: True)
+        monkeypatch.setattr(replayer._thread, "join", joins.append)
+
+        replayer._wait_at_exit()
+
+        assert replayer._offline
+        assert joins == []
+
+    def test_background_replayer(self, outbox, client, fake_supabase):
+        """The replayer should drain the outbox off the calling thread."""
+        outbox.enqueue("daily_log", [log_row(day) for day in range(1, 6)])
+        replayer = OutboxReplayer(outbox.db_path, client, batch_size=2)
+
+        replayer.kick()
+        replayer.wait(5)
+
+        assert len(outbox) == 0
+        assert len(fake_supabase.rows("daily_logs")) == 5
+
+
+class TestVaultOutbox:
+    """Tests for vault writes going through the outbox."""
+
+    def test_write_returns_while_offline(self, supabase_vault, fake_supabase):
+        """Writes should succeed locally and be sent once the server is back."""
+        domain = supabase_vault.load_domain("01.02")
+        domain.record_session(date(2024, 1, 1))
+        fake_supabase.failures = 100
+
+        log = DailyLog(log_date=date(2024, 1, 1), domain_id="01.02",
+                       domain_name="Thermodynamics", book_title="Book", function_slot="FND")
+        filepath = supabase_vault.save_daily_log(log)
+        supabase_vault.save_domain(domain)
+
+        assert filepath.exists()
+        assert len(supabase_vault.outbox) == 2
+        assert fake_supabase.rows("daily_logs") == []
+
+        fake_supabase.failures = 0
+        result = supabase_vault.flush_outbox()
+
+        assert (result.sent, result.remaining) == (2, 0)
+        assert len(fake_supabase.rows("daily_logs")) == 1
+        assert fake_supabase.rows("domain_progress")[0]["books_read"] == 1
+
+    def test_reads_include_queued_progress(self, supabase_vault, fake_supabase):
+        """Domain reads should reflect progress that hasn't reached the server."""
+        domain = supabase_vault.load_domain("01.02")
+        domain.status = DomainStatus.SURVEYED
+        domain.books_read = 2
+        fake_supabase.failures = 100
+        supabase_vault.save_domain(domain)
+        fake_supabase.failures = 0
+
+        assert supabase_vault.load_domain("01.02").books_read == 2
+        by_id = {d.domain_id: d for d in supabase_vault.load_all_domains()}
+        assert by_id["01.02"].status == DomainStatus.SURVEYED
+
+    def test_background_flush(self, supabase_vault, fake_supabase):
+        """Background replays should be awaited by flush_outbox."""
+        supabase_vault.replay_in_background = True
+        domains = supabase_vault.load_all_domains()[:5]
+        for d in domains:
+            d.books_read = 1
+        supabase_vault.save_domains(domains)
+
+        supabase_vault.flush_outbox()
+
+        assert len(supabase_vault.outbox) == 0
+        assert len(fake_supabase.rows("domain_progress")) == 5
+
+    def test_logged_sessions_sent_before_compaction(self, supabase_vault, fake_supabase):
+        """Each logged session should reach the server without waiting for compaction."""
+        for day in (1, 2):
+            log = DailyLog(log_date=date(2024, 1, day), domain_id="01.02",
+                           domain_name="Thermodynamics", book_title="Book", function_slot="FND")
+            supabase_vault.log_session(log)
+
+        assert len(supabase_vault.journal.pending()) == 2
+        assert len(fake_supabase.rows("daily_logs")) == 2
+        assert fake_supabase.rows("domain_progress")[0]["books_read"] == 2
+        assert supabase_vault.load_domain("01.02").books_read == 2
+
+        supabase_vault.compact_journal()
+
+        assert supabase_vault.load_domain("01.02").books_read == 2
+        assert len(fake_supabase.rows("daily_logs")) == 2
@@ -0,0 +1,107 @@
+"""Tests for CLI startup cost (lazy imports and lazy backend resolution)."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from pm.core import vault as vault_module
+from pm.core.vault import Vault
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+# Modules data-only commands must not import
+STORAGE_MODULES = (
+    "dotenv",
+    "supabase",
+    "frontmatter",
+    "sqlite3",
+    "pm.core.vault",
+    "pm.core.supabase_client",
+)
+
+def _import_profile(code: str) -> dict[str, int]:
+    """Run `code` under -X importtime and return module -> cumulative microseconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    profile = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        profile[name.strip()] = int(cumulative)
+    return profile
+
+
+class TestLazyImports:
+    """Tests that commands only import what they use."""
+
+    @pytest.mark.parametrize("module", ["pm.commands.distance", "pm.commands.connections"])
+    def test_data_commands_skip_storage(self, module):
+        """Distance and connections commands should not load any storage code."""
+        profile = _import_profile(f"import {module}")
+
+        assert module in profile
+        assert [m for m in STORAGE_MODULES if m in profile] == []
+
+    def test_cli_imports_commands_on_demand(self):
+        """The pm group should import only the subcommand being run."""
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import click, sys, pm.cli; "
+                "pm.cli.cli.get_command(click.Context(pm.cli.cli), 'distance'); "
+                "print('\\n'.join(sys.modules))",
+            ],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        loaded = set(result.stdout.split())
+
+        assert "pm.commands.distance" in loaded
+        assert "pm.commands.status" not in loaded
+        assert [m for m in STORAGE_MODULES if m in loaded] == []
+
+    def test_cli_defers_backend_and_tables(self):
+        """Importing the pm group should not load Supabase or rich tables."""
+        result = subprocess.run(
+            [sys.executable, "-c", "import sys, pm.cli; print('\\n'.join(sys.modules))"],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        loaded = set(result.stdout.split())
+
+        assert "pm.cli" in loaded
+        assert "supabase" not in loaded
+        assert "rich.table" not in loaded
+
+
+class TestLazyBackend:
+    """Tests that the vault resolves its Supabase client on first use."""
+
+    def test_client_resolved_on_use(self, initialized_vault, monkeypatch):
+        """Constructing a vault should not touch the environment or backend."""
+        calls = []
+
+        def fake_client():
+            calls.append(1)
+            return type("Unconfigured", (), {"is_available": False})()
+
+        monkeypatch.setattr(vault_module, "get_supabase_client", fake_client)
+        vault = Vault(initialized_vault.vault_path)
+        assert calls == []
+
+        assert not vault.using_supabase
+        assert not vault.using_supabase
+        assert calls == [1]
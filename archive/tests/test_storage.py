@@ -0,0 +1,231 @@
+"""Tests for the local SQLite storage backend."""
+
+import threading
+from datetime import date
+
+import pytest
+
+from pm.core.daily_log import DailyLog
+from pm.core.domain import DomainStatus
+from pm.core.storage import SqliteBackend, open_backend
+from pm.core.supabase_client import SupabaseClient, reset_supabase_client
+from pm.core.sync import SyncEngine
+from pm.core.vault import Vault
+from pm.data.distances import _BRANCH_DISTANCES_RAW, get_branch_distance
+from pm.data.domains import DOMAINS
+from tests.fake_supabase import log_row
+
+
+@pytest.fixture
+def backend(temp_dir):
+    """Seeded SQLite backend."""
+    db = SqliteBackend(temp_dir / "polymath.db")
+    yield db
+    db.close()
+
+
+class TestSqliteBackend:
+    """Tests for the backend's query API."""
+
+    def test_seeds_taxonomy(self, backend):
+        """A new database should hold every domain and branch distance."""
+        assert len(backend.table("domains").select("*").execute().data) == len(DOMAINS)
+        distances = backend.table("branch_distances").select("*").execute().data
+        assert len(distances) == len(_BRANCH_DISTANCES_RAW)
+
+    def test_filters_order_and_range(self, backend):
+        """Filters, ordering and paging should match PostgREST's."""
+        rows = (
+            backend.table("domains")
+            .select("domain_id", count="exact")
+            .eq("branch_id", "02")
+            .order("domain_id", desc=True)
+            .range(1, 2)
+            .execute()
+        )
+
+        branch = sorted(d["domain_id"] for d in DOMAINS if d["branch_id"] == 2)
+        assert [r["domain_id"] for r in rows.data] == branch[::-1][1:3]
+        assert rows.count == len(branch)
+
+    def test_neq_skips_nulls(self, backend):
+        """neq should exclude NULLs, as PostgREST's does."""
+        backend.table("domain_progress").insert([
+            {"domain_id": "01.01", "status": "surveying"},
+            {"domain_id": "01.02", "status": "expert"},
+            {"domain_id": "01.03", "status": None},
+        ]).execute()
+
+        rows = backend.table("domain_progress").select("*").neq("status", "expert").execute()
+
+        assert [r["domain_id"] for r in rows.data] == ["01.01"]
+
+    def test_embeds_related_rows(self, backend):
+        """An embedded one-to-one table should come back as an object."""
+        backend.table("domain_progress").insert(
+            {"domain_id": "01.02", "status": "surveyed"}
+        ).execute()
+
+        rows = backend.table("domains").select("*, domain_progress(*)").in_(
+            "domain_id", ["01.01", "01.02"]
+        ).order("domain_id").execute().data
+
+        assert rows[0]["domain_progress"] is None
+        assert rows[1]["domain_progress"]["status"] == "surveyed"
+
+    def test_upsert_on_idempotency_key(self, backend):
+        """Re-sending a keyed row should update it, not duplicate it."""
+        first = backend.table("daily_logs").upsert(
+            log_row(pages_read=10, idempotency_key="k"), on_conflict="idempotency_key"
+        ).execute().data[0]
+        second = backend.table("daily_logs").upsert(
+            log_row(pages_read=20, idempotency_key="k"), on_conflict="idempotency_key"
+        ).execute().data[0]
+
+        rows = backend.table("daily_logs").select("*").execute().data
+        assert len(rows) == 1 and rows[0]["pages_read"] == 20
+        assert second["id"] == first["id"] and second["created_at"] == first["created_at"]
+        assert second["updated_at"] > first["updated_at"]
+
+    def test_unknown_fields_round_trip(self, backend):
+        """Fields without a column should be kept, as jsonb config would."""
+        backend.table("config").upsert({"id": 1, "current_phase": "hub-completion"}).execute()
+
+        row = backend.table("config").select("*").eq("id", 1).maybe_single().execute().data
+        assert row == {"id": 1, "current_phase": "hub-completion"}
+        assert backend.table("config").select("*").eq("id", 2).maybe_single().execute() is None
+
+    def test_unknown_column_filter_raises(self, backend):
+        """Filtering on a missing column should fail as PostgREST does."""
+        with pytest.raises(ValueError):
+            backend.table("domains").select("*").eq("nope", 1)
+
+    def test_concurrent_writes(self, backend):
+        """The backend should be usable from several threads at once."""
+        def write(worker):
+            for i in range(20):
+                backend.table("daily_logs").insert(log_row(idempotency_key=f"{worker}:{i}")).execute()
+
+        threads = [threading.Thread(target=write, args=(w,)) for w in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(backend.table("daily_logs").select("*").execute().data) == 80
+
+
+class TestClientOnSqlite:
+    """Tests for SupabaseClient running against the SQLite backend."""
+
+    def test_progress_round_trip(self, client):
+        """Progress upserts should show up on the embedded domain read."""
+        client.upsert_domain_progress([
+            {
+                "domain_id": "01.02",
+                "status": "surveying",
+                "books_read": 1,
+                "last_read": date(2024, 3, 1),
+            }
+        ])
+
+        domain = client.get_domain("01.02")
+        assert (domain["status"], domain["books_read"], domain["last_read"]) == (
+            "surveying", 1, "2024-03-01"
+        )
+        assert client.get_domain("01.03")["status"] == "untouched"
+
+    def test_stats_function(self, client):
+        """get_stats() should count like the SQL function."""
+        client.upsert_domain_progress([
+            {"domain_id": "01.02", "status": "surveyed"},
+            {"domain_id": "03.01", "status": "expert"},
+            {"domain_id": "03.02", "status": "untouched"},
+        ])
+        client.create_daily_logs([log_row(1), log_row(2), log_row(3)])
+
+        stats = client.get_stats()
+        assert stats["total_domains"] == len(DOMAINS)
+        assert stats["domains_touched"] == 2
+        assert (stats["domains_surveyed"], stats["domains_expert"]) == (1, 1)
+        assert (stats["total_daily_logs"], stats["branches_touched"]) == (3, 2)
+
+    def test_distances_match_bundled_table(self, client):
+        """Distances read from the seeded table should equal the bundled ones."""
+        for a in (1, 5, 15):
+            for b in range(1, 16):
+                assert client.get_branch_distance(a, b) == get_branch_distance(a, b)
+
+    def test_changed_rows_pages_by_watermark(self, client):
+        """Rows should come back in updated_at order, after the watermark only."""
+        client.create_daily_logs([log_row(day) for day in range(1, 6)])
+        rows = client.get_changed_rows("daily_logs", None, page_size=2)
+        assert [r["log_date"] for r in rows] == [f"2024-01-{d:02d}" for d in range(1, 6)]
+
+        later = client.get_changed_rows("daily_logs", rows[2]["updated_at"])
+        assert [r["log_date"] for r in later] == ["2024-01-04", "2024-01-05"]
+
+    def test_sync_against_sqlite(self, supabase_vault, client):
+        """Sync should run to a fixed point against a real SQL store."""
+        vault = supabase_vault
+        client.upsert_domain_progress(
+            [{"domain_id": "01.02", "status": "surveyed", "books_read": 2}]
+        )
+        client.create_daily_logs([log_row(5, pages_read=7)])
+
+        result = SyncEngine(vault, client).run()
+
+        assert (result.domains_pulled, result.logs_pulled) == (1, 1)
+        assert vault.load_domain_file("01.02").status == DomainStatus.SURVEYED
+        again = SyncEngine(vault, client).run()
+        assert (again.domains_pulled, again.domains_pushed) == (0, 0)
+        assert (again.logs_pulled, again.logs_pushed) == (0, 0)
+
+
+class TestBackendSelection:
+    """Tests for choosing a backend with PM_BACKEND."""
+
+    @pytest.fixture
+    def db_url(self, temp_dir, monkeypatch):
+        url = f"sqlite:{temp_dir / 'env' / 'polymath.db'}"
+        reset_supabase_client()
+        monkeypatch.setenv("PM_TESTING", "1")
+        monkeypatch.setenv("PM_BACKEND", url)
+        yield url
+        reset_supabase_client()
+
+    def test_unsupported_url(self):
+        """Only sqlite: URLs are supported."""
+        with pytest.raises(ValueError):
+            open_backend("postgres://localhost/polymath")
+
+    def test_env_selects_sqlite(self, db_url):
+        """PM_BACKEND should win over PM_TESTING's files-only mode."""
+        client = SupabaseClient()
+
+        assert client.is_available and client.connect()
+        assert isinstance(client._client, SqliteBackend)
+
+    def test_vault_writes_through(self, initialized_vault, db_url):
+        """The vault's outbox should deliver its writes to the backend."""
+        vault = Vault(initialized_vault.vault_path, replay_in_background=False)
+        assert vault.using_supabase
+
+        domain = vault.load_domain("01.02")
+        domain.status = DomainStatus.SURVEYING
+        vault.save_domain(domain)
+        note = vault.save_daily_log(DailyLog(
+            log_date=date(2024, 1, 2), domain_id="01.02", domain_name="Thermodynamics",
+            book_title="", function_slot="FND", pages_read=12,
+        ))
+
+        backend = open_backend(db_url)
+        progress = (
+            backend.table("domain_progress").select("*").eq("domain_id", "01.02").single().execute()
+        )
+        logs = backend.table("daily_logs").select("*").execute().data
+        assert progress.data["status"] == "surveying"
+        assert [(r["pages_read"], r["idempotency_key"]) for r in logs] == [
+            (12, vault.log_key(note))
+        ]
+        assert len(vault.outbox) == 0
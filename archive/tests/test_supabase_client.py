@@ -0,0 +1,294 @@
+"""Tests for SupabaseClient against the in-memory backend."""
+
+from datetime import date
+
+from pm.core import vault as vault_module
+from pm.core.book import Book
+from pm.core.cache import ResponseCache
+from pm.core.daily_log import DailyLog
+from pm.core.domain import Domain, DomainStatus
+from pm.core.supabase_client import SupabaseClient
+from pm.core.vault import Vault
+from pm.data.distances import get_branch_distance
+from tests.fake_supabase import log_row
+
+
+class TestDomainFetch:
+    """Tests for the joined domain + progress fetch."""
+
+    def test_get_all_domains_is_one_request(self, fake_supabase):
+        """All domains and their progress should come back in one round trip."""
+        fake_supabase.put("domain_progress", [
+            {
+                "domain_id": "01.02",
+                "status": "surveyed",
+                "books_read": 2,
+                "last_read": "2024-03-01",
+            },
+        ])
+        client = SupabaseClient(client=fake_supabase)
+
+        domains = {d["domain_id"]: d for d in client.get_all_domains()}
+
+        assert fake_supabase.requests == [("domains", "select")]
+        assert domains["01.02"]["status"] == "surveyed"
+        assert domains["01.02"]["books_read"] == 2
+        assert domains["01.02"]["last_read"] == "2024-03-01"
+        assert domains["01.01"]["status"] == "untouched"
+        assert "domain_progress" not in domains["01.01"]
+
+    def test_get_domain_is_one_request(self, fake_supabase):
+        """A single domain should be fetched with its progress in one round trip."""
+        fake_supabase.put("domain_progress", [
+            {"domain_id": "05.01", "status": "surveying", "books_read": 1, "last_read": None},
+        ])
+        client = SupabaseClient(client=fake_supabase)
+
+        domain = client.get_domain("05.01")
+
+        assert fake_supabase.requests == [("domains", "select")]
+        assert domain["status"] == "surveying"
+        assert domain["books_read"] == 1
+
+    def test_get_missing_domain(self, fake_supabase):
+        """Unknown domains should return None."""
+        assert SupabaseClient(client=fake_supabase).get_domain("99.99") is None
+
+    def test_vault_loads_through_client(self, temp_dir, fake_supabase, monkeypatch):
+        """Vault should build its snapshot from the single joined fetch."""
+        client = SupabaseClient(client=fake_supabase)
+        client.update_domain_progress("01.02", "surveying", 1)
+        fake_supabase.requests.clear()
+        monkeypatch.setattr(vault_module, "get_supabase_client", lambda: client)
+
+        vault = Vault(temp_dir)
+        assert vault.using_supabase
+        assert vault.load_domain("01.02").status == DomainStatus.SURVEYING
+        assert len(vault.load_all_domains()) == 180
+        assert fake_supabase.requests == [("domains", "select"), ("domains", "select")]
+
+
+class TestStats:
+    """Tests for the server-side stats aggregate."""
+
+    def test_get_stats_is_one_request(self, fake_supabase):
+        """Stats should come back aggregated from one function call."""
+        fake_supabase.put("domain_progress", [
+            {"domain_id": "01.02", "status": "surveyed", "books_read": 2, "last_read": None},
+            {"domain_id": "01.03", "status": "surveying", "books_read": 1, "last_read": None},
+            {"domain_id": "05.01", "status": "expert", "books_read": 9, "last_read": None},
+            {"domain_id": "06.01", "status": "untouched", "books_read": 0, "last_read": None},
+        ])
+        fake_supabase.put("books", [{"id": i} for i in range(5)])
+        fake_supabase.put("daily_logs", [{"id": i} for i in range(30)])
+        client = SupabaseClient(client=fake_supabase)
+
+        stats = client.get_stats()
+
+        assert fake_supabase.requests == [("get_stats", "rpc")]
+        assert stats["total_domains"] == 180
+        assert stats["domains_touched"] == 3
+        assert stats["domains_surveyed"] == 1
+        assert stats["domains_expert"] == 1
+        assert stats["branches_touched"] == 2
+        assert stats["total_books_read"] == 12
+        assert stats["total_daily_logs"] == 30
+
+    def test_vault_stats_come_from_the_function(self, supabase_vault, fake_supabase):
+        """The vault should take its counts from get_stats() alone."""
+        fake_supabase.put("domain_progress", [
+            {"domain_id": "01.02", "status": "surveyed", "books_read": 2, "last_read": None},
+            {"domain_id": "05.01", "status": "expert", "books_read": 9, "last_read": None},
+        ])
+        fake_supabase.put("daily_logs", [log_row(day) for day in range(1, 4)])
+
+        stats = supabase_vault.get_stats()
+
+        assert fake_supabase.requests == [("get_stats", "rpc")]
+        assert (stats.domains_touched, stats.domains_expert, stats.branches_touched) == (2, 1, 2)
+        assert (stats.total_books_read, stats.total_daily_logs) == (11, 3)
+
+    def test_vault_counts_logs_locally_without_table(self, supabase_vault, client, monkeypatch):
+        """A NULL log count (no daily_logs table) should fall back to the notes."""
+        supabase_vault.save_daily_log(DailyLog(
+            log_date=date(2024, 1, 2), domain_id="01.02", domain_name="Thermodynamics",
+            book_title="", function_slot="FND", pages_read=12,
+        ))
+        server_stats = client.get_stats
+        monkeypatch.setattr(
+            client, "get_stats", lambda: {**server_stats(), "total_daily_logs": None}
+        )
+
+        assert supabase_vault.get_stats().total_daily_logs == 1
+
+    def test_vault_counts_locally_while_progress_is_queued(self, supabase_vault, fake_supabase):
+        """Progress still in the outbox should be counted, not the stale server rows."""
+        domain = supabase_vault.load_domain("01.02")
+        domain.status = DomainStatus.SURVEYING
+        domain.books_read = 1
+        fake_supabase.failures = 1
+        supabase_vault.save_domain(domain)
+
+        stats = supabase_vault.get_stats()
+
+        assert len(supabase_vault.outbox) == 1
+        assert (stats.domains_surveying, stats.total_books_read) == (1, 1)
+
+
+class TestDistanceMatrix:
+    """Tests for the preloaded branch distance matrix."""
+
+    def test_lookups_share_one_request(self, fake_supabase):
+        """Every pair lookup should be answered from one table fetch."""
+        client = SupabaseClient(client=fake_supabase)
+
+        distances = {
+            (a, b): client.get_branch_distance(f"{a:02d}", f"{b:02d}")
+            for a in range(1, 16) for b in range(1, 16)
+        }
+
+        assert fake_supabase.requests == [("branch_distances", "select")]
+        assert all(d == get_branch_distance(a, b) for (a, b), d in distances.items())
+        assert client.get_branch_distance("xx", "01") == 4
+
+    def test_refetches_after_ttl(self, fake_supabase):
+        """The matrix should be refreshed once it expires."""
+        client = SupabaseClient(client=fake_supabase)
+        client.distance_ttl = 0
+        client.get_branch_distance("01", "02")
+        fake_supabase.put("branch_distances", [{"branch_a": "01", "branch_b": "02", "distance": 3}])
+
+        assert client.get_branch_distance("02", "01") == 3
+        assert fake_supabase.requests == [("branch_distances", "select")] * 2
+
+    def test_new_client_reuses_cached_table(self, fake_supabase):
+        """A later invocation should build the matrix from the response cache."""
+        cache = ResponseCache()
+        SupabaseClient(client=fake_supabase, cache=cache).get_distance_matrix()
+
+        client = SupabaseClient(client=fake_supabase, cache=cache)
+        assert client.get_branch_distance("01", "15") == 4
+        assert fake_supabase.requests == [("branch_distances", "select")]
+
+
+class TestCaching:
+    """Tests for cached reads and write invalidation."""
+
+    def test_reads_are_cached(self, fake_supabase):
+        """Repeated reads should be answered from the cache."""
+        client = SupabaseClient(client=fake_supabase, cache=ResponseCache())
+
+        first = client.get_all_domains()
+        assert client.get_all_domains() == first
+        client.get_stats()
+        client.get_stats()
+
+        assert fake_supabase.requests.count(("domains", "select")) == 1
+        assert fake_supabase.requests.count(("get_stats", "rpc")) == 1
+
+    def test_cache_survives_new_client(self, temp_dir, fake_supabase):
+        """A later invocation should reuse the on-disk cache."""
+        path = temp_dir / "cache.json"
+        SupabaseClient(client=fake_supabase, cache=ResponseCache(path)).get_all_domains()
+
+        SupabaseClient(client=fake_supabase, cache=ResponseCache(path)).get_all_domains()
+        assert fake_supabase.requests == [("domains", "select")]
+
+    def test_progress_write_invalidates_affected_keys(self, fake_supabase):
+        """Updating progress should refetch domains but keep unrelated entries."""
+        client = SupabaseClient(client=fake_supabase, cache=ResponseCache())
+        client.get_all_domains()
+        client.get_domain("01.01")
+        client.get_domain("01.02")
+        client.get_books()
+
+        client.update_domain_progress("01.02", "surveying", 1, date(2024, 1, 1))
+        fake_supabase.requests.clear()
+
+        assert {d["domain_id"]: d for d in client.get_all_domains()}["01.02"]["books_read"] == 1
+        assert client.get_domain("01.02")["status"] == "surveying"
+        client.get_domain("01.01")
+        client.get_books()
+        assert fake_supabase.requests == [("domains", "select"), ("domains", "select")]
+
+    def test_log_and_book_writes_invalidate(self, fake_supabase):
+        """New logs and books should drop the cached lists they appear in."""
+        client = SupabaseClient(client=fake_supabase, cache=ResponseCache())
+        assert client.get_daily_logs(days=7) == []
+        assert client.get_books("01.02") == []
+
+        client.create_daily_log({"log_date": date.today().isoformat(), "domain_id": "01.02"})
+        client.create_book({"title": "Entropy", "domain_id": "01.02", "created_at": "2024-01-01"})
+
+        assert len(client.get_daily_logs(days=7)) == 1
+        assert len(client.get_books("01.02")) == 1
+
+    def test_no_cache_bypasses_reads(self, fake_supabase):
+        """use_cache=False should always fetch, while refreshing the cache."""
+        cache = ResponseCache()
+        client = SupabaseClient(client=fake_supabase, cache=cache, use_cache=False)
+        client.get_all_domains()
+        client.get_all_domains()
+        assert fake_supabase.requests == [("domains", "select")] * 2
+
+        SupabaseClient(client=fake_supabase, cache=cache).get_all_domains()
+        assert len(fake_supabase.requests) == 2
+
+
+class TestBatchWrites:
+    """Tests for chunked bulk writes."""
+
+    def test_progress_upserts_are_chunked(self, fake_supabase):
+        """Rows should be sent chunk_size at a time, last row per domain winning."""
+        client = SupabaseClient(client=fake_supabase)
+        rows = [
+            {"domain_id": f"01.0{i}", "status": "surveying", "books_read": 1, "last_read": None}
+            for i in range(1, 6)
+        ]
+        rows.append(
+            {"domain_id": "01.01", "status": "surveyed", "books_read": 2, "last_read": None}
+        )
+
+        client.upsert_domain_progress(rows, chunk_size=2)
+
+        assert fake_supabase.requests == [("domain_progress", "upsert")] * 3
+        progress = {r["domain_id"]: r for r in fake_supabase.rows("domain_progress")}
+        assert len(progress) == 5
+        assert progress["01.01"]["status"] == "surveyed"
+
+    def test_logs_and_books_use_batch_size(self, fake_supabase):
+        """Bulk inserts should default to the client's batch size."""
+        client = SupabaseClient(client=fake_supabase, batch_size=3)
+
+        assert client.create_daily_logs([{"log_date": "2024-01-01"}] * 7) == 7
+        books = [{"title": f"B{i}", "domain_id": "01.02"} for i in range(3)]
+        assert client.create_books(books) == 3
+        assert fake_supabase.requests == [("daily_logs", "insert")] * 3 + [("books", "insert")]
+
+    def test_vault_batches_multi_record_writes(self, temp_dir, fake_supabase, monkeypatch):
+        """Vault bulk saves should send one request per chunk."""
+        client = SupabaseClient(client=fake_supabase, batch_size=100)
+        monkeypatch.setattr(vault_module, "get_supabase_client", lambda: client)
+        vault = Vault(temp_dir, replay_in_background=False)
+        vault.create_structure()
+
+        domains = [
+            Domain(
+                domain_id=d["domain_id"],
+                domain_name=d["name"],
+                branch_id=d["branch_id"],
+                branch_name="",
+            )
+            for d in fake_supabase.rows("domains")
+        ]
+        vault.save_domains(domains)
+        books = [
+            (Book(title=f"Book {i}", author="A", year=None, domain_id="01.02",
+                  domain_name="Thermodynamics", function_slot="FND"), "")
+            for i in range(3)
+        ]
+        vault.save_books(books)
+        vault.save_books(books)  # existing notes aren't re-created remotely
+
+        assert fake_supabase.requests == [("domain_progress", "upsert")] * 2 + [("books", "upsert")]
+        assert len(fake_supabase.rows("books")) == 3
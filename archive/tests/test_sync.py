@@ -0,0 +1,121 @@
+"""Tests for two-way vault/Supabase sync."""
+
+from datetime import date
+
+import frontmatter
+
+from pm.core.daily_log import DailyLog
+from pm.core.domain import DomainStatus
+from pm.core.sync import SyncEngine, merge_progress
+
+
+def _edit_domain(vault, domain_id, **fields):
+    """Edit a domain profile's frontmatter as Obsidian would."""
+    filepath = vault.domain_filepath(domain_id)
+    post = frontmatter.load(filepath)
+    post.metadata.update(fields)
+    filepath.write_text(frontmatter.dumps(post))
+
+
+def _remote_progress(fake_supabase, domain_id):
+    return next(r for r in fake_supabase.rows("domain_progress") if r["domain_id"] == domain_id)
+
+
+class TestMergeProgress:
+    """Tests for the domain conflict rule."""
+
+    def test_keeps_furthest_state(self):
+        """Each field should take the more advanced value."""
+        a = {"status": "deepening", "books_read": 3, "last_read": "2024-01-05"}
+        b = {"status": "surveyed", "books_read": 4, "last_read": "2024-02-01"}
+
+        assert merge_progress(a, b) == merge_progress(b, a) == {
+            "status": "deepening", "books_read": 4, "last_read": "2024-02-01",
+        }
+
+
+class TestSyncEngine:
+    """Tests for SyncEngine against the in-memory server."""
+
+    def test_pulls_and_pushes_domain_changes(self, supabase_vault, client, fake_supabase):
+        """Remote progress should reach the files and file edits the server."""
+        fake_supabase.table("domain_progress").insert(
+            {"domain_id": "01.02", "status": "surveyed", "books_read": 2, "last_read": "2024-03-01"}
+        ).execute()
+        _edit_domain(supabase_vault, "05.01", status="surveying", books_read=1)
+
+        result = SyncEngine(supabase_vault, client).run()
+
+        assert (result.domains_pulled, result.domains_pushed) == (1, 1)
+        meta = frontmatter.load(supabase_vault.domain_filepath("01.02")).metadata
+        assert meta["status"] == "surveyed" and meta["books_read"] == 2
+        assert _remote_progress(fake_supabase, "05.01")["books_read"] == 1
+
+    def test_second_sync_transfers_nothing(self, supabase_vault, client, fake_supabase):
+        """Echoes of a sync's own writes should not be transferred again."""
+        fake_supabase.table("domain_progress").insert(
+            {"domain_id": "01.02", "status": "surveyed", "books_read": 2, "last_read": None}
+        ).execute()
+        _edit_domain(supabase_vault, "05.01", status="surveying", books_read=1)
+        SyncEngine(supabase_vault, client).run()
+        fake_supabase.requests.clear()
+
+        result = SyncEngine(supabase_vault, client).run()
+
+        assert result == type(result)()
+        assert fake_supabase.requests == [("domain_progress", "select"), ("daily_logs", "select")]
+
+    def test_conflicting_progress_is_merged(self, supabase_vault, client, fake_supabase):
+        """A domain changed on both sides should end up merged on both."""
+        SyncEngine(supabase_vault, client).run()
+        _edit_domain(supabase_vault, "01.02", status="deepening", books_read=3)
+        fake_supabase.table("domain_progress").upsert(
+            {"domain_id": "01.02", "status": "surveyed", "books_read": 5, "last_read": "2024-04-01"}
+        ).execute()
+
+        result = SyncEngine(supabase_vault, client).run()
+
+        assert result.conflicts == 1
+        remote = _remote_progress(fake_supabase, "01.02")
+        local = supabase_vault.load_domain_file("01.02")
+        assert (remote["status"], remote["books_read"]) == ("deepening", 5)
+        assert (local.status, local.books_read) == (DomainStatus.DEEPENING, 5)
+        assert local.last_read == date(2024, 4, 1)
+
+    def test_pulls_web_logs_once(self, supabase_vault, client, fake_supabase):
+        """A row logged elsewhere should become a note linked to the row."""
+        fake_supabase.table("daily_logs").insert({
+            "log_date": "2024-05-01", "domain_id": "01.02", "function_slot": "FND",
+            "pages_read": 30, "reading_time_minutes": 45, "phase": "hub-completion",
+            "raw_notes": "Read chapter 1.",
+        }).execute()
+
+        assert SyncEngine(supabase_vault, client).run().logs_pulled == 1
+        row = fake_supabase.rows("daily_logs")[0]
+        note = supabase_vault.daily_logs_dir / f"2024-05-01-r{row['id']}.md"
+        log, content = supabase_vault.read_log_note(note)
+        assert (log.domain_name, log.pages_read) == ("Thermodynamics", 30)
+        assert content == "Read chapter 1."
+        assert row["idempotency_key"] == supabase_vault.log_key(note)
+
+        again = SyncEngine(supabase_vault, client).run()
+        assert (again.logs_pulled, again.logs_pushed) == (0, 0)
+        assert len(fake_supabase.rows("daily_logs")) == 1
+
+    def test_note_wins_log_conflict(self, supabase_vault, client, fake_supabase):
+        """A log changed on both sides should take the note's version."""
+        log = DailyLog(log_date=date(2024, 1, 1), domain_id="01.02", domain_name="Thermodynamics",
+                       book_title="Book", function_slot="FND", pages_read=10)
+        note = supabase_vault.save_daily_log(log, "First notes.")
+        SyncEngine(supabase_vault, client).run()
+
+        log.pages_read = 20
+        supabase_vault.write_log_notes([(note, log, "Edited in Obsidian.")])
+        fake_supabase.backend.table("daily_logs").update({"pages_read": 99}).execute()
+
+        result = SyncEngine(supabase_vault, client).run()
+
+        assert (result.conflicts, result.logs_pushed) == (1, 1)
+        row = fake_supabase.rows("daily_logs")[0]
+        assert (row["pages_read"], row["raw_notes"]) == (20, "Edited in Obsidian.")
+        assert len(fake_supabase.rows("daily_logs")) == 1
@@ -1,10 +1,18 @@
 """Tests for traversal engine."""
 
+import copy
+import random
+from dataclasses import replace
+from datetime import date, timedelta
+
 import pytest
 
 from pm.config import TraversalConfig
 from pm.core.domain import Domain, DomainStatus, FunctionSlot
-from pm.core.traversal import TraversalEngine, TraversalPhase
+from pm.core.planner import plan_reading
+from pm.core.traversal import DomainArrays, TraversalEngine, TraversalPhase
+from pm.data.distances import get_branch_distance
+from pm.data.domains import DOMAINS
 
 
 @pytest.fixture
@@ -166,3 +174,246 @@ class TestTraversalPhases:
                 d.books_read = engine.books_per_hub
 
         assert engine.check_hub_completion(sample_domains)
+
+
+def _reference_distant(engine, domains, recent_domain_ids):
+    """The per-pair loop _find_distant_domain replaced, as (domain_id, distance)."""
+    strength_branches = {d.branch_id for d in domains if d.is_expert or d.books_read >= 2}
+    if not strength_branches:
+        strength_branches = {"07"}
+    candidates = []
+    for d in domains:
+        if d.domain_id in recent_domain_ids:
+            continue
+        min_distance = min(get_branch_distance(d.branch_id, sb) for sb in strength_branches)
+        if min_distance >= engine.min_distant_distance:
+            bonus = 1 if d.status == DomainStatus.UNTOUCHED else 0
+            candidates.append((d, min_distance, bonus))
+    if not candidates:
+        return None
+    candidates.sort(key=lambda x: (-x[1], -x[2], x[0].domain_id))
+    return candidates[0][0].domain_id, candidates[0][1]
+
+
+def _random_domains(rng):
+    """The taxonomy with random progress, plus a domain in an unknown branch."""
+    statuses = list(DomainStatus)
+    domains = [
+        Domain(
+            domain_id=d["domain_id"],
+            domain_name=d["domain_name"],
+            branch_id=f"{d['branch_id']:02d}",
+            branch_name="",
+            is_hub=d.get("is_hub", False),
+            is_expert=rng.random() < 0.02,
+            books_read=rng.choice([0, 0, 0, 1, 2, 3]) if rng.random() < 0.3 else 0,
+            status=rng.choice(statuses),
+        )
+        for d in DOMAINS
+    ]
+    domains.append(Domain(domain_id="99.01", domain_name="Unknown", branch_id="99", branch_name=""))
+    rng.shuffle(domains)
+    return domains
+
+
+class TestBatchedDistantScoring:
+    """Tests that batched scoring matches the per-pair loop."""
+
+    @pytest.mark.parametrize("min_distance", [2, 3, 4])
+    def test_matches_reference_loop(self, min_distance):
+        """Random vault states should give the same pick as the old loop."""
+        rng = random.Random(min_distance)
+        engine = TraversalEngine(TraversalConfig(bisociation_min_distance=min_distance))
+
+        for _ in range(50):
+            domains = _random_domains(rng)
+            recent = [d.domain_id for d in rng.sample(domains, 20)]
+            rec = engine._find_distant_domain(domains, recent)
+            got = None if rec is None else (rec.domain.domain_id, rec.distance_from_strength)
+            assert got == _reference_distant(engine, domains, recent)
+
+    def test_reuses_arrays(self, traversal_config, sample_domains):
+        """Prebuilt columns should give the same recommendation."""
+        engine = TraversalEngine(traversal_config)
+        arrays = DomainArrays.from_domains(sample_domains)
+
+        rec = engine._find_distant_domain(sample_domains, [], arrays=arrays)
+
+        distant = engine._find_distant_domain(sample_domains, [])
+        assert rec.domain.domain_id == distant.domain.domain_id
+        assert list(arrays.order) == [1, 0, 3, 4, 2]
+
+
+class TestTopK:
+    """Tests for ranked recommendation slates."""
+
+    @pytest.mark.parametrize("phase", list(TraversalPhase))
+    def test_first_matches_recommend_next(self, phase):
+        """The top result should be recommend_next's pick on every day."""
+        rng = random.Random(phase.value)
+        engine = TraversalEngine(TraversalConfig())
+        engine.set_phase(phase)
+
+        for _ in range(20):
+            domains = _random_domains(rng)
+            recent = [d.domain_id for d in rng.sample(domains, 20)]
+            for week_day in range(7):
+                rec = engine.recommend_next(domains, recent, week_day)
+                top = engine.recommend_top_k(domains, recent, k=1, week_day=week_day)
+
+                expected = [] if rec is None else [rec.domain.domain_id]
+                assert [r.domain.domain_id for r in top] == expected
+                if rec is not None:
+                    assert (top[0].reason, top[0].priority) == (rec.reason, rec.priority)
+
+    def test_ranked_slate(self, traversal_config, sample_domains):
+        """Hubs closest to completion come first, then distant domains."""
+        engine = TraversalEngine(traversal_config)
+
+        top = engine.recommend_top_k(sample_domains, [], k=10, week_day=0)
+
+        assert [(r.domain.domain_id, r.score) for r in top[:2]] == [("02.04", 2), ("01.02", 0)]
+        assert [r.phase for r in top[:2]] == [TraversalPhase.HUB_COMPLETION] * 2
+        assert top[2:] and all(r.is_distant_interleave for r in top[2:])
+        assert [r.score for r in top[2:]] == sorted((r.score for r in top[2:]), reverse=True)
+        assert len({r.domain.domain_id for r in top}) == len(top)
+
+    def test_k_larger_than_candidates(self, traversal_config, sample_domains):
+        """Asking for more than exist should return every candidate once."""
+        engine = TraversalEngine(traversal_config)
+        recent = [d.domain_id for d in sample_domains]
+
+        assert engine.recommend_top_k(sample_domains, recent, k=10) == []
+        assert engine.recommend_top_k(sample_domains, [], k=0) == []
+        assert len(engine.recommend_top_k(sample_domains, [], k=100)) <= len(sample_domains)
+
+    def test_diverse_branches(self):
+        """With diversity on, no two results should share a branch."""
+        rng = random.Random(7)
+        engine = TraversalEngine(TraversalConfig())
+        domains = _random_domains(rng)
+
+        ranked = engine.recommend_top_k(domains, [], k=8)
+        top = engine.recommend_top_k(domains, [], k=8, diverse=True)
+        branches = [r.domain.branch_id for r in top]
+
+        assert len({r.domain.branch_id for r in ranked}) < len(ranked)
+        assert len(set(branches)) == len(branches)
+        assert set(branches) == {r.domain.branch_id for r in ranked}
+        assert top[0].domain.domain_id == engine.recommend_next(domains, []).domain.domain_id
+
+
+PLAN_START = date(2026, 1, 5)  # A Monday
+
+
+def _reload_plan(engine, domains, recent_reads, start, days):
+    """Plan by rebuilding every domain and the cooldown window each day."""
+    engine = copy.copy(engine)
+    reads = sorted(recent_reads)
+    plan = []
+    for offset in range(days):
+        today = start + timedelta(days=offset)
+        state = [replace(d) for d in domains]
+        by_id = {d.domain_id: d for d in state}
+        for read_on, domain_id in reads:
+            if read_on >= start:
+                by_id[domain_id].record_session(read_on)
+        cutoff = today - timedelta(days=engine.cooldown_days)
+        recent = [domain_id for read_on, domain_id in reads if read_on >= cutoff]
+        if engine.check_hub_completion(state):
+            engine.set_phase(TraversalPhase.BISOCIATION)
+
+        rec = engine.recommend_next(state, recent, today.weekday())
+        if rec is not None:
+            reads.append((today, rec.domain.domain_id))
+            plan.append((today, rec.domain.domain_id, rec.slot))
+    return plan
+
+
+class TestPlanReading:
+    """Tests for simulating the engine forward."""
+
+    @pytest.mark.parametrize("phase", list(TraversalPhase))
+    def test_matches_reloading_each_day(self, phase):
+        """Incremental updates should give the same plan as reloading state."""
+        rng = random.Random(phase.value)
+        engine = TraversalEngine(TraversalConfig(bisociation_min_distance=2))
+        engine.set_phase(phase)
+        domains = _random_domains(rng)
+        recent = [
+            (PLAN_START - timedelta(days=i + 1), d.domain_id)
+            for i, d in enumerate(domains[:10])
+        ]
+
+        plan = plan_reading(engine, domains, recent, PLAN_START, 60)
+
+        assert [(p.read_on, p.domain_id, p.slot) for p in plan] == _reload_plan(
+            engine, domains, recent, PLAN_START, 60
+        )
+
+    def test_long_horizon_moves_past_hubs(self):
+        """A year on a fresh vault should keep planning after the hubs are done."""
+        engine = TraversalEngine(TraversalConfig())
+        domains = [
+            Domain(
+                domain_id=d["domain_id"],
+                domain_name=d["domain_name"],
+                branch_id=f"{d['branch_id']:02d}",
+                branch_name=d["branch_name"],
+                is_hub=d.get("is_hub", False),
+                is_expert=d.get("is_expert", False),
+            )
+            for d in DOMAINS
+        ]
+
+        plan = plan_reading(engine, domains, [], PLAN_START, 365)
+
+        hub_reads = [p for p in plan if p.phase == TraversalPhase.HUB_COMPLETION.value]
+        later = [p for p in plan if p.day > hub_reads[-1].day]
+        assert len(hub_reads) == 28
+        assert later and {p.phase for p in later} == {TraversalPhase.BISOCIATION.value}
+        assert plan[-1].day > 330
+        assert engine.current_phase == TraversalPhase.HUB_COMPLETION
+
+    def test_does_not_modify_domains(self, traversal_config, sample_domains):
+        """The vault's domain objects should be left as they were."""
+        engine = TraversalEngine(traversal_config)
+        before = [replace(d) for d in sample_domains]
+
+        plan = plan_reading(engine, sample_domains, [], PLAN_START, 30)
+
+        assert plan
+        assert sample_domains == before
+
+    def test_progress_accumulates(self, traversal_config, sample_domains):
+        """Repeated reads of a hub should advance its count, slot and status."""
+        engine = TraversalEngine(TraversalConfig(hub_target_books=4, max_domain_repeat_window=1))
+
+        plan = plan_reading(engine, sample_domains, [], PLAN_START, 14)
+        hub_phase = [p for p in plan if p.phase == TraversalPhase.HUB_COMPLETION.value]
+        thermo = [p for p in hub_phase if p.domain_id == "01.02"]
+
+        assert [p.books_read for p in thermo] == [1, 2, 3, 4]
+        assert [p.slot for p in thermo] == ["FND", "HRS", "ORT", "FRN"]
+        assert all(p.domain_id != "03.09" for p in hub_phase if not p.is_distant_interleave)
+
+    def test_respects_seeded_cooldown(self, traversal_config, sample_domains):
+        """Reads already logged should keep a domain off the plan for the window."""
+        engine = TraversalEngine(traversal_config)
+        recent = [(PLAN_START - timedelta(days=1), "02.04")]
+
+        plan = plan_reading(engine, sample_domains, recent, PLAN_START, 14)
+        evo_days = [p.day for p in plan if p.domain_id == "02.04"]
+
+        assert min(evo_days) == 8  # Read the day before the plan, so on cooldown days 1-7
+        assert plan[0].domain_id == "01.02"
+
+    def test_weekly_distant_day(self, traversal_config, sample_domains):
+        """Sundays should be distant interleave days in hub completion."""
+        engine = TraversalEngine(traversal_config)
+
+        plan = plan_reading(engine, sample_domains, [], PLAN_START, 14)
+
+        for p in plan:
+            assert p.is_distant_interleave == (p.read_on.weekday() == 6 or p.domain_id == "15.01")
+        assert plan[0].to_dict()["date"] == "2026-01-05"
@@ -0,0 +1,274 @@
+"""Tests for vault loading paths."""
+
+from datetime import date, timedelta
+
+import pytest
+
+from pm.core import index as index_module
+from pm.core import vault as vault_module
+from pm.core.book import Book
+from pm.core.daily_log import DailyLog
+from pm.core.index import INDEX_FILENAME
+from pm.core.vault import Vault
+
+
+def _write_logs(vault, days_back):
+    """Write one daily log per day offset from today."""
+    today = date.today()
+    for offset in days_back:
+        vault.save_daily_log(
+            DailyLog(
+                log_date=today - timedelta(days=offset),
+                domain_id="01.02",
+                domain_name="Thermodynamics",
+                book_title=f"Book {offset}",
+                function_slot="FND",
+            )
+        )
+
+
+class TestPaths:
+    """Tests for the precomputed domain path table."""
+
+    def test_domain_filepath(self, vault):
+        """Known domains resolve into their branch folder."""
+        assert vault.domain_filepath("01.02") == (
+            vault.domains_dir / "01-Physical-Sciences" / "01.02-Thermodynamics.md"
+        )
+
+    def test_unknown_domain_and_branch(self, vault):
+        """Unknown IDs fall back to the bare ID and an Unknown folder."""
+        assert vault.domain_filepath("01.99") == (
+            vault.domains_dir / "01-Physical-Sciences" / "01.99.md"
+        )
+        assert vault.branch_dir("42") == vault.domains_dir / "42-Unknown"
+        assert vault.branch_dir(7) == vault.domains_dir / "07-Engineering"
+
+    def test_profiles_link_to_their_branch_folder(self, initialized_vault):
+        """Generated profiles should link to the folder they were written to."""
+        content = initialized_vault.domain_filepath("01.02").read_text()
+        assert "[[02-Domains/01-Physical-Sciences/_Branch-Overview|" in content
+
+
+class TestIterLogs:
+    """Tests for filename-driven log range queries."""
+
+    def test_range_is_inclusive_and_ordered(self, initialized_vault):
+        """Should yield logs within [since, until] in ascending order."""
+        _write_logs(initialized_vault, range(10))
+        today = date.today()
+
+        logs = list(
+            initialized_vault.iter_logs(today - timedelta(days=5), today - timedelta(days=2))
+        )
+
+        assert [log.log_date for log in logs] == [
+            today - timedelta(days=d) for d in (5, 4, 3, 2)
+        ]
+
+    def test_open_ended_ranges(self, initialized_vault):
+        """Missing bounds should extend to the first/last log."""
+        _write_logs(initialized_vault, range(6))
+        today = date.today()
+
+        assert len(list(initialized_vault.iter_logs())) == 6
+        assert len(list(initialized_vault.iter_logs(since=today - timedelta(days=1)))) == 2
+        assert len(list(initialized_vault.iter_logs(until=today - timedelta(days=4)))) == 2
+
+    def test_only_parses_files_in_range(self, initialized_vault, parse_counter):
+        """Files outside the window should never be parsed."""
+        _write_logs(initialized_vault, range(100))
+        initialized_vault.index.conn.execute("DELETE FROM files WHERE kind = 'log'")
+
+        logs = initialized_vault.load_recent_logs(days=7)
+
+        assert len(logs) == 8
+        assert len(parse_counter) == 8
+        assert logs[0].log_date == date.today()
+
+    def test_ignores_non_log_files(self, initialized_vault):
+        """Files not named by ISO date should be skipped."""
+        _write_logs(initialized_vault, [0])
+        (initialized_vault.daily_logs_dir / "notes.md").write_text("---\ndate: 2020-01-01\n---\n")
+
+        assert initialized_vault.list_log_filenames() == [f"{date.today().isoformat()}.md"]
+
+
+class TestParallelLoad:
+    """Tests for parsing index misses in a pool."""
+
+    @pytest.mark.parametrize("use_processes", [False, True])
+    def test_matches_serial_order(self, initialized_vault, monkeypatch, use_processes):
+        """A cold parallel load should return the same results as a serial one."""
+        _write_logs(initialized_vault, range(40))
+        serial_logs = list(initialized_vault.iter_logs())
+        serial_domains = initialized_vault.load_all_domains()
+
+        monkeypatch.setattr(index_module, "PARALLEL_MIN_FILES", 1)
+        (initialized_vault.system_dir / INDEX_FILENAME).unlink()
+        parallel = Vault(
+            initialized_vault.vault_path, workers=2, use_processes=use_processes
+        )
+
+        assert list(parallel.iter_logs()) == serial_logs
+        assert parallel.load_all_domains() == serial_domains
+
+    def test_parallel_results_are_indexed(self, initialized_vault, monkeypatch, parse_counter):
+        """Files parsed in the pool should be answered from the index next time."""
+        _write_logs(initialized_vault, range(10))
+        monkeypatch.setattr(index_module, "PARALLEL_MIN_FILES", 1)
+        (initialized_vault.system_dir / INDEX_FILENAME).unlink()
+        parallel = Vault(initialized_vault.vault_path, workers=2, use_processes=False)
+
+        list(parallel.iter_logs())
+        parsed = len(parse_counter)
+        list(parallel.iter_logs())
+        assert parsed == 10
+        assert len(parse_counter) == parsed
+
+
+class TestStreak:
+    """Tests for listing-based streak calculation."""
+
+    def test_streak_from_listing(self, initialized_vault):
+        """Should count consecutive days from log filenames."""
+        _write_logs(initialized_vault, [0, 1, 2, 4])
+        assert initialized_vault.calculate_streak() == 3
+
+    def test_stats_include_momentum(self, initialized_vault):
+        """get_stats should report streak and momentum together."""
+        _write_logs(initialized_vault, range(10))
+        stats = initialized_vault.get_stats()
+
+        assert stats.total_daily_logs == 10
+        assert stats.current_streak == 10
+        assert stats.weekly_average == 2.5
+        assert stats.momentum_trend == "accelerating"
+
+
+class TestSnapshot:
+    """Tests for the shared domain snapshot."""
+
+    def test_reads_share_one_load(self, initialized_vault, monkeypatch):
+        """Stats, hub and expert queries should load domains once."""
+        loads = []
+        original = initialized_vault._load_domains
+
+        def counting_load():
+            loads.append(1)
+            return original()
+
+        monkeypatch.setattr(initialized_vault, "_load_domains", counting_load)
+
+        initialized_vault.get_stats()
+        initialized_vault.load_all_domains()
+        hubs = initialized_vault.get_hub_domains()
+        initialized_vault.get_expert_domains()
+
+        assert len(loads) == 1
+        assert len(hubs) == 7
+
+    def test_buckets(self, initialized_vault):
+        """Snapshot views should partition the domain set."""
+        snapshot = initialized_vault.snapshot()
+
+        assert sum(len(ds) for ds in snapshot.by_status.values()) == len(snapshot.domains)
+        assert sum(len(ds) for ds in snapshot.by_branch.values()) == len(snapshot.domains)
+        assert sorted(snapshot.by_branch) == [str(i).zfill(2) for i in range(1, 16)]
+        assert snapshot.by_id["01.02"].is_hub
+
+    def test_save_domain_invalidates(self, initialized_vault):
+        """Writing a domain should drop the snapshot."""
+        before = initialized_vault.snapshot()
+        domain = initialized_vault.load_domain("01.02")
+        domain.books_read = 2
+        initialized_vault.save_domain(domain)
+
+        after = initialized_vault.snapshot()
+        assert after is not before
+        assert after.by_id["01.02"].books_read == 2
+
+
+class TestBookIndex:
+    """Tests for indexed book lookups."""
+
+    @staticmethod
+    def _book(title, author, domain_id="01.02", slot="FND"):
+        """Build a book for the given fields."""
+        return Book(
+            title=title,
+            author=author,
+            year=2000,
+            domain_id=domain_id,
+            domain_name="Domain",
+            function_slot=slot,
+        )
+
+    def test_lookup_by_author_title_domain_and_slot(self, initialized_vault):
+        """Saved books should be found by each indexed key."""
+        initialized_vault.save_book(self._book("Entropy", "Ben-Naim"))
+        initialized_vault.save_book(self._book("Heat", "Atkins", slot="HRS"))
+        initialized_vault.save_book(self._book("Games", "Binmore", domain_id="03.09"))
+
+        assert initialized_vault.load_book("Atkins", "Heat").function_slot == "HRS"
+        assert initialized_vault.load_book("Atkins", "Missing") is None
+        assert len(initialized_vault.list_books()) == 3
+        assert len(initialized_vault.list_books(domain_id="01.02")) == 2
+        assert [b.title for b in initialized_vault.list_books(function_slot="HRS")] == ["Heat"]
+
+    def test_lookup_does_not_scan(self, initialized_vault, parse_counter):
+        """Lookups after a save should not parse other book notes."""
+        for i in range(20):
+            initialized_vault.save_book(self._book(f"Title {i}", f"Author {i}"))
+        parse_counter.clear()
+
+        assert initialized_vault.load_book("Author 7", "Title 7") is not None
+        assert parse_counter == []
+
+    def test_picks_up_external_changes(self, initialized_vault):
+        """Notes added or deleted outside pm should be reflected."""
+        path = initialized_vault.save_book(self._book("Entropy", "Ben-Naim"))
+        assert len(initialized_vault.list_books()) == 1
+
+        (initialized_vault.books_dir / "Other.md").write_text(
+            '---\ntitle: "Other"\nauthor: "Someone"\ndomain_id: "15.01"\n---\n'
+        )
+        path.unlink()
+
+        assert [b.title for b in initialized_vault.list_books()] == ["Other"]
+        assert initialized_vault.load_book("Ben-Naim", "Entropy") is None
+
+    def test_picks_up_in_place_edits(self, initialized_vault):
+        """A note edited without touching the directory should be seen next run."""
+        path = initialized_vault.save_book(self._book("Entropy", "Ben-Naim"))
+        assert initialized_vault.load_book("Ben-Naim", "Entropy") is not None
+
+        path.write_text(path.read_text().replace("Entropy", "Entropy Demystified"))
+        vault = Vault(initialized_vault.vault_path)
+
+        assert vault.load_book("Ben-Naim", "Entropy Demystified").title == "Entropy Demystified"
+        assert vault.load_book("Ben-Naim", "Entropy") is None
+        assert [b.title for b in vault.list_books(domain_id="01.02")] == ["Entropy Demystified"]
+
+    def test_refresh_books_sees_edits_in_the_same_run(self, initialized_vault):
+        """refresh_books() should re-check notes edited during a run."""
+        path = initialized_vault.save_book(self._book("Entropy", "Ben-Naim"))
+        assert initialized_vault.load_book("Ben-Naim", "Entropy") is not None
+
+        path.write_text(path.read_text().replace("Entropy", "Entropy Demystified"))
+        initialized_vault.refresh_books()
+
+        assert initialized_vault.load_book("Ben-Naim", "Entropy Demystified") is not None
+
+    def test_repeat_lookups_skip_directory_scan(self, initialized_vault, monkeypatch):
+        """Only the first lookup in a run should scan the books directory."""
+        initialized_vault.save_book(self._book("Entropy", "Ben-Naim"))
+        vault = Vault(initialized_vault.vault_path)
+        scans = []
+        scandir = vault_module.os.scandir
+        monkeypatch.setattr(vault_module.os, "scandir", lambda p: scans.append(p) or scandir(p))
+
+        for _ in range(3):
+            assert vault.load_book("Ben-Naim", "Entropy") is not None
+
+        assert scans == [vault.books_dir]
@@ -0,0 +1,45 @@
+-- Aggregate stats for the CLI (SupabaseClient.get_stats) in one call.
+-- Replaces fetching every domain_progress row plus the books and
+-- daily_logs id columns and counting them client-side; the response is
+-- a single JSON object regardless of history size.
+--
+-- total_books_read sums domain_progress.books_read, as the CLI's
+-- file-based stats do.
+--
+-- plpgsql with dynamic SQL for daily_logs: 20250106_ux_redesign dropped
+-- it, and only databases still used by the CLI have it, so the function
+-- must create (and run) without it. A missing table gives NULL, not 0,
+-- so the CLI knows to count its own daily notes instead.
+
+CREATE OR REPLACE FUNCTION polymath.get_stats()
+RETURNS JSON
+LANGUAGE plpgsql
+STABLE
+AS $$
+DECLARE
+  total_logs BIGINT;
+  result JSON;
+BEGIN
+  IF to_regclass('polymath.daily_logs') IS NOT NULL THEN
+    EXECUTE 'SELECT count(*) FROM polymath.daily_logs' INTO total_logs;
+  END IF;
+
+  SELECT json_build_object(
+    'total_domains', (SELECT count(*) FROM polymath.domains),
+    'domains_touched', count(*) FILTER (WHERE p.status <> 'untouched'),
+    'domains_surveying', count(*) FILTER (WHERE p.status = 'surveying'),
+    'domains_surveyed', count(*) FILTER (WHERE p.status = 'surveyed'),
+    'domains_deepening', count(*) FILTER (WHERE p.status = 'deepening'),
+    'domains_expert', count(*) FILTER (WHERE p.status = 'expert'),
+    'total_books_read', coalesce(sum(p.books_read), 0),
+    'total_daily_logs', total_logs,
+    'branches_touched', count(DISTINCT split_part(p.domain_id, '.', 1))
+      FILTER (WHERE p.status <> 'untouched')
+  )
+  INTO result
+  FROM polymath.domain_progress p;
+  RETURN result;
+END;
+$$;
+
+GRANT EXECUTE ON FUNCTION polymath.get_stats() TO anon, authenticated;
@@ -0,0 +1,20 @@
+-- Idempotency keys for writes replayed from the CLI outbox
+-- (archive/pm/core/outbox.py). The CLI sends daily_logs and books rows as
+-- upserts on idempotency_key, so a batch re-sent after a lost
+-- acknowledgement doesn't insert the rows twice.
+-- Guarded: these tables only exist on databases still used by the CLI.
+
+DO $$
+BEGIN
+  IF to_regclass('polymath.daily_logs') IS NOT NULL THEN
+    ALTER TABLE polymath.daily_logs ADD COLUMN IF NOT EXISTS idempotency_key TEXT;
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_daily_logs_idempotency_key
+      ON polymath.daily_logs(idempotency_key);
+  END IF;
+
+  IF to_regclass('polymath.books') IS NOT NULL THEN
+    ALTER TABLE polymath.books ADD COLUMN IF NOT EXISTS idempotency_key TEXT;
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_books_idempotency_key
+      ON polymath.books(idempotency_key);
+  END IF;
+END $$;
@@ -0,0 +1,33 @@
+-- updated_at watermarks for `pm sync` (archive/pm/core/sync.py).
+-- The CLI asks for rows with updated_at after the last value it saw, so
+-- every write must bump the column; a trigger does that whatever the
+-- client sends. Guarded: daily_logs only exists on databases still used
+-- by the CLI.
+
+CREATE OR REPLACE FUNCTION polymath.touch_updated_at()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+  NEW.updated_at := clock_timestamp();
+  RETURN NEW;
+END;
+$$;
+
+DO $$
+DECLARE
+  t TEXT;
+BEGIN
+  FOREACH t IN ARRAY ARRAY['domain_progress', 'daily_logs'] LOOP
+    IF to_regclass('polymath.' || t) IS NOT NULL THEN
+      EXECUTE format(
+        'ALTER TABLE polymath.%I ADD COLUMN IF NOT EXISTS updated_at TIMESTAMPTZ NOT NULL DEFAULT clock_timestamp()', t);
+      EXECUTE format(
+        'CREATE INDEX IF NOT EXISTS idx_%s_updated_at ON polymath.%I(updated_at)', t, t);
+      EXECUTE format('DROP TRIGGER IF EXISTS trg_%s_updated_at ON polymath.%I', t, t);
+      EXECUTE format(
+        'CREATE TRIGGER trg_%s_updated_at BEFORE INSERT OR UPDATE ON polymath.%I '
+        'FOR EACH ROW EXECUTE FUNCTION polymath.touch_updated_at()', t, t);
+    END IF;
+  END LOOP;
+END $$;